@@ -5,3 +5,7 @@ heat/cold stress metrics, and thermophysiological responses using multiple model
 """
 
 __version__: str = "3.9.1"
+
+from pythermalcomfort.warmup import _apply_cache_dir
+
+_apply_cache_dir()
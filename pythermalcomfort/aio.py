@@ -0,0 +1,272 @@
+"""Call the models from asyncio code without blocking the event loop.
+
+:py:class:`MicroBatcher` collects the calls of a model made by concurrent
+coroutines during a short time window and computes them with a single
+vectorised call in an executor, so the throughput increases with the number of
+concurrent requests instead of degrading. :py:func:`run_in_executor` runs any
+other blocking call, e.g. :py:meth:`pythermalcomfort.models.JOS3.simulate`, in
+an executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import numbers
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+import numpy as np
+
+
+async def run_in_executor(
+    func: Callable[..., Any],
+    *args: Any,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Run a blocking function in an executor and wait for its result.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call, e.g. a model or the ``simulate`` method of a
+        :py:class:`~pythermalcomfort.models.JOS3` instance.
+    *args, **kwargs
+        Arguments of `func`.
+    executor : concurrent.futures.Executor, optional
+        Executor running `func`. Defaults to the default executor of the event
+        loop, a thread pool. A process pool requires `func` and its arguments to
+        be picklable.
+
+    Returns
+    -------
+    any
+        The value returned by `func`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.aio import run_in_executor
+        from pythermalcomfort.models import JOS3
+
+        model = JOS3()
+        await run_in_executor(model.simulate, times=60, dtime=60)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+def _is_batched(value: Any) -> bool:
+    """Return True for the numeric inputs, which are concatenated in a batch."""
+    if isinstance(value, bool | np.bool_):
+        return False
+    if isinstance(value, numbers.Number):
+        return True
+    return isinstance(value, list | tuple | np.ndarray) and (
+        np.asarray(value).dtype.kind in "iuf"
+    )
+
+
+def _call_batch(
+    model: Callable[..., Any],
+    constants: dict[str, Any],
+    columns: dict[str, np.ndarray],
+) -> Any:
+    return model(**constants, **columns)
+
+
+@dataclass
+class _Request:
+    """The numeric inputs of a call, broadcast to the same shape, and its future."""
+
+    inputs: dict[str, np.ndarray]
+    shape: tuple[int, ...]
+    future: asyncio.Future
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = int(np.prod(self.shape))
+
+
+def _split(result: Any, requests: list[_Request]) -> list[Any]:
+    """Split the result of a batch in the results of each request."""
+    n_rows = sum(request.size for request in requests)
+    values = {}
+    for f in fields(result):
+        value = getattr(result, f.name)
+        array = np.asarray(value) if value is not None else None
+        # outputs with one value per row are split, the others are shared
+        values[f.name] = (
+            array if array is not None and array.ndim and len(array) == n_rows else None
+        )
+
+    results = []
+    start = 0
+    for request in requests:
+        stop = start + request.size
+        kwargs = {}
+        for f in fields(result):
+            array = values[f.name]
+            if array is None:
+                kwargs[f.name] = getattr(result, f.name)
+                continue
+            part = array[start:stop].reshape(request.shape + array.shape[1:])
+            kwargs[f.name] = part[()] if request.shape == () else part
+        results.append(type(result)(**kwargs))
+        start = stop
+    return results
+
+
+class MicroBatcher:
+    """Compute concurrent calls of a model in vectorised batches.
+
+    Awaiting the batcher with the inputs of the model returns the same result as
+    calling the model. The calls with the same non-numeric arguments, e.g.
+    `units` or `limit_inputs`, that arrive within `max_delay` seconds of each
+    other are concatenated and computed with a single call of the model in
+    `executor`, so the event loop is never blocked and the validation and the
+    compiled kernels run once per batch. If a batch fails, its calls are
+    computed one by one so that only the invalid ones raise.
+
+    Parameters
+    ----------
+    model : callable
+        A vectorised model, e.g. :py:func:`~pythermalcomfort.models.pmv_ppd_iso`.
+        Models whose rows depend on the previous ones, such as
+        `two_nodes_gagge_sleep`, cannot be batched.
+    max_delay : float, optional
+        Maximum time, [s], a call waits for other calls before its batch is
+        computed. Defaults to 0.002.
+    max_batch_size : int, optional
+        Number of rows that triggers the computation of a batch without waiting.
+        Defaults to 65536.
+    executor : concurrent.futures.Executor, optional
+        Executor computing the batches. Defaults to the default executor of the
+        event loop, a thread pool.
+
+    Attributes
+    ----------
+    batches : int
+        Number of batches computed so far.
+    rows : int
+        Number of rows in those batches.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import asyncio
+
+        from pythermalcomfort.aio import MicroBatcher
+        from pythermalcomfort.models import pmv_ppd_ashrae
+
+        pmv = MicroBatcher(pmv_ppd_ashrae)
+
+
+        async def handler(request):
+            result = await pmv(tdb=request.tdb, tr=25, vr=0.1, rh=50, met=1.2, clo=0.5)
+            return result.pmv
+
+
+        # the 100 calls are computed in one batch
+        results = await asyncio.gather(*(handler(r) for r in requests))
+    """
+
+    def __init__(
+        self,
+        model: Callable[..., Any],
+        max_delay: float = 0.002,
+        max_batch_size: int = 65_536,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be greater than 0")
+        self.model = model
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self._pending: dict[Hashable, list[_Request]] = {}
+        self._sizes: dict[Hashable, int] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.rows = 0
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        """Compute the model for one set of inputs, as part of a batch."""
+        constants = {name: v for name, v in kwargs.items() if not _is_batched(v)}
+        try:
+            key = (frozenset(kwargs), tuple(sorted(constants.items())))
+            hash(key)
+        except TypeError:
+            # unhashable arguments cannot be grouped, the call is computed alone
+            return await run_in_executor(self.model, executor=self.executor, **kwargs)
+
+        inputs = {
+            name: np.asarray(v) for name, v in kwargs.items() if name not in constants
+        }
+        try:
+            shape = np.broadcast_shapes(*(v.shape for v in inputs.values()))
+        except ValueError:
+            return await run_in_executor(self.model, executor=self.executor, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        request = _Request(inputs, shape, loop.create_future())
+        self._pending.setdefault(key, []).append(request)
+        self._sizes[key] = self._sizes.get(key, 0) + request.size
+        if self._sizes[key] >= self.max_batch_size:
+            self._flush(key, constants)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(
+                self.max_delay, self._flush, key, constants
+            )
+        return await request.future
+
+    def _flush(self, key: Hashable, constants: dict[str, Any]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        requests = self._pending.pop(key, [])
+        self._sizes.pop(key, None)
+        if requests:
+            self.batches += 1
+            self.rows += sum(request.size for request in requests)
+            task = asyncio.ensure_future(self._compute(requests, constants))
+            # keep a reference, the event loop only holds weak ones
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _compute(
+        self, requests: list[_Request], constants: dict[str, Any]
+    ) -> None:
+        names = list(requests[0].inputs)
+        columns = {
+            name: np.concatenate(
+                [np.broadcast_to(r.inputs[name], r.shape).ravel() for r in requests]
+            )
+            for name in names
+        }
+        try:
+            result = await run_in_executor(
+                _call_batch, self.model, constants, columns, executor=self.executor
+            )
+            results = _split(result, requests)
+        except Exception as e:
+            if len(requests) == 1:
+                if not requests[0].future.done():
+                    requests[0].future.set_exception(e)
+                return
+            # compute each call alone, so only the invalid ones raise
+            await asyncio.gather(*(self._compute([r], constants) for r in requests))
+            return
+        for request, value in zip(requests, results, strict=True):
+            if not request.future.done():
+                request.future.set_result(value)
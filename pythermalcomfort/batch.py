@@ -0,0 +1,1410 @@
+"""Evaluate several models over the same table of inputs in one pass."""
+
+from __future__ import annotations
+
+import copy
+import csv
+import itertools
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, TextIO
+
+import numpy as np
+
+from pythermalcomfort import models
+from pythermalcomfort.classes_input import PHSInputs
+from pythermalcomfort.utilities import (
+    Conditions,
+    Models,
+    Units,
+    clo_dynamic_ashrae,
+    clo_dynamic_iso,
+    met_to_w_m2,
+    units_converter,
+    v_relative,
+)
+
+# columns that are converted from IP to SI units before running the models
+_TEMPERATURES = ("tdb", "tr", "t_running_mean", "t_out", "twb", "tg")
+_SPEEDS = ("v", "vr")
+# columns read from text files as floats, with nan for the values that are not numbers
+_NUMERIC = (
+    *_TEMPERATURES,
+    *_SPEEDS,
+    "rh",
+    "met",
+    "clo",
+    "clo_dynamic",
+    "wme",
+    "body_surface_area",
+    "p_atm",
+    "q",
+    "sol_radiation_global",
+)
+
+
+@dataclass(frozen=True)
+class _Index:
+    """A model evaluated by :py:func:`evaluate`.
+
+    ``inputs`` maps each required argument of the model to the name of the batch
+    input passed to it, ``optional`` lists the arguments passed only when the
+    corresponding column or constant is provided. The model is imported on first
+    use, so listing the models does not load their compiled kernels.
+    """
+
+    name: str
+    inputs: Mapping[str, str]
+    optional: tuple[str, ...] = ()
+
+    @property
+    def model(self) -> Callable[..., Any]:
+        return getattr(models, self.name)
+
+
+_INDICES: dict[str, _Index] = {
+    "pmv_ppd_iso": _Index(
+        "pmv_ppd_iso",
+        {
+            "tdb": "tdb",
+            "tr": "tr",
+            "vr": "vr",
+            "rh": "rh",
+            "met": "met",
+            "clo": "clo_dynamic_iso",
+        },
+        ("wme",),
+    ),
+    "pmv_ppd_ashrae": _Index(
+        "pmv_ppd_ashrae",
+        {
+            "tdb": "tdb",
+            "tr": "tr",
+            "vr": "vr",
+            "rh": "rh",
+            "met": "met",
+            "clo": "clo_dynamic_ashrae",
+        },
+        ("wme",),
+    ),
+    "set_tmp": _Index(
+        "set_tmp",
+        {"tdb": "tdb", "tr": "tr", "v": "v", "rh": "rh", "met": "met", "clo": "clo"},
+        ("wme", "body_surface_area", "p_atm", "position"),
+    ),
+    "utci": _Index("utci", {"tdb": "tdb", "tr": "tr", "v": "v", "rh": "rh"}),
+    "heat_index_rothfusz": _Index("heat_index_rothfusz", {"tdb": "tdb", "rh": "rh"}),
+    "heat_index_lu": _Index("heat_index_lu", {"tdb": "tdb", "rh": "rh"}),
+    "humidex": _Index("humidex", {"conditions": "conditions"}),
+    "at": _Index("at", {"conditions": "conditions", "v": "v"}, ("q",)),
+    "wbgt": _Index("wbgt", {"twb": "twb", "tg": "tg"}, ("tdb",)),
+    "adaptive_ashrae": _Index(
+        "adaptive_ashrae",
+        {"tdb": "tdb", "tr": "tr", "t_running_mean": "t_running_mean", "v": "v"},
+    ),
+    "adaptive_en": _Index(
+        "adaptive_en",
+        {"tdb": "tdb", "tr": "tr", "t_running_mean": "t_running_mean", "v": "v"},
+    ),
+    "discomfort_index": _Index("discomfort_index", {"tdb": "tdb", "rh": "rh"}),
+    "thi": _Index("thi", {"tdb": "tdb", "rh": "rh"}),
+    "net": _Index("net", {"tdb": "tdb", "rh": "rh", "v": "v"}),
+    "wci": _Index("wci", {"tdb": "tdb", "v": "v"}),
+    "wind_chill_temperature": _Index(
+        "wind_chill_temperature", {"tdb": "tdb", "v": "v"}
+    ),
+    "esi": _Index(
+        "esi",
+        {"tdb": "tdb", "rh": "rh", "sol_radiation_global": "sol_radiation_global"},
+    ),
+}
+
+INDICES: tuple[str, ...] = tuple(_INDICES)
+
+
+class _ChunkInputs:
+    """Inputs of one chunk of rows, in SI units.
+
+    Derived inputs (relative air speed, dynamic clothing insulation and
+    psychrometric values) are calculated the first time a model needs them and
+    then shared by all the other models evaluated on the same chunk.
+    """
+
+    def __init__(self, columns: dict[str, Any], body_movement: bool) -> None:
+        self._values = columns
+        self._body_movement = body_movement
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._values
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._values:
+            self._values[name] = self._derive(name)
+        return self._values[name]
+
+    def _derive(self, name: str) -> Any:
+        if name == "vr":
+            if not self._body_movement:
+                return self["v"]
+            return v_relative(v=self["v"], met=self["met"])
+        if name in ("clo_dynamic_iso", "clo_dynamic_ashrae"):
+            if "clo_dynamic" in self:
+                return self["clo_dynamic"]
+            if not self._body_movement:
+                return self["clo"]
+            if name == "clo_dynamic_iso":
+                return clo_dynamic_iso(clo=self["clo"], met=self["met"], v=self["v"])
+            return clo_dynamic_ashrae(clo=self["clo"], met=self["met"])
+        if name == "conditions":
+            return Conditions(
+                tdb=self["tdb"],
+                rh=self["rh"],
+                v=self._values.get("v"),
+                p_atm=self._values.get("p_atm", 101325),
+            )
+        msg = f"missing input '{name}'"
+        raise KeyError(msg)
+
+
+def _to_si(name: str, value: Any, units: str) -> Any:
+    """Convert the values of the input `name` from `units` to SI units."""
+    if units == Units.IP.value and name in _TEMPERATURES:
+        return units_converter(tmp=value)[0]
+    if units == Units.IP.value and name in _SPEEDS:
+        return units_converter(v=value)[0]
+    return value
+
+
+def _n_rows(table: Mapping[str, Any]) -> int:
+    sizes = {np.size(table[name]) for name in table.keys()}
+    sizes.discard(1)
+    if len(sizes) > 1:
+        raise ValueError("all the columns of the table must have the same length")
+    return sizes.pop() if sizes else 1
+
+
+def _result_columns(name: str, result: Any, n_rows: int) -> dict[str, np.ndarray]:
+    columns = {}
+    for f in fields(result):
+        value = getattr(result, f.name)
+        if value is None:
+            continue
+        value = np.asarray(value)
+        columns[f"{name}.{f.name}"] = np.broadcast_to(value, (n_rows,))
+    return columns
+
+
+def evaluate(
+    table: Mapping[str, Any],
+    indices: Sequence[str],
+    units: str = Units.SI.value,
+    chunk_size: int = 65_536,
+    body_movement: bool = True,
+    options: Mapping[str, Mapping[str, Any]] | None = None,
+    **constants: Any,
+) -> dict[str, np.ndarray]:
+    """Evaluate several models over the same table of inputs.
+
+    The inputs are read column by column from `table`, converted to SI units
+    once and processed in chunks of `chunk_size` rows. Within each chunk the
+    intermediate values shared by more than one model, such as the relative air
+    speed, the dynamic clothing insulation and the psychrometric values, are
+    calculated only once.
+
+    Parameters
+    ----------
+    table : mapping or pandas.DataFrame
+        Columns of input values, named as the arguments of the models, e.g.
+        `tdb`, `tr`, `v`, `rh`, `met`, `clo`, `t_running_mean`, `tg`.
+    indices : list of str
+        Names of the models to evaluate, see
+        :py:data:`pythermalcomfort.batch.INDICES`.
+    units : str, optional
+        Units system of the inputs, 'SI' or 'IP'. Defaults to 'SI'. The results
+        are always in SI units.
+    chunk_size : int, optional
+        Number of rows processed at a time. Defaults to 65536.
+    body_movement : bool, optional
+        If True, the relative air speed and the dynamic clothing insulation used
+        by the PMV models are calculated from `v`, `clo` and `met`, unless the
+        `vr` and `clo_dynamic` columns are provided. Defaults to True.
+    options : dict, optional
+        Keyword arguments passed to a model, e.g.
+        ``{"utci": {"limit_inputs": False}}``.
+    **constants
+        Inputs that are the same for all the rows, e.g. ``met=1.2``.
+
+    Returns
+    -------
+    dict of str to ndarray
+        One column per output of each model, named ``"<model>.<output>"``, e.g.
+        ``"pmv_ppd_iso.pmv"``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import pandas as pd
+
+        from pythermalcomfort.batch import evaluate
+
+        df = pd.read_csv("examples/template-SI.csv")
+        results = pd.DataFrame(evaluate(df, ["pmv_ppd_iso", "set_tmp", "utci"]))
+    """
+    unknown = [name for name in indices if name not in _INDICES]
+    if unknown:
+        msg = f"unknown indices {unknown}, choose among {list(INDICES)}"
+        raise ValueError(msg)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+    units = units.upper()
+    if units not in (Units.SI.value, Units.IP.value):
+        raise ValueError("units must be either 'SI' or 'IP'")
+    options = options or {}
+
+    names = list(dict.fromkeys([*table.keys(), *constants]))
+    n_rows = _n_rows(table)
+    results: dict[str, list[np.ndarray]] = {}
+
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        columns = {}
+        for name in names:
+            value = constants[name] if name in constants else table[name]
+            value = np.asarray(value)
+            if value.size > 1:
+                value = value[start:stop]
+            columns[name] = _to_si(name, value, units)
+
+        inputs = _ChunkInputs(columns, body_movement)
+        for name in indices:
+            index = _INDICES[name]
+            kwargs = {arg: inputs[source] for arg, source in index.inputs.items()}
+            kwargs.update({arg: inputs[arg] for arg in index.optional if arg in inputs})
+            kwargs.update(options.get(name, {}))
+            result = index.model(**kwargs)
+            for column, value in _result_columns(name, result, stop - start).items():
+                results.setdefault(column, []).append(value)
+
+    return {column: np.concatenate(values) for column, values in results.items()}
+
+
+def _to_float(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+
+def _parse_column(name: str, values: list[str]) -> np.ndarray:
+    """Convert the text of a CSV column to floats, or keep it as text.
+
+    The inputs of the models are always floats, so that a value such as "NA"
+    does not change the type of the column in one chunk.
+    """
+    if name in _NUMERIC:
+        return np.array([_to_float(x) for x in values])
+    try:
+        return np.array([float(x) if x != "" else np.nan for x in values])
+    except ValueError:
+        return np.array(values, dtype=object)
+
+
+def _read_csv_chunks(file: TextIO, chunk_size: int) -> Iterator[dict[str, np.ndarray]]:
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("the CSV input is empty, expected a header row")
+    header = [name.strip() for name in header]
+    while True:
+        rows = list(itertools.islice(reader, chunk_size))
+        if not rows:
+            return
+        yield {
+            name: _parse_column(name, list(values))
+            for name, values in zip(header, zip(*rows, strict=True), strict=True)
+        }
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        msg = (
+            "Reading and writing Parquet files requires pyarrow, install it with "
+            "`pip install pythermalcomfort[parquet]`"
+        )
+        raise ImportError(msg) from e
+    return pa, pq
+
+
+def _arrow_type(pa: Any, values: np.ndarray) -> Any:
+    """Return the Parquet type of a column, which must not depend on its values.
+
+    Text columns, e.g. the categories returned by the models, are strings even
+    when all the values of the first chunk are missing.
+    """
+    kind = np.asarray(values).dtype.kind
+    if kind == "b":
+        return pa.bool_()
+    if kind in "iuf":
+        return pa.float64()
+    return pa.string()
+
+
+def _arrow_column(values: np.ndarray) -> Any:
+    """Return a column that pyarrow can convert, with None for missing values."""
+    values = np.asarray(values)
+    if values.dtype.kind in "biuf":
+        return values
+    return [
+        None if isinstance(x, float) and np.isnan(x) else str(x)
+        for x in values.tolist()
+    ]
+
+
+def _load_npy(source: str | os.PathLike | np.ndarray) -> np.ndarray:
+    """Memory-map a ``.npy`` file, so only the rows that are sliced are read."""
+    if isinstance(source, str | os.PathLike):
+        return np.load(source, mmap_mode="r")
+    return np.asarray(source)
+
+
+def _read_array_chunks(
+    columns: Mapping[str, np.ndarray], chunk_size: int
+) -> Iterator[dict[str, np.ndarray]]:
+    n_rows = _n_rows(columns)
+    for start in range(0, n_rows, chunk_size):
+        yield {
+            name: values[start : start + chunk_size] if values.size > 1 else values
+            for name, values in columns.items()
+        }
+
+
+def read_chunks(
+    source: str | os.PathLike | TextIO | Mapping[str, Any],
+    chunk_size: int = 65_536,
+) -> Iterator[dict[str, np.ndarray]]:
+    """Read a CSV, Parquet or ``.npy`` table in chunks of rows.
+
+    Only one chunk is kept in memory at a time, hence tables larger than the
+    available memory can be processed with :py:func:`evaluate` chunk by chunk.
+    ``.npy`` files are memory-mapped and each chunk is a view of the file.
+
+    Parameters
+    ----------
+    source : str, path, file object or mapping
+        Path of a ``.csv``, ``.parquet`` or ``.npy`` file, ``"-"`` for CSV data
+        from the standard input, or an open text file with CSV data. A ``.npy``
+        file must contain a structured array with one field per column.
+        Alternatively, a mapping of column names to arrays or to paths of
+        ``.npy`` files with one column each.
+    chunk_size : int, optional
+        Maximum number of rows in each chunk. Defaults to 65536.
+
+    Yields
+    ------
+    dict of str to ndarray
+        The columns of each chunk. Numeric CSV columns are converted to floats.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+    if isinstance(source, Mapping):
+        columns = {name: _load_npy(values) for name, values in source.items()}
+        yield from _read_array_chunks(columns, chunk_size)
+    elif hasattr(source, "read"):
+        yield from _read_csv_chunks(source, chunk_size)
+    elif str(source) == "-":
+        yield from _read_csv_chunks(sys.stdin, chunk_size)
+    elif Path(source).suffix.lower() == ".parquet":
+        _, pq = _import_pyarrow()
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            yield {
+                name: column.to_numpy(zero_copy_only=False)
+                for name, column in zip(batch.schema.names, batch.columns, strict=True)
+            }
+    elif Path(source).suffix.lower() == ".npy":
+        table = _load_npy(source)
+        if table.dtype.names is None:
+            msg = f"{source} must contain a structured array with one field per column"
+            raise ValueError(msg)
+        columns = {name: table[name] for name in table.dtype.names}
+        yield from _read_array_chunks(columns, chunk_size)
+    else:
+        with Path(source).open(newline="") as file:
+            yield from _read_csv_chunks(file, chunk_size)
+
+
+def write_chunks(
+    chunks: Iterable[Mapping[str, np.ndarray]],
+    destination: str | os.PathLike | TextIO,
+) -> int:
+    """Write chunks of columns to a CSV or Parquet file as they are produced.
+
+    Parameters
+    ----------
+    chunks : iterable of dict of str to ndarray
+        Chunks with the same columns, e.g. the results of :py:func:`evaluate`.
+    destination : str, path or file object
+        Path of a ``.csv`` or ``.parquet`` file, ``"-"`` for CSV data to the
+        standard output, or an open text file.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    n_rows = 0
+    if not hasattr(destination, "write") and str(destination) != "-":
+        if Path(destination).suffix.lower() == ".parquet":
+            pa, pq = _import_pyarrow()
+            writer = None
+            try:
+                for chunk in chunks:
+                    if writer is None:
+                        schema = pa.schema(
+                            [(name, _arrow_type(pa, v)) for name, v in chunk.items()]
+                        )
+                        writer = pq.ParquetWriter(destination, schema)
+                    batch = pa.table(
+                        {name: _arrow_column(v) for name, v in chunk.items()},
+                        schema=schema,
+                    )
+                    writer.write_table(batch)
+                    n_rows += batch.num_rows
+            except BaseException:
+                if writer is not None:
+                    writer.close()
+                    # do not leave a truncated file behind
+                    Path(destination).unlink(missing_ok=True)
+                raise
+            if writer is not None:
+                writer.close()
+            return n_rows
+
+        with Path(destination).open("w", newline="") as file:
+            return write_chunks(chunks, file)
+
+    file = sys.stdout if str(destination) == "-" else destination
+    writer = csv.writer(file)
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            writer.writerow(chunk.keys())
+        columns = [np.asarray(values).tolist() for values in chunk.values()]
+        writer.writerows(zip(*columns, strict=True))
+        n_rows += len(columns[0]) if columns else 0
+    return n_rows
+
+
+def _evaluate_chunk(
+    chunk: Mapping[str, np.ndarray], kwargs: dict[str, Any]
+) -> dict[str, np.ndarray]:
+    return {**chunk, **evaluate(chunk, **kwargs)}
+
+
+def evaluate_chunks(
+    chunks: Iterable[Mapping[str, np.ndarray]],
+    indices: Sequence[str],
+    workers: int = 1,
+    **kwargs: Any,
+) -> Iterator[dict[str, np.ndarray]]:
+    """Evaluate several models over a stream of chunks, e.g. from :py:func:`read_chunks`.
+
+    Parameters
+    ----------
+    chunks : iterable of dict of str to ndarray
+        Chunks of input columns.
+    indices : list of str
+        Names of the models to evaluate, see
+        :py:data:`pythermalcomfort.batch.INDICES`.
+    workers : int, optional
+        Number of processes evaluating the chunks. Defaults to 1, which evaluates
+        the chunks in the current process. At most two chunks per worker are read
+        ahead, so the memory use does not depend on the size of the table.
+    **kwargs
+        Other arguments of :py:func:`evaluate`.
+
+    Yields
+    ------
+    dict of str to ndarray
+        The input columns followed by the results of each chunk, in the same order
+        as the chunks.
+    """
+    kwargs["indices"] = list(indices)
+    if workers < 1:
+        raise ValueError("workers must be greater than 0")
+    if workers == 1:
+        for chunk in chunks:
+            yield _evaluate_chunk(chunk, kwargs)
+        return
+
+    # forking a process after a parallel numba kernel has run hangs the children
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate_chunk, chunk, kwargs))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _tiles(shape: tuple[int, ...], tile_size: int) -> Iterator[tuple[Any, ...]]:
+    """Split a grid into blocks of at most `tile_size` contiguous elements.
+
+    The trailing axes are kept whole while the block fits in `tile_size`, the
+    next axis is split in slices and the leading axes are taken one index at a
+    time, so each block is a contiguous part of a C-ordered array.
+    """
+    axis = len(shape)
+    inner = 1
+    while axis > 0 and inner * shape[axis - 1] <= tile_size:
+        axis -= 1
+        inner *= shape[axis]
+    if axis == 0:
+        yield ()
+        return
+    step = max(tile_size // inner, 1)
+    for outer in np.ndindex(*shape[: axis - 1]):
+        for start in range(0, shape[axis - 1], step):
+            yield (*outer, slice(start, min(start + step, shape[axis - 1])))
+
+
+def evaluate_grid(
+    grid: Mapping[str, Any],
+    indices: Sequence[str],
+    out: str | os.PathLike | MutableMapping[str, np.ndarray],
+    outputs: Sequence[str] | None = None,
+    tile_size: int = 1_048_576,
+    units: str = Units.SI.value,
+    body_movement: bool = True,
+    options: Mapping[str, Mapping[str, Any]] | None = None,
+    **constants: Any,
+) -> dict[str, np.ndarray]:
+    """Evaluate several models over a gridded dataset, tile by tile.
+
+    The inputs are arrays, e.g. of shape (lat, lon, time), or paths of ``.npy``
+    files, which are memory-mapped. They are broadcast against each other
+    without copies, and the grid is processed in tiles of at most `tile_size`
+    elements: each tile is read, computed with :py:func:`evaluate` and written
+    into the output arrays before the next one is read. The memory use
+    therefore depends on `tile_size` and not on the size of the grid.
+
+    Parameters
+    ----------
+    grid : mapping
+        Input arrays or paths of ``.npy`` files, named as the arguments of the
+        models, e.g. `tdb`, `tr`, `v`, `rh`. Their shapes must be broadcastable
+        to the same grid shape.
+    indices : list of str
+        Names of the models to evaluate, see
+        :py:data:`pythermalcomfort.batch.INDICES`.
+    out : str, path or mapping
+        Directory where each output is written to a memory-mapped
+        ``<model>.<output>.npy`` file, created if it does not exist.
+        Alternatively, a mapping of output names to arrays with the shape of
+        the grid, e.g. :py:class:`numpy.memmap`, which are filled in place.
+    outputs : list of str, optional
+        Names of the outputs to write, e.g. ``["utci.utci"]``. Defaults to the
+        keys of `out` if it is a mapping, otherwise to all the numeric outputs.
+        Text outputs, such as the stress categories, cannot be memory-mapped.
+    tile_size : int, optional
+        Maximum number of grid points computed at a time. Defaults to 1048576.
+    units : str, optional
+        Units system of the inputs, 'SI' or 'IP'. Defaults to 'SI'.
+    body_movement : bool, optional
+        See :py:func:`evaluate`. Defaults to True.
+    options : dict, optional
+        Keyword arguments passed to a model, e.g.
+        ``{"utci": {"limit_inputs": False}}``.
+    **constants
+        Inputs that are the same for all the grid points, e.g. ``met=1.2``.
+
+    Returns
+    -------
+    dict of str to ndarray
+        The output arrays, with the shape of the grid.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.batch import evaluate_grid
+
+        results = evaluate_grid(
+            {"tdb": "t2m.npy", "tr": "mrt.npy", "v": "wind.npy", "rh": "rh.npy"},
+            ["utci"],
+            out="results",
+            outputs=["utci.utci"],
+        )
+        # results["utci.utci"] is memory-mapped from results/utci.utci.npy
+    """
+    if tile_size < 1:
+        raise ValueError("tile_size must be greater than 0")
+    arrays = {name: _load_npy(values) for name, values in grid.items()}
+    shape = np.broadcast_shapes(*(values.shape for values in arrays.values()))
+    if 0 in shape:
+        raise ValueError("the grid has no points")
+    for name, values in arrays.items():
+        if values.size == 1:
+            # a single value is passed as a constant instead of a tile
+            constants.setdefault(name, values.reshape(()))
+        else:
+            arrays[name] = np.broadcast_to(values, shape)
+    arrays = {name: values for name, values in arrays.items() if name not in constants}
+
+    if isinstance(out, Mapping):
+        results = dict(out)
+        outputs = list(results) if outputs is None else list(outputs)
+        for name in outputs:
+            if name not in results:
+                msg = f"no output array for '{name}'"
+                raise KeyError(msg)
+            if results[name].shape != shape:
+                msg = f"the output '{name}' has shape {results[name].shape}, expected {shape}"
+                raise ValueError(msg)
+    else:
+        Path(out).mkdir(parents=True, exist_ok=True)
+        results = {}
+
+    kwargs = {
+        "indices": indices,
+        "units": units,
+        "chunk_size": tile_size,
+        "body_movement": body_movement,
+        "options": options,
+        **constants,
+    }
+    for tile in _tiles(shape, tile_size):
+        table = {
+            name: np.ascontiguousarray(values[tile]) for name, values in arrays.items()
+        }
+        columns = evaluate(
+            {name: values.ravel() for name, values in table.items()}, **kwargs
+        )
+        if outputs is None:
+            outputs = [
+                name for name, values in columns.items() if values.dtype.kind in "biuf"
+            ]
+        for name in outputs:
+            if name not in columns:
+                msg = f"unknown output '{name}', choose among {list(columns)}"
+                raise ValueError(msg)
+            values = columns[name]
+            if name not in results:
+                if values.dtype.kind not in "biuf":
+                    msg = f"the output '{name}' is not numeric and cannot be memory-mapped"
+                    raise ValueError(msg)
+                results[name] = np.lib.format.open_memmap(
+                    Path(out) / f"{name}.npy",
+                    mode="w+",
+                    dtype=values.dtype,
+                    shape=shape,
+                )
+            target = results[name]
+            target[tile] = values.reshape(target[tile].shape)
+
+    for name in outputs:
+        if isinstance(results[name], np.memmap):
+            results[name].flush()
+    return {name: results[name] for name in outputs}
+
+
+def _import_xarray() -> Any:
+    try:
+        import xarray as xr
+    except ImportError as e:
+        msg = (
+            "Evaluating xarray datasets requires xarray, install it with "
+            "`pip install pythermalcomfort[xarray]`"
+        )
+        raise ImportError(msg) from e
+    return xr
+
+
+def _evaluate_blocks(
+    *blocks: np.ndarray,
+    names: Sequence[str],
+    outputs: Mapping[str, np.dtype],
+    kwargs: dict[str, Any],
+) -> np.ndarray | tuple[np.ndarray, ...]:
+    """Evaluate the models on one block of each input and return the outputs."""
+    arrays = np.broadcast_arrays(*blocks)
+    shape = arrays[0].shape
+    if arrays[0].size == 0:
+        values = [np.empty(shape, dtype=dtype) for dtype in outputs.values()]
+    else:
+        table = {name: a.ravel() for name, a in zip(names, arrays, strict=True)}
+        columns = evaluate(table, **kwargs)
+        values = [
+            columns[name].reshape(shape).astype(dtype, copy=False)
+            for name, dtype in outputs.items()
+        ]
+    return values[0] if len(values) == 1 else tuple(values)
+
+
+def evaluate_xarray(
+    data: Mapping[str, Any],
+    indices: Sequence[str],
+    outputs: Sequence[str] | None = None,
+    units: str = Units.SI.value,
+    body_movement: bool = True,
+    options: Mapping[str, Mapping[str, Any]] | None = None,
+    **constants: Any,
+) -> Any:
+    """Evaluate several models over xarray data, lazily if it is backed by dask.
+
+    The models are applied with :py:func:`xarray.apply_ufunc` and
+    ``dask="parallelized"``: each dask chunk is computed with
+    :py:func:`evaluate` only when the result is computed, so datasets larger
+    than the available memory are processed chunk by chunk and the results
+    keep the chunks, dimensions and coordinates of the inputs.
+
+    Parameters
+    ----------
+    data : xarray.Dataset or mapping
+        Input variables named as the arguments of the models, e.g. `tdb`,
+        `tr`, `v`, `rh`, either as a Dataset or as a mapping of names to
+        DataArrays. The values that are not DataArrays are used as constants.
+    indices : list of str
+        Names of the models to evaluate, see
+        :py:data:`pythermalcomfort.batch.INDICES`.
+    outputs : list of str, optional
+        Names of the outputs to return, e.g. ``["utci.utci"]``. Defaults to all
+        the numeric outputs. Text outputs, such as the stress categories, are
+        returned with the object dtype only if requested.
+    units : str, optional
+        Units system of the inputs, 'SI' or 'IP'. Defaults to 'SI'.
+    body_movement : bool, optional
+        See :py:func:`evaluate`. Defaults to True.
+    options : dict, optional
+        Keyword arguments passed to a model, e.g.
+        ``{"utci": {"limit_inputs": False}}``.
+    **constants
+        Inputs that are the same for all the points, e.g. ``met=1.2``.
+
+    Returns
+    -------
+    xarray.Dataset
+        One variable per output, named ``"<model>.<output>"``, with the
+        attributes of `data` if it is a Dataset. The types of the outputs are
+        found by computing the first point of the inputs.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import xarray as xr
+
+        from pythermalcomfort.batch import evaluate_xarray
+
+        ds = xr.open_mfdataset("era5_*.nc", chunks={"time": 24})
+        inputs = {
+            "tdb": ds.t2m - 273.15,
+            "tr": ds.mrt - 273.15,
+            "v": ds.si10,
+            "rh": ds.rh,
+        }
+        utci = evaluate_xarray(inputs, ["utci"])["utci.utci"]
+        utci.to_netcdf("utci.nc")  # computed one chunk at a time
+    """
+    xr = _import_xarray()
+    names = [name for name, value in data.items() if isinstance(value, xr.DataArray)]
+    if not names:
+        raise ValueError("at least one input must be an xarray.DataArray")
+    constants = {
+        **{name: value for name, value in data.items() if name not in names},
+        **constants,
+    }
+    kwargs = {
+        "indices": list(indices),
+        "units": units,
+        "body_movement": body_movement,
+        "options": options,
+        **constants,
+    }
+
+    # the output types do not depend on the values, only the first point is computed
+    first = {
+        name: np.asarray(data[name][(0,) * data[name].ndim].values).reshape(1)
+        for name in names
+    }
+    sample = evaluate(first, **kwargs)
+    if outputs is None:
+        outputs = [
+            name for name, values in sample.items() if values.dtype.kind in "biuf"
+        ]
+    unknown = [name for name in outputs if name not in sample]
+    if unknown:
+        msg = f"unknown outputs {unknown}, choose among {list(sample)}"
+        raise ValueError(msg)
+    dtypes = {
+        name: sample[name].dtype
+        if sample[name].dtype.kind in "biuf"
+        else np.dtype(object)
+        for name in outputs
+    }
+
+    results = xr.apply_ufunc(
+        _evaluate_blocks,
+        *(data[name] for name in names),
+        kwargs={"names": names, "outputs": dtypes, "kwargs": kwargs},
+        output_core_dims=[[] for _ in outputs],
+        dask="parallelized",
+        output_dtypes=list(dtypes.values()),
+        keep_attrs="drop",
+    )
+    if len(outputs) == 1:
+        results = (results,)
+    return xr.Dataset(
+        dict(zip(outputs, results, strict=True)), attrs=dict(getattr(data, "attrs", {}))
+    )
+
+
+class RunningMeanOutdoorTemperature:
+    """Running mean outdoor temperature of a stream of chunks, for :py:func:`pipeline`.
+
+    The running mean of each day is calculated from the daily mean outdoor
+    temperatures of the previous `days` days, as in
+    :py:func:`~pythermalcomfort.utilities.running_mean_outdoor_temperature`. The
+    daily means of the last `days` days, and the partial mean of a day split
+    between two chunks, are kept from one chunk to the next, hence the results do
+    not depend on the chunk size. The rows must be in chronological order.
+
+    Parameters
+    ----------
+    column : str, optional
+        Name of the column with the outdoor air temperature, [°C]. Defaults to
+        't_out'.
+    alpha : float, optional
+        Constant between 0 and 1. Defaults to 0.8.
+    days : int, optional
+        Number of previous days used to calculate the running mean. Defaults to 7.
+        The rows of the first `days` days are nan.
+    by : str, optional
+        Name of the column identifying the day of each row, e.g. the date. A new
+        day starts whenever its value changes and the daily mean is the mean of
+        the rows of the day. Defaults to None, meaning that each row is a day.
+    output : str, optional
+        Name of the output column. Defaults to 't_running_mean', the input of
+        the adaptive models.
+    round_output : bool, optional
+        If True, rounds the running mean to one decimal. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        column: str = "t_out",
+        alpha: float = 0.8,
+        days: int = 7,
+        by: str | None = None,
+        output: str = "t_running_mean",
+        round_output: bool = True,
+    ) -> None:
+        if days < 1:
+            raise ValueError("days must be greater than 0")
+        self.column = column
+        self.by = by
+        self.output = output
+        self.round_output = round_output
+        self.days = days
+        # weights of the previous days, from the oldest to yesterday
+        weights = alpha ** np.arange(days - 1, -1, -1)
+        self._weights = weights / weights.sum()
+        self._history = np.empty(0)
+        self._partial: tuple[float, int, Any] | None = None
+
+    def __call__(self, chunk: Mapping[str, Any]) -> dict[str, np.ndarray]:
+        values = np.asarray(chunk[self.column], dtype=float)
+        n_rows = values.size
+        if n_rows == 0:
+            return {self.output: np.empty(0)}
+        if self.by is None:
+            keys = None
+            starts = np.arange(n_rows)
+        else:
+            keys = np.asarray(chunk[self.by])
+            starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        sums = np.add.reduceat(values, starts)
+        rows = np.diff(np.append(starts, n_rows))
+        counts = rows.copy()
+
+        # close the last day of the previous chunk, unless it continues here
+        if self._partial is not None:
+            p_sum, p_count, p_key = self._partial
+            if keys is not None and keys[0] == p_key:
+                sums[0] += p_sum
+                counts[0] += p_count
+            else:
+                self._history = np.append(self._history, p_sum / p_count)[-self.days :]
+
+        means = sums / counts
+        series = np.concatenate((self._history, means))
+        t_rm = np.full(means.size, np.nan)
+        if series.size > self.days:
+            # the window starting at i ends the day before day i + days, and the
+            # history never holds more than `days` days
+            windows = np.lib.stride_tricks.sliding_window_view(series[:-1], self.days)
+            t_rm[self.days - self._history.size :] = windows @ self._weights
+        if self.round_output:
+            t_rm = np.around(t_rm, 1)
+
+        # the last day may continue in the next chunk
+        last_key = None if keys is None else keys[-1]
+        self._partial = (sums[-1], counts[-1], last_key)
+        self._history = series[:-1][-self.days :]
+        return {self.output: np.repeat(t_rm, rows)}
+
+
+class PHSSeries:
+    """Predicted Heat Strain of consecutive exposure periods, for :py:func:`pipeline`.
+
+    Each row is an exposure period of `duration` minutes following the period of
+    the previous row: the skin, core and rectal temperatures, the sweat rate and
+    the evaporative load at the end of a row are the initial values of the next
+    one, including across chunks, as when chaining calls to
+    :py:func:`~pythermalcomfort.models.phs.phs` by hand. The rows are simulated
+    one after the other by a single compiled loop per chunk, so the chunks of a
+    series must be processed in order and cannot be split among the workers of
+    :py:func:`evaluate_chunks`.
+
+    A row whose inputs are missing or outside the applicability limits of
+    ISO 7933 returns nan, and the next row starts again from the initial values.
+
+    Parameters
+    ----------
+    model : str, optional
+        Version of ISO 7933, "7933-2023" (default) or "7933-2004".
+    **kwargs
+        Inputs of :py:func:`~pythermalcomfort.models.phs.phs` that are the same
+        for all the rows, e.g. ``posture="standing", duration=60``. The inputs
+        tdb, tr, v, rh, met, clo, posture, wme and duration that are not set here
+        are read from the columns with the same name. The initial values of the
+        first row, e.g. `t_re`, can also be set here.
+
+    The outputs are named as in :py:func:`evaluate`, e.g. ``"phs.t_re"``, and
+    are not rounded.
+    """
+
+    # inputs that can change from one row to the next
+    _INPUTS = ("tdb", "tr", "v", "rh", "met", "clo", "posture", "wme", "duration")
+    # initial values of each row, in the order of the state of the kernel
+    _STATE = (
+        "t_sk",
+        "t_cr",
+        "t_re",
+        "t_cr_eq",
+        "t_sk_t_cr_wg",
+        "evap_load_wm2_min",
+        "sweat_rate_watt",
+    )
+    # outputs of the kernel
+    _OUTPUTS = (
+        "t_re",
+        "t_sk",
+        "t_cr",
+        "t_cr_eq",
+        "t_sk_t_cr_wg",
+        "sweat_rate_watt",
+        "evap_load_wm2_min",
+        "sweat_loss_g",
+        "d_lim_loss_50",
+        "d_lim_loss_95",
+        "d_lim_t_re",
+    )
+
+    def __init__(self, model: str = Models.iso_7933_2023.value, **kwargs: Any) -> None:
+        from pythermalcomfort.models.phs import _phs_settings
+
+        if model not in (Models.iso_7933_2004.value, Models.iso_7933_2023.value):
+            msg = f"unknown PHS model '{model}'"
+            raise ValueError(msg)
+        self.model = model
+        self.kwargs = {
+            name: kwargs.pop(name) for name in self._INPUTS if name in kwargs
+        }
+        self.settings = _phs_settings(model, kwargs)
+        self._initial_state = np.array(
+            [self.settings[name] for name in self._STATE], dtype=np.float64
+        )
+        self._state = self._initial_state.copy()
+
+    def __call__(self, chunk: Mapping[str, Any]) -> dict[str, np.ndarray]:
+        from pythermalcomfort.models.phs import (
+            _MODEL_2004,
+            _MODEL_2023,
+            _phs_optimized_series,
+            _phs_p_a,
+            _posture_to_code,
+        )
+
+        inputs = {"wme": 0, "duration": self.settings["duration"]}
+        for name in self._INPUTS:
+            if name in self.kwargs:
+                inputs[name] = self.kwargs[name]
+            elif name in chunk:
+                inputs[name] = chunk[name]
+            elif name not in inputs:
+                msg = f"missing input '{name}'"
+                raise KeyError(msg)
+        PHSInputs(
+            **{name: inputs[name] for name in self._INPUTS if name != "duration"},
+            round_output=False,
+        )
+
+        n_rows = _n_rows(inputs)
+        rows = {
+            name: np.ascontiguousarray(
+                np.broadcast_to(np.asarray(inputs[name], dtype=np.float64), (n_rows,))
+            )
+            for name in ("tdb", "tr", "v", "rh", "met", "clo", "wme")
+        }
+        posture = np.broadcast_to(np.asarray(inputs["posture"]), (n_rows,))
+        duration = np.broadcast_to(np.asarray(inputs["duration"]), (n_rows,))
+        settings = self.settings
+        out = _phs_optimized_series(
+            rows["tdb"],
+            rows["tr"],
+            rows["v"],
+            _phs_p_a(rows["tdb"], rows["rh"], self.model),
+            rows["met"] * met_to_w_m2,
+            rows["clo"],
+            np.ascontiguousarray(_posture_to_code(posture)),
+            rows["wme"] * met_to_w_m2,
+            duration.astype(np.int64),
+            settings["drink"],
+            settings["acclimatized"],
+            settings["weight"],
+            settings["i_mst"],
+            settings["a_p"],
+            settings["height"],
+            settings["walk_sp"],
+            settings["theta"],
+            settings["f_r"],
+            self._state,
+            self._initial_state,
+            _MODEL_2023 if self.model == Models.iso_7933_2023.value else _MODEL_2004,
+            settings["limit_inputs"],
+        )
+        return {f"phs.{name}": out[i] for i, name in enumerate(self._OUTPUTS)}
+
+
+_END = object()
+
+
+def _read_ahead(
+    chunks: Iterable[Mapping[str, Any]], size: int
+) -> Iterator[Mapping[str, Any]]:
+    """Read up to `size` chunks in a background thread while the current one is
+    computed.
+
+    The reader thread holds one more chunk while it waits for space in the
+    buffer. If the consumer stops early, the reader stops after the chunk it is
+    reading; the consumer waits for it only briefly, since reading a chunk
+    from the standard input can block indefinitely.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def read() -> None:
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    break
+            else:
+                put((_END, None))
+        except BaseException as e:  # re-raised in the thread of the consumer
+            put((None, e))
+        finally:
+            # close the files opened by read_chunks
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+    thread = threading.Thread(target=read, daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk, error = buffer.get()
+            if error is not None:
+                raise error
+            if chunk is _END:
+                return
+            yield chunk
+    finally:
+        stop.set()
+        thread.join(timeout=1.0)
+
+
+def _step_groups(steps: Sequence[Any], units: str) -> tuple[list[Any], str]:
+    """Check the steps and the units, and group the consecutive models."""
+    unknown = [s for s in steps if isinstance(s, str) and s not in _INDICES]
+    if unknown:
+        msg = f"unknown indices {unknown}, choose among {list(INDICES)}"
+        raise ValueError(msg)
+    units = units.upper()
+    if units not in (Units.SI.value, Units.IP.value):
+        msg = f"units must be '{Units.SI.value}' or '{Units.IP.value}'"
+        raise ValueError(msg)
+
+    # consecutive models are evaluated together to share the derived inputs
+    groups: list[Any] = []
+    for step in steps:
+        if isinstance(step, str) and groups and isinstance(groups[-1], list):
+            groups[-1].append(step)
+        else:
+            groups.append([step] if isinstance(step, str) else step)
+    return groups, units
+
+
+def _apply_steps(
+    chunk: Mapping[str, Any],
+    groups: list[Any],
+    units: str,
+    constants: dict[str, Any],
+    kwargs: dict[str, Any],
+) -> dict[str, np.ndarray]:
+    """Apply the steps to a chunk and return their outputs."""
+    columns = {name: _to_si(name, chunk[name], units) for name in chunk.keys()}
+    outputs: dict[str, np.ndarray] = {}
+    for step in groups:
+        if isinstance(step, list):
+            new = evaluate(columns, step, **kwargs, **constants)
+        else:
+            new = step({**constants, **columns})
+        columns.update(new)
+        outputs.update(new)
+    return outputs
+
+
+def pipeline(
+    source: str | os.PathLike | TextIO | Mapping[str, Any] | Iterable[Mapping],
+    steps: Sequence[str | Callable[[Mapping[str, Any]], Mapping[str, Any]]],
+    chunk_size: int = 65_536,
+    read_ahead: int = 1,
+    units: str = Units.SI.value,
+    body_movement: bool = True,
+    options: Mapping[str, Mapping[str, Any]] | None = None,
+    **constants: Any,
+) -> Iterator[dict[str, np.ndarray]]:
+    """Compute models over a table read in chunks, yielding the results of each chunk.
+
+    At most `read_ahead` + 2 chunks are held in memory at a time: the chunks
+    waiting in the read-ahead buffer, the one being read and the one being
+    computed. Hence the memory use does not depend on the size of the table.
+    The steps are applied in order to each chunk, and each step can use the
+    outputs of the previous ones.
+
+    Parameters
+    ----------
+    source : str, path, file object, mapping or iterable of mappings
+        Table to read with :py:func:`read_chunks`, i.e. a CSV, Parquet or
+        ``.npy`` file or a mapping of columns, or an iterable of chunks of columns.
+    steps : list of str or callable
+        Names of the models to evaluate, see
+        :py:data:`pythermalcomfort.batch.INDICES`, or callables that take the
+        columns of a chunk and return new columns. Stateful steps, such as
+        :py:class:`RunningMeanOutdoorTemperature` and :py:class:`PHSSeries`, carry
+        their state from one chunk to the next, so the chunks are computed in
+        order.
+    chunk_size : int, optional
+        Maximum number of rows in each chunk. Defaults to 65536.
+    read_ahead : int, optional
+        Number of chunks read in a background thread while the current chunk is
+        computed. Defaults to 1, use 0 to read and compute in turn.
+    units : str, optional
+        Units system of the inputs, 'SI' or 'IP'. Defaults to 'SI'. The inputs are
+        converted to SI units before the steps, the results are in SI units.
+    body_movement : bool, optional
+        See :py:func:`evaluate`.
+    options : dict, optional
+        See :py:func:`evaluate`.
+    **constants
+        Inputs that are the same for all the rows, e.g. ``met=1.2``.
+
+    Yields
+    ------
+    dict of str to ndarray
+        The input columns followed by the outputs of the steps of each chunk, in
+        the same order as the chunks.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.batch import (
+            RunningMeanOutdoorTemperature,
+            pipeline,
+            write_chunks,
+        )
+
+        # hourly measurements with the columns date, t_out, tdb, tr and v
+        chunks = pipeline(
+            "measurements.csv",
+            [RunningMeanOutdoorTemperature(by="date"), "adaptive_en"],
+        )
+        write_chunks(chunks, "results.parquet")
+    """
+    if read_ahead < 0:
+        raise ValueError("read_ahead must be greater than or equal to 0")
+    groups, units = _step_groups(steps, units)
+    constants = {name: _to_si(name, value, units) for name, value in constants.items()}
+    kwargs = {
+        "chunk_size": chunk_size,
+        "body_movement": body_movement,
+        "options": options,
+    }
+
+    if isinstance(source, str | os.PathLike | Mapping) or hasattr(source, "read"):
+        source = read_chunks(source, chunk_size)
+    chunks = _read_ahead(source, read_ahead) if read_ahead else iter(source)
+    for chunk in chunks:
+        yield {**chunk, **_apply_steps(chunk, groups, units, constants, kwargs)}
+
+
+def _import_dask_dataframe() -> Any:
+    try:
+        import dask.dataframe as dd
+        import pandas as pd
+    except ImportError as e:
+        msg = (
+            "Evaluating dask DataFrames requires dask and pandas, install them with "
+            "`pip install pythermalcomfort[dask]`"
+        )
+        raise ImportError(msg) from e
+    return dd, pd
+
+
+def _evaluate_partition(
+    frame: Any,
+    groups: list[Any],
+    units: str,
+    constants: dict[str, Any],
+    kwargs: dict[str, Any],
+    meta: Any = None,
+) -> Any:
+    """Apply the steps to a pandas DataFrame and append their outputs."""
+    _, pd = _import_dask_dataframe()
+    if frame.empty and meta is not None:
+        return meta
+    # each partition starts from a fresh copy of the stateful steps
+    groups = copy.deepcopy(groups)
+    chunk = {name: frame[name].to_numpy() for name in frame.columns}
+    outputs = _apply_steps(chunk, groups, units, constants, kwargs)
+    # text outputs are always objects, whether or not they are all missing
+    return frame.assign(
+        **{
+            name: values
+            if np.asarray(values).dtype.kind in "biuf"
+            else pd.Series(values, index=frame.index, dtype=object)
+            for name, values in outputs.items()
+        }
+    )
+
+
+def evaluate_dask(
+    df: Any,
+    steps: Sequence[str | Callable[[Mapping[str, Any]], Mapping[str, Any]]],
+    overlap: int | str | Any = 0,
+    units: str = Units.SI.value,
+    body_movement: bool = True,
+    options: Mapping[str, Mapping[str, Any]] | None = None,
+    **constants: Any,
+) -> Any:
+    """Compute models over the partitions of a dask DataFrame.
+
+    Each partition is computed independently with the same steps as
+    :py:func:`pipeline`, so the computation runs lazily and in parallel on the
+    dask scheduler. Stateful steps, such as
+    :py:class:`RunningMeanOutdoorTemperature`, are copied for each partition in
+    the state they have when this function is called, usually their initial
+    state: use `overlap` to prepend the last rows of the previous partition,
+    which provide the history they need and are then dropped.
+
+    Parameters
+    ----------
+    df : dask.dataframe.DataFrame
+        Input columns, named as the arguments of the models, with the rows of
+        each partition in chronological order if stateful steps are used.
+    steps : list of str or callable
+        Names of the models to evaluate, see
+        :py:data:`pythermalcomfort.batch.INDICES`, or callables that take the
+        columns of a partition and return new columns.
+    overlap : int, str or timedelta, optional
+        Number of rows, or time span if the index is a datetime index, of the
+        previous partition prepended to each partition. Defaults to 0. For
+        :py:class:`RunningMeanOutdoorTemperature` it must cover its `days` days
+        and each partition must be longer than the overlap.
+    units : str, optional
+        Units system of the inputs, 'SI' or 'IP'. Defaults to 'SI'.
+    body_movement : bool, optional
+        See :py:func:`evaluate`.
+    options : dict, optional
+        See :py:func:`evaluate`.
+    **constants
+        Inputs that are the same for all the rows, e.g. ``met=1.2``.
+
+    Returns
+    -------
+    dask.dataframe.DataFrame
+        The input columns followed by the outputs of the steps. The output types
+        are found by computing the first row of the first partition. The text
+        outputs, such as the stress categories, have the object dtype.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import dask.dataframe as dd
+
+        from pythermalcomfort.batch import RunningMeanOutdoorTemperature, evaluate_dask
+
+        # hourly measurements partitioned by building, sorted by time
+        df = dd.read_parquet("bms/", columns=["date", "t_out", "tdb", "tr", "v"])
+        results = evaluate_dask(
+            df,
+            [RunningMeanOutdoorTemperature(by="date"), "adaptive_en"],
+            overlap=8 * 24,
+        )
+        results.to_parquet("comfort/")
+    """
+    _, pd = _import_dask_dataframe()
+    groups, units = _step_groups(steps, units)
+    constants = {name: _to_si(name, value, units) for name, value in constants.items()}
+    kwargs = {"body_movement": body_movement, "options": options}
+    args = (groups, units, constants, kwargs)
+
+    # the output types do not depend on the values, only the first row is computed
+    sample = df.partitions[0].head(1)
+    if not isinstance(sample, pd.DataFrame) or sample.empty:
+        raise ValueError("the first partition of the DataFrame is empty")
+    meta = _evaluate_partition(sample, *args).iloc[:0]
+
+    if isinstance(overlap, int) and overlap == 0:
+        return df.map_partitions(_evaluate_partition, *args, meta, meta=meta)
+    return df.map_overlap(_evaluate_partition, overlap, 0, *args, meta, meta=meta)
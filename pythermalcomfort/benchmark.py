@@ -0,0 +1,612 @@
+"""Benchmark the public models at several input sizes.
+
+:py:func:`run` times each model on random inputs within its applicability
+limits, from a single scalar call to arrays of 10 million elements, and splits
+the time of each call in three stages:
+
+* validation, the checks of the inputs done by the input classes of
+  :py:mod:`pythermalcomfort.classes_input`,
+* kernel, the calls of the compiled numba kernels,
+* post-processing, everything else: array conversions, rounding, category
+  mapping and the Python code of the models that have no compiled kernel.
+
+With ``memory=True``, :py:func:`run` measures instead the peak of the memory
+allocated during each call with :py:mod:`tracemalloc`, and its ratio to the
+number of elements, which gives the size of the chunks that fit in a memory
+budget. tracemalloc sees the memory allocated by Python and numpy, including the
+arrays returned by the compiled ufuncs, but not the temporary buffers allocated
+by numba inside the kernels.
+
+The results are plain dictionaries that can be saved as JSON, and
+:py:func:`compare` lists the regressions of a run against a previous one, e.g.
+between two versions of the package. The ``pythermalcomfort benchmark`` command
+runs both.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import pythermalcomfort
+
+# number of elements of the inputs, None is a call with scalar inputs
+SIZES: tuple[int | None, ...] = (None, 1_000, 100_000, 10_000_000)
+
+# value compared between two runs of each mode
+_METRICS = {"time": "total_s", "memory": "peak_bytes"}
+
+_Draw = Callable[[float, float], Any]
+
+
+@dataclass(frozen=True)
+class _Case:
+    """A benchmarked call, `inputs` returns its arguments from a draw function.
+
+    The models that solve each element with Python code are only timed up to
+    `max_size` elements.
+    """
+
+    name: str
+    call: Callable[..., Any]
+    inputs: Callable[[_Draw], dict[str, Any]]
+    max_size: int | None = 10_000_000
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+
+def _model(name: str) -> Callable[..., Any]:
+    from pythermalcomfort import models
+
+    return getattr(models, name)
+
+
+def _call(name: str, **kwargs: Any) -> Any:
+    return _model(name)(**kwargs)
+
+
+def _jos3_simulate(times: int, **inputs: Any) -> Any:
+    from pythermalcomfort.models import JOS3
+
+    model = JOS3()
+    for name, value in inputs.items():
+        setattr(model, name, value)
+    model.simulate(times=times, dtime=60)
+    return model
+
+
+def _indoor(draw: _Draw, speed: str = "vr") -> dict[str, Any]:
+    return {
+        "tdb": draw(18, 30),
+        "tr": draw(18, 30),
+        speed: draw(0.1, 0.8),
+        "rh": draw(30, 70),
+        "met": draw(1.0, 1.6),
+        "clo": draw(0.4, 1.0),
+    }
+
+
+def _still_air(draw: _Draw) -> dict[str, Any]:
+    # the ASHRAE models solve the cooling effect of each element above 0.1 m/s
+    return {
+        "tdb": draw(18, 30),
+        "tr": draw(18, 30),
+        "vr": draw(0.05, 0.1),
+        "rh": draw(30, 70),
+        "met": draw(1.0, 1.6),
+        "clo": draw(0.4, 1.0),
+    }
+
+
+def _case(
+    name: str,
+    inputs: Callable[[_Draw], dict[str, Any]],
+    max_size: int | None = 10_000_000,
+    **params: Any,
+) -> _Case:
+    suffix = ",".join(f"{key}={value}" for key, value in params.items())
+    return _Case(
+        f"{name}[{suffix}]" if suffix else name,
+        functools.partial(_call, name, **params),
+        inputs,
+        max_size,
+        params,
+    )
+
+
+def _cases() -> list[_Case]:
+    def heat(draw: _Draw) -> dict[str, Any]:
+        return {"tdb": draw(27, 40), "rh": draw(40, 80)}
+
+    def wind(draw: _Draw) -> dict[str, Any]:
+        return {"tdb": draw(-30, 5), "v": draw(1, 20)}
+
+    def outdoor(draw: _Draw) -> dict[str, Any]:
+        return {
+            "tdb": draw(20, 40),
+            "tr": draw(20, 60),
+            "v": draw(0.5, 10),
+            "rh": draw(20, 80),
+        }
+
+    def adaptive(draw: _Draw) -> dict[str, Any]:
+        return {
+            "tdb": draw(20, 30),
+            "tr": draw(20, 30),
+            "t_running_mean": draw(12, 30),
+            "v": draw(0.1, 1),
+        }
+
+    def hot(draw: _Draw) -> dict[str, Any]:
+        return {
+            "tdb": draw(30, 40),
+            "tr": draw(30, 50),
+            "v": draw(0.1, 1),
+            "rh": draw(20, 60),
+            "met": draw(1.2, 2.5),
+            "clo": draw(0.4, 0.8),
+        }
+
+    return [
+        _case("adaptive_ashrae", adaptive),
+        _case("adaptive_en", adaptive),
+        _case(
+            "ankle_draft",
+            lambda draw: {**_still_air(draw), "v_ankle": draw(0.05, 0.3)},
+        ),
+        _case("at", lambda draw: {**heat(draw), "v": draw(0, 5)}),
+        _case("clo_tout", lambda draw: {"tout": draw(5, 30)}),
+        _case("cooling_effect", _indoor, max_size=1_000),
+        _case("discomfort_index", heat),
+        _case("esi", lambda draw: {**heat(draw), "sol_radiation_global": draw(0, 900)}),
+        _case("heat_index_lu", heat, max_size=1_000),
+        _case("heat_index_rothfusz", heat),
+        _case("humidex", heat),
+        _case("net", lambda draw: {**heat(draw), "v": draw(0, 5)}),
+        _case(
+            "outdoor_indices",
+            lambda draw: {
+                **heat(draw),
+                "v": draw(1, 5),
+                "sol_radiation_global": draw(0, 900),
+            },
+        ),
+        _case("pet_steady", lambda draw: _indoor(draw, speed="v"), max_size=1_000),
+        *(
+            _case(
+                "phs",
+                lambda draw: {**hot(draw), "posture": "standing"},
+                max_size=100_000,
+                duration=duration,
+            )
+            for duration in (60, 480)
+        ),
+        _case("pmv_a", _indoor, a_coefficient=0.293),
+        _case(
+            "pmv_athb",
+            lambda draw: (
+                {key: value for key, value in _indoor(draw).items() if key != "clo"}
+                | {"t_running_mean": draw(12, 30)}
+            ),
+        ),
+        _case("pmv_e", _indoor, e_coefficient=0.9),
+        _case("pmv_ppd_ashrae", _still_air),
+        _Case(
+            "pmv_ppd_ashrae[elevated_air_speed]",
+            functools.partial(_call, "pmv_ppd_ashrae"),
+            _indoor,
+            max_size=1_000,
+        ),
+        _case("pmv_ppd_iso", _indoor),
+        _case(
+            "ridge_regression_predict_t_re_t_sk",
+            lambda draw: {
+                "sex": "male",
+                "age": draw(60, 80),
+                "height": draw(160, 190),
+                "weight": draw(60, 90),
+                "tdb": draw(30, 40),
+                "rh": draw(30, 60),
+            },
+            max_size=100_000,
+            duration=60,
+        ),
+        _case("set_tmp", lambda draw: _indoor(draw, speed="v")),
+        _case(
+            "solar_gain",
+            lambda draw: {
+                "sol_altitude": draw(0, 90),
+                "sharp": draw(0, 180),
+                "sol_radiation_dir": draw(0, 900),
+                "sol_transmittance": draw(0.5, 1),
+                "f_svv": draw(0.1, 0.5),
+                "f_bes": draw(0.1, 0.5),
+            },
+            max_size=100_000,
+        ),
+        _case(
+            "sports_heat_stress_risk",
+            lambda draw: {
+                "tdb": draw(25, 40),
+                "tr": draw(25, 50),
+                "rh": draw(20, 60),
+                "vr": draw(0.5, 3),
+                "sport": _model("Sports").RUNNING,
+            },
+            max_size=100,
+        ),
+        _case("thi", heat),
+        _case("two_nodes_gagge", lambda draw: _indoor(draw, speed="v")),
+        _case(
+            "two_nodes_gagge_ji",
+            lambda draw: {
+                **{
+                    key: value
+                    for key, value in _indoor(draw, speed="v").items()
+                    if key != "rh"
+                },
+                "vapor_pressure": draw(1, 2.5),
+            },
+            max_size=1_000,
+        ),
+        _case(
+            "two_nodes_gagge_sleep",
+            lambda draw: {
+                **{
+                    key: value
+                    for key, value in _indoor(draw, speed="v").items()
+                    if key != "met"
+                },
+                "thickness_quilt": draw(0, 2),
+            },
+            max_size=1_000,
+        ),
+        _case("use_fans_heatwaves", hot),
+        _case("utci", outdoor),
+        _case(
+            "vertical_tmp_grad_ppd",
+            lambda draw: {**_still_air(draw), "vertical_tmp_grad": draw(0, 3)},
+        ),
+        _case("wbgt", lambda draw: {"twb": draw(15, 30), "tg": draw(25, 50)}),
+        _case("wci", wind),
+        _case("wind_chill_temperature", wind),
+        _case("work_capacity_dunne", lambda draw: {"wbgt": draw(20, 35)}),
+        _case("work_capacity_hothaps", lambda draw: {"wbgt": draw(20, 35)}),
+        _case(
+            "work_capacity_iso",
+            lambda draw: {"wbgt": draw(20, 35), "met": draw(150, 500)},
+        ),
+        _case(
+            "work_capacity_niosh",
+            lambda draw: {"wbgt": draw(20, 35), "met": draw(150, 500)},
+        ),
+        *(
+            _Case(
+                f"JOS3.simulate[times={times}]",
+                functools.partial(_jos3_simulate, times),
+                lambda draw: {"tdb": 30, "tr": 35, "rh": 50, "v": 0.2},
+                max_size=None,
+                params={"times": times},
+            )
+            for times in (60, 600)
+        ),
+    ]
+
+
+def cases() -> list[str]:
+    """Return the names of the benchmarked calls."""
+    return [case.name for case in _cases()]
+
+
+class _Timer:
+    """Time spent in the outermost of nested calls of wrapped functions."""
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self._depth = 0
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self._depth:
+                return func(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.total += time.perf_counter() - start
+                self._depth -= 1
+
+        return wrapper
+
+
+@contextmanager
+def _stage_timers() -> Iterator[dict[str, _Timer]]:
+    """Time the validation of the inputs and the compiled kernels.
+
+    The ``__post_init__`` methods of the input classes and the kernels referenced
+    by the modules of the package are replaced by timed wrappers until the end
+    of the block. numba cannot compile a kernel that calls a wrapper, so all the
+    kernels used in the block must already be compiled.
+    """
+    from pythermalcomfort.classes_input import BaseInputs
+    from pythermalcomfort.warmup import _py_func
+
+    timers = {"validation": _Timer(), "kernel": _Timer()}
+    patched: list[tuple[Any, str, Any]] = []
+    classes = [BaseInputs]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        if "__post_init__" in vars(cls):
+            patched.append((cls, "__post_init__", vars(cls)["__post_init__"]))
+    for name, module in list(sys.modules.items()):
+        if name.startswith("pythermalcomfort.") and module is not None:
+            patched.extend(
+                (module, attr, value)
+                for attr, value in list(vars(module).items())
+                if _py_func(value) is not None
+            )
+
+    for owner, attr, value in patched:
+        timer = timers["validation" if isinstance(owner, type) else "kernel"]
+        setattr(owner, attr, timer.wrap(value))
+    try:
+        yield timers
+    finally:
+        for owner, attr, value in patched:
+            setattr(owner, attr, value)
+
+
+def _fastest(
+    case: _Case, inputs: dict[str, Any], best: dict[str, float] | None
+) -> dict[str, float]:
+    """Time one call and return its times if it is faster than `best`."""
+    with _stage_timers() as timers:
+        start = time.perf_counter()
+        case.call(**inputs)
+        total = time.perf_counter() - start
+    if best is not None and best["total_s"] <= total:
+        return best
+    return {
+        "total_s": total,
+        "validation_s": timers["validation"].total,
+        "kernel_s": timers["kernel"].total,
+    }
+
+
+def _inputs(case: _Case, size: int | None, rng: np.random.Generator) -> dict[str, Any]:
+    def draw(low: float, high: float) -> Any:
+        if size is None:
+            return float(rng.uniform(low, high))
+        return rng.uniform(low, high, size)
+
+    return case.inputs(draw)
+
+
+def _time_case(
+    case: _Case, size: int | None, repeat: int, rng: np.random.Generator
+) -> dict[str, Any]:
+    inputs = _inputs(case, size, rng)
+    with warnings.catch_warnings():
+        # some random inputs are outside the applicability limits
+        warnings.simplefilter("ignore")
+        # the first call loads or compiles the kernels, it is not timed and the
+        # kernels must not be compiled while they are replaced by the timers
+        case.call(**inputs)
+        best = _fastest(case, inputs, None)
+        for _ in range(repeat - 1):
+            best = _fastest(case, inputs, best)
+    best["post_processing_s"] = max(
+        best["total_s"] - best["validation_s"] - best["kernel_s"], 0.0
+    )
+    n_elements = 1 if size is None else size
+    return {
+        "case": case.name,
+        "size": "scalar" if size is None else size,
+        "params": dict(case.params),
+        "repeat": repeat,
+        **best,
+        "ns_per_element": best["total_s"] / n_elements * 1e9,
+    }
+
+
+def _measure_case(
+    case: _Case, size: int | None, rng: np.random.Generator
+) -> dict[str, Any]:
+    inputs = _inputs(case, size, rng)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        # the memory used to load or compile the kernels is not measured
+        case.call(**inputs)
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            case.call(**inputs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+    peak_bytes = max(peak - start, 0)
+    n_elements = 1 if size is None else size
+    return {
+        "case": case.name,
+        "size": "scalar" if size is None else size,
+        "params": dict(case.params),
+        "peak_bytes": peak_bytes,
+        "bytes_per_element": peak_bytes / n_elements,
+    }
+
+
+def run(
+    names: Sequence[str] | None = None,
+    sizes: Sequence[int | None] = SIZES,
+    repeat: int = 3,
+    seed: int = 0,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+    memory: bool = False,
+) -> dict[str, Any]:
+    """Time the models, or measure their memory, at several input sizes.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        Calls to benchmark, see :py:func:`cases`. Defaults to all of them.
+    sizes : list of int or None, optional
+        Numbers of elements of the inputs, None for scalar inputs. Defaults to
+        scalar, 1e3, 1e5 and 1e7. The models that solve each element with Python
+        code are skipped above a smaller size, JOS3 is only run with scalar
+        inputs.
+    repeat : int, optional
+        Number of timed calls, the fastest one is reported. Defaults to 3. It is
+        not used with `memory`, the allocations do not change between calls.
+    seed : int, optional
+        Seed of the random inputs. Defaults to 0.
+    progress : callable, optional
+        Called with each result as soon as it is available.
+    memory : bool, optional
+        If True, measure the peak of the memory allocated during each call
+        instead of its time. Defaults to False.
+
+    Returns
+    -------
+    dict
+        The environment of the run, its mode, "time" or "memory", and a list of
+        results, one per call and size. In the "time" mode, the results have the
+        total, validation, kernel and post-processing times, [s], of the fastest
+        call and the time per element, [ns]. In the "memory" mode, they have the
+        peak of the allocated memory, `peak_bytes`, and its ratio to the number
+        of elements, `bytes_per_element`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import json
+
+        from pythermalcomfort.benchmark import run
+
+        results = run(["pmv_ppd_iso", "utci"], sizes=[None, 1000])
+        with open("benchmark.json", "w") as f:
+            json.dump(results, f, indent=2)
+
+        memory = run(["pmv_ppd_iso"], sizes=[100_000], memory=True)
+        print(memory["results"][0]["bytes_per_element"])
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be greater than 0")
+    all_cases = {case.name: case for case in _cases()}
+    names = list(all_cases) if names is None else list(names)
+    unknown = [name for name in names if name not in all_cases]
+    if unknown:
+        msg = f"unknown benchmarks {unknown}, choose among {list(all_cases)}"
+        raise ValueError(msg)
+
+    import numba
+
+    rng = np.random.default_rng(seed)
+    results = []
+    for name in names:
+        case = all_cases[name]
+        for size in sizes:
+            limit = case.max_size
+            if size is not None and (limit is None or size > limit):
+                continue
+            if memory:
+                result = _measure_case(case, size, rng)
+            else:
+                result = _time_case(case, size, repeat, rng)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        "pythermalcomfort": pythermalcomfort.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": numba.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "numba_threads": numba.get_num_threads(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mode": "memory" if memory else "time",
+        "results": results,
+    }
+
+
+def _key(result: Mapping[str, Any]) -> tuple[str, str]:
+    return result["case"], str(result["size"])
+
+
+def compare(
+    baseline: Mapping[str, Any],
+    results: Mapping[str, Any],
+    tolerance: float = 0.1,
+) -> list[dict[str, Any]]:
+    """Return the calls that are slower, or use more memory, than in a previous run.
+
+    Parameters
+    ----------
+    baseline : dict
+        Results of the previous run, as returned by :py:func:`run` or read from
+        its JSON file.
+    results : dict
+        Results of the new run, of the same mode as `baseline`.
+    tolerance : float, optional
+        Relative increase of the total time, or of the peak memory, above which
+        a call is a regression. Defaults to 0.1, i.e. 10%.
+
+    Returns
+    -------
+    list of dict
+        The case, the size, the compared metric, `total_s` or `peak_bytes`, its
+        values in both runs and their ratio for each regression.
+    """
+    mode = results.get("mode", "time")
+    if baseline.get("mode", "time") != mode:
+        msg = (
+            f"cannot compare a {mode} run with a {baseline.get('mode', 'time')} "
+            "baseline"
+        )
+        raise ValueError(msg)
+    metric = _METRICS[mode]
+    previous = {_key(r): r[metric] for r in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        before = previous.get(_key(result))
+        if before is None or before == 0:
+            continue
+        ratio = result[metric] / before
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    "case": result["case"],
+                    "size": result["size"],
+                    "metric": metric,
+                    "baseline": before,
+                    "value": result[metric],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def load(path: str | Path) -> dict[str, Any]:
+    """Read the results saved in a JSON file."""
+    with open(path) as f:
+        return json.load(f)
@@ -559,6 +559,37 @@ class NETInputs(BaseInputs):
         )
 
 
+@dataclass
+class OutdoorIndicesInputs(BaseInputs):
+    def __init__(
+        self,
+        tdb,
+        rh,
+        v=None,
+        q=None,
+        sol_radiation_global=None,
+        round_output=True,
+        limit_inputs=True,
+    ):
+        # Initialize with only required fields, setting others to None
+        super().__init__(
+            tdb=tdb,
+            rh=rh,
+            v=v,
+            q=q,
+            sol_radiation_global=sol_radiation_global,
+            round_output=round_output,
+            limit_inputs=limit_inputs,
+        )
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        rh = np.asarray(self.rh, dtype=float)
+        if np.any(rh < 0) or np.any(rh > 100):
+            raise ValueError("Relative humidity must be between 0 and 100 %")
+
+
 @dataclass
 class PETSteadyInputs(BaseInputs):
     def __init__(
@@ -331,6 +331,45 @@ class NET(AutoStrMixin):
     net: float | list[float]
 
 
+@dataclass(frozen=True, repr=False)
+class OutdoorIndices(AutoStrMixin):
+    """Dataclass to represent the closed-form outdoor heat and cold stress indices.
+
+    Only the requested indices are calculated, the others are None.
+
+    Attributes
+    ----------
+    at : float or list of floats, optional
+        Apparent Temperature, [°C].
+    humidex : float or list of floats, optional
+        Humidex (Rana et al. model), [°C].
+    hi : float or list of floats, optional
+        Heat Index (Rothfusz model), [°C].
+    di : float or list of floats, optional
+        Discomfort Index, [°C].
+    thi : float or list of floats, optional
+        Temperature-Humidity Index.
+    wci : float or list of floats, optional
+        Wind Chill Index, [W/m2].
+    wct : float or list of floats, optional
+        Wind Chill Temperature, [°C].
+    net : float or list of floats, optional
+        Normal Effective Temperature, [°C].
+    esi : float or list of floats, optional
+        Environmental Stress Index.
+    """
+
+    at: float | list[float] | None = None
+    humidex: float | list[float] | None = None
+    hi: float | list[float] | None = None
+    di: float | list[float] | None = None
+    thi: float | list[float] | None = None
+    wci: float | list[float] | None = None
+    wct: float | list[float] | None = None
+    net: float | list[float] | None = None
+    esi: float | list[float] | None = None
+
+
 @dataclass(frozen=True, repr=False)
 class PETSteady(AutoStrMixin):
     """Dataclass to represent the Physiological Equivalent Temperature (PET).
@@ -14,17 +14,347 @@ Why does this file exist, and why not put this in __main__?
   Also see (1) from http://click.pocoo.org/5/setuptools/#setuptools-integration
 """
 
+from __future__ import annotations
+
+import argparse
 import sys
 
+from pythermalcomfort import __version__
+from pythermalcomfort.utilities import Units
+
+
+def _constant(text: str) -> tuple[str, float | str]:
+    """Parse a ``name=value`` constant input."""
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        msg = f"expected name=value, got '{text}'"
+        raise argparse.ArgumentTypeError(msg)
+    try:
+        return name, float(value)
+    except ValueError:
+        return name, value
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        msg = f"expected a positive integer, got {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return value
+
+
+def _compute(args: argparse.Namespace) -> int:
+    from pythermalcomfort.batch import evaluate_chunks, read_chunks, write_chunks
+
+    chunks = read_chunks(args.input, chunk_size=args.chunk_size)
+    results = evaluate_chunks(
+        chunks,
+        args.models,
+        workers=args.workers,
+        units=args.units,
+        chunk_size=args.chunk_size,
+        **dict(args.constants),
+    )
+    if write_chunks(results, args.output) == 0:
+        raise ValueError("the input has no rows")
+    return 0
+
+
+def _non_negative_float(text: str) -> float:
+    value = float(text)
+    if value < 0:
+        msg = f"expected a non-negative number, got {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return value
+
+
+def _serve(args: argparse.Namespace) -> int:
+    import asyncio
+
+    from pythermalcomfort.server import ComfortServer
+
+    server = ComfortServer(
+        args.models, max_delay=args.max_delay / 1000, max_batch_size=args.max_batch_size
+    )
+    print(f"Serving on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _warmup(args: argparse.Namespace) -> int:
+    from pythermalcomfort.warmup import warmup
+
+    print(warmup())
+    return 0
+
+
+def _size(text: str) -> int | None:
+    if text == "scalar":
+        return None
+    try:
+        value = float(text)
+    except ValueError:
+        value = 0
+    if value < 1 or value != int(value):
+        msg = f"expected 'scalar' or a positive number of elements, got {text}"
+        raise argparse.ArgumentTypeError(msg)
+    return int(value)
+
+
+def _benchmark(args: argparse.Namespace) -> int:
+    import json
+
+    from pythermalcomfort.benchmark import compare, load, run
+
+    baseline = load(args.compare) if args.compare is not None else None
+    if args.memory:
+        header = f"{'case':<48} {'size':>10} {'peak KiB':>12} {'bytes/elem.':>12}"
+    else:
+        header = (
+            f"{'case':<48} {'size':>10} {'total ms':>10} {'valid. ms':>10} "
+            f"{'kernel ms':>10} {'post ms':>10} {'ns/elem.':>10}"
+        )
+    print(header)
+
+    def progress(result: dict) -> None:
+        if args.memory:
+            values = (
+                f"{result['peak_bytes'] / 1024:>12.1f} "
+                f"{result['bytes_per_element']:>12.1f}"
+            )
+        else:
+            times = [
+                result[key] * 1000
+                for key in ("total_s", "validation_s", "kernel_s", "post_processing_s")
+            ]
+            values = " ".join(f"{value:>10.3f}" for value in times)
+            values += f" {result['ns_per_element']:>10.1f}"
+        print(f"{result['case']:<48} {result['size']!s:>10} {values}", flush=True)
+
+    results = run(
+        args.benchmarks,
+        sizes=args.sizes,
+        repeat=args.repeat,
+        progress=progress,
+        memory=args.memory,
+    )
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is None:
+        return 0
+    regressions = compare(baseline, results, tolerance=args.tolerance)
+    for r in regressions:
+        if r["metric"] == "peak_bytes":
+            change = f"{r['baseline'] / 1024:.1f} KiB -> {r['value'] / 1024:.1f} KiB"
+        else:
+            change = f"{r['baseline'] * 1000:.3f} ms -> {r['value'] * 1000:.3f} ms"
+        print(
+            f"regression: {r['case']} size {r['size']}: {change} ({r['ratio']:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
 
-def main(argv=sys.argv):
-    """Print command line arguments and return an exit code.
+
+def _build_parser() -> argparse.ArgumentParser:
+    from pythermalcomfort.batch import INDICES
+
+    parser = argparse.ArgumentParser(
+        prog="pythermalcomfort",
+        description="Thermal comfort and heat stress calculations.",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compute = commands.add_parser(
+        "compute",
+        help="compute models over a CSV or Parquet table",
+        description=(
+            "Compute one or more models over a CSV or Parquet table, reading and "
+            "writing it in chunks of rows. The columns must be named as the inputs "
+            "of the models, e.g. tdb, tr, v, rh, met, clo. The output contains the "
+            "input columns followed by one column per model output."
+        ),
+    )
+    compute.add_argument("input", help="input .csv or .parquet file, - for stdin")
+    compute.add_argument(
+        "-m",
+        "--models",
+        nargs="+",
+        required=True,
+        choices=INDICES,
+        metavar="MODEL",
+        help=f"models to compute, choose among: {', '.join(INDICES)}",
+    )
+    compute.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="output .csv or .parquet file, - for stdout (default)",
+    )
+    compute.add_argument(
+        "--units",
+        default=Units.SI.value,
+        type=str.upper,
+        choices=[Units.SI.value, Units.IP.value],
+        help="units of the inputs, the results are in SI units (default: SI)",
+    )
+    compute.add_argument(
+        "--set",
+        dest="constants",
+        action="append",
+        default=[],
+        type=_constant,
+        metavar="NAME=VALUE",
+        help="input that is the same for all the rows, e.g. --set met=1.2",
+    )
+    compute.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=65_536,
+        help="number of rows read, computed and written at a time (default: 65536)",
+    )
+    compute.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of processes computing the chunks in parallel (default: 1)",
+    )
+    compute.set_defaults(func=_compute)
+
+    serve = commands.add_parser(
+        "serve",
+        help="serve the models over HTTP with micro-batching",
+        description=(
+            "Serve the models over a local HTTP/JSON API. POST the inputs of a "
+            "model as a JSON object to /models/<model>. The requests for the same "
+            "model received within --max-delay milliseconds are computed together. "
+            "GET /metrics returns the throughput and latency of each model."
+        ),
+    )
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)"
+    )
+    serve.add_argument(
+        "--port", type=int, default=8000, help="port to listen on (default: 8000)"
+    )
+    serve.add_argument(
+        "-m",
+        "--models",
+        nargs="+",
+        default=None,
+        choices=INDICES,
+        metavar="MODEL",
+        help="models to serve (default: all)",
+    )
+    serve.add_argument(
+        "--max-delay",
+        type=_non_negative_float,
+        default=2.0,
+        help="milliseconds a request waits for others to batch with (default: 2)",
+    )
+    serve.add_argument(
+        "--max-batch-size",
+        type=_positive_int,
+        default=65_536,
+        help="number of rows that triggers a batch immediately (default: 65536)",
+    )
+    serve.set_defaults(func=_serve)
+
+    warmup = commands.add_parser(
+        "warmup",
+        help="compile the kernels of the models into the cache",
+        description=(
+            "Load or compile all the compiled kernels of the models and report "
+            "which ones were loaded from the cache and which ones were compiled. "
+            "Run it when a container image is built, so the processes started "
+            "from the image do not compile the kernels again. The cache is "
+            "stored in $PYTHERMALCOMFORT_CACHE_DIR if it is set, otherwise next to "
+            "the package."
+        ),
+    )
+    warmup.set_defaults(func=_warmup)
+
+    benchmark = commands.add_parser(
+        "benchmark",
+        help="time the models at several input sizes",
+        description=(
+            "Time each model on random inputs of several sizes and split the time "
+            "in input validation, compiled kernels and post-processing, or measure "
+            "the peak of the memory allocated with --memory. The results can be "
+            "saved as JSON and compared with a previous run, the exit code is 1 "
+            "if a call is slower, or uses more memory, than in that run."
+        ),
+    )
+    benchmark.add_argument(
+        "-b",
+        "--benchmarks",
+        nargs="+",
+        default=None,
+        metavar="NAME",
+        help="calls to time, e.g. pmv_ppd_iso or 'phs[duration=60]' (default: all)",
+    )
+    benchmark.add_argument(
+        "--sizes",
+        nargs="+",
+        type=_size,
+        default=[None, 1_000, 100_000, 10_000_000],
+        metavar="SIZE",
+        help="numbers of elements, or 'scalar' (default: scalar 1e3 1e5 1e7)",
+    )
+    benchmark.add_argument(
+        "--repeat",
+        type=_positive_int,
+        default=3,
+        help="timed calls of each benchmark, the fastest is kept (default: 3)",
+    )
+    benchmark.add_argument(
+        "-o", "--output", default=None, help="JSON file where the results are saved"
+    )
+    benchmark.add_argument(
+        "--compare",
+        default=None,
+        metavar="BASELINE",
+        help="JSON file of a previous run to compare the results with",
+    )
+    benchmark.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure the peak memory allocated by each call instead of its time",
+    )
+    benchmark.add_argument(
+        "--tolerance",
+        type=_non_negative_float,
+        default=0.1,
+        help=(
+            "relative slow-down, or memory increase, reported as a regression "
+            "(default: 0.1)"
+        ),
+    )
+    benchmark.set_defaults(func=_benchmark)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line app and return an exit code.
 
     Args:
-        argv (list): List of command line arguments.
+        argv (list): List of command line arguments, without the program name.
+            Defaults to the arguments of the current process.
 
     Returns:
         int: Exit code.
     """
-    print(argv)
-    return 0
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (KeyError, ValueError, ImportError, OSError) as e:
+        message = e.args[0] if isinstance(e, KeyError) else e
+        parser.exit(1, f"{parser.prog}: error: {message}\n")
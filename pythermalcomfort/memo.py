@@ -0,0 +1,285 @@
+"""Opt-in memoization of the expensive models.
+
+Sensor and survey data repeat the same inputs many times, e.g. temperatures
+quantised to 0.1 °C and the few values of the metabolic rate and the clothing
+insulation. Within a :py:func:`memoize` block the models
+
+* :py:func:`~pythermalcomfort.models.set_tmp`,
+* :py:func:`~pythermalcomfort.models.cooling_effect`,
+* :py:func:`~pythermalcomfort.models.pet_steady`,
+* :py:func:`~pythermalcomfort.models.heat_index_lu`,
+* :py:func:`~pythermalcomfort.models.utci`,
+* :py:func:`~pythermalcomfort.models.phs`
+
+compute each distinct row of their broadcast inputs once, found with
+:py:func:`numpy.unique`, and copy the results to the repeated rows. The
+results of the rows are kept in a :py:class:`MemoCache`, a bounded least
+recently used cache, so the rows computed by a previous call are not computed
+again. The same cache can be used by several blocks, e.g. by the requests of a
+long-running service.
+
+The float inputs can be rounded to a number of decimals before they are
+compared, see :py:class:`MemoCache`, the models then compute the rounded
+inputs. Otherwise only identical rows are shared and the results are the same
+as without memoization.
+
+The calls within a :py:func:`~pythermalcomfort.solvers.diagnostics` or
+:py:func:`~pythermalcomfort.solvers.nan_on_failure` block are not memoized,
+since their reports refer to each element of the inputs, and neither are the
+models called by a memoized model, e.g. :py:func:`~pythermalcomfort.models.set_tmp`
+by :py:func:`~pythermalcomfort.models.cooling_effect`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+import numpy as np
+
+from pythermalcomfort.precision import current
+from pythermalcomfort.profiling import lap
+from pythermalcomfort.solvers import recording, returning_nan
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class MemoCache:
+    """Least recently used cache of the results of the rows of the models.
+
+    It can be shared by threads.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of rows kept, the least recently used rows are dropped
+        first. Defaults to 100000.
+    decimals : int, optional
+        Number of decimals the float inputs are rounded to, e.g. 1 for
+        temperatures measured to 0.1 °C. Defaults to None, the inputs are
+        not rounded.
+
+    Attributes
+    ----------
+    hits : int
+        Number of distinct rows found in the cache.
+    misses : int
+        Number of distinct rows computed.
+    """
+
+    def __init__(self, maxsize: int = 100_000, decimals: int | None = None) -> None:
+        if maxsize < 1:
+            msg = f"maxsize should be at least 1, got {maxsize}."
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._rows: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def clear(self) -> None:
+        """Drop all the rows and reset the counters."""
+        with self._lock:
+            self._rows.clear()
+            self.hits = self.misses = 0
+
+    def _quantise(self, values: np.ndarray) -> np.ndarray:
+        if self.decimals is not None and values.dtype.kind == "f":
+            return np.round(values, self.decimals)
+        return values
+
+    def _get(self, keys: list[tuple]) -> list[Any]:
+        """Return the values of `keys`, None for the ones that are not cached."""
+        with self._lock:
+            values = []
+            for key in keys:
+                value = self._rows.get(key)
+                if value is not None:
+                    self._rows.move_to_end(key)
+                values.append(value)
+            hits = sum(value is not None for value in values)
+            self.hits += hits
+            self.misses += len(keys) - hits
+            return values
+
+    def _put(self, keys: list[tuple], values: list[Any]) -> None:
+        with self._lock:
+            for key, value in zip(keys, values, strict=True):
+                self._rows[key] = value
+                self._rows.move_to_end(key)
+            while len(self._rows) > self.maxsize:
+                self._rows.popitem(last=False)
+
+
+_cache: contextvars.ContextVar[MemoCache | None] = contextvars.ContextVar(
+    "pythermalcomfort_memo_cache", default=None
+)
+
+
+def _compute(func: Callable[..., Any], arguments: dict[str, Any]) -> Any:
+    """Call `func` with memoization disabled for the models it calls."""
+    token = _cache.set(None)
+    try:
+        return func(**arguments)
+    finally:
+        _cache.reset(token)
+
+
+def memoized(func: _F) -> _F:
+    """Compute each distinct row of the inputs of a model once in a :py:func:`memoize` block."""
+    signature = inspect.signature(func)
+    name = func.__qualname__
+    # dataclass of the results and its fields that are the same for all the
+    # elements, e.g. None, known once a row is computed
+    result_type = None
+    constants: dict[str, Any] = {}
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal result_type, constants
+        cache = _cache.get()
+        if cache is None or recording() or returning_nan():
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {}
+        for key, value in bound.arguments.items():
+            kind = signature.parameters[key].kind
+            if kind is inspect.Parameter.VAR_KEYWORD:
+                arguments.update(value)
+            elif kind is inspect.Parameter.VAR_POSITIONAL:
+                return func(*args, **kwargs)
+            else:
+                arguments[key] = value
+
+        # the inputs with one value per element, the others are the same for all
+        arrays, scalars = {}, {}
+        for key, value in arguments.items():
+            array = np.asarray(value)
+            if value is None or isinstance(value, (bool, str)):
+                scalars[key] = value
+            elif array.dtype.kind == "O":
+                return func(*args, **kwargs)
+            elif array.ndim:
+                arrays[key] = array
+            elif array.dtype.kind == "f":
+                scalars[key] = cache._quantise(array).item()
+            else:
+                scalars[key] = value
+        try:
+            shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+        except ValueError:
+            # the model raises its own error
+            return func(*args, **kwargs)
+        if 0 in shape:
+            return func(*args, **kwargs)
+        prefix = (name, current(), *scalars.items())
+
+        if not arrays:
+            # the whole result is cached
+            (result,) = cache._get([prefix])
+            lap("memoization")
+            if result is None:
+                result = _compute(func, scalars)
+                cache._put([prefix], [result])
+            return result
+
+        columns = {
+            key: cache._quantise(np.ravel(np.broadcast_to(a, shape)))
+            for key, a in arrays.items()
+        }
+        codes = np.stack(
+            [np.unique(c, return_inverse=True)[1].ravel() for c in columns.values()],
+            axis=1,
+        )
+        _, first, inverse = np.unique(
+            codes, axis=0, return_index=True, return_inverse=True
+        )
+        unique = {key: c[first] for key, c in columns.items()}
+        keys = [
+            (*prefix, *(unique[key][i].item() for key in unique))
+            for i in range(first.size)
+        ]
+        rows = cache._get(keys)
+        missing = [i for i, row in enumerate(rows) if row is None]
+        lap("memoization")
+
+        if missing:
+            result = _compute(
+                func,
+                {**scalars, **{key: c[missing] for key, c in unique.items()}},
+            )
+            result_type = type(result)
+            values = {
+                field.name: getattr(result, field.name)
+                for field in dataclasses.fields(result)
+            }
+            # the outputs have one value per element, as the inputs are arrays
+            constants = {k: v for k, v in values.items() if not np.ndim(v)}
+            computed = [
+                {k: v[j] for k, v in values.items() if k not in constants}
+                for j in range(len(missing))
+            ]
+            cache._put([keys[i] for i in missing], computed)
+            for i, row in zip(missing, computed, strict=True):
+                rows[i] = row
+
+        output = dict(constants)
+        for key in rows[0]:
+            column = np.array([row[key] for row in rows])
+            output[key] = column[inverse.ravel()].reshape(shape + column.shape[1:])
+        lap("memoization")
+        return result_type(**output)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def memoize(cache: MemoCache | None = None) -> Iterator[MemoCache]:
+    """Compute each distinct row of the inputs of the expensive models once.
+
+    Parameters
+    ----------
+    cache : MemoCache, optional
+        Cache of the rows, e.g. kept by a service across its requests.
+        Defaults to a new cache with the default size that does not round
+        the inputs.
+
+    Yields
+    ------
+    MemoCache
+        The cache used in the block, with the counts of the rows found in it
+        and computed.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+
+        from pythermalcomfort.memo import MemoCache, memoize
+        from pythermalcomfort.models import utci
+
+        tdb = np.array([25.04, 25.02, 30.0, 25.0])
+        with memoize(MemoCache(decimals=1)) as cache:
+            result = utci(tdb=tdb, tr=tdb, v=1, rh=50)
+        print(cache.misses, cache.hits)  # 2 0, two distinct rows are computed
+    """
+    if cache is None:
+        cache = MemoCache()
+    token = _cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _cache.reset(token)
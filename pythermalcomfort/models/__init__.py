@@ -1,41 +1,99 @@
-from .adaptive_ashrae import adaptive_ashrae
-from .adaptive_en import adaptive_en
-from .ankle_draft import ankle_draft
-from .at import at
-from .clo_tout import clo_tout
-from .cooling_effect import cooling_effect
-from .discomfort_index import discomfort_index
-from .esi import esi
-from .heat_index_lu import heat_index_lu
-from .heat_index_rothfusz import heat_index_rothfusz
-from .humidex import humidex
-from .jos3 import JOS3
-from .net import net
-from .pet_steady import pet_steady
-from .phs import phs
-from .pmv_a import pmv_a
-from .pmv_athb import pmv_athb
-from .pmv_e import pmv_e
-from .pmv_ppd_ashrae import pmv_ppd_ashrae
-from .pmv_ppd_iso import pmv_ppd_iso
-from .ridge_regression_predict_t_re_t_sk import ridge_regression_predict_t_re_t_sk
-from .set_tmp import set_tmp
-from .solar_gain import solar_gain
-from .sports_heat_stress_risk import Sports, sports_heat_stress_risk
-from .thi import thi
-from .two_nodes_gagge import two_nodes_gagge
-from .two_nodes_gagge_ji import two_nodes_gagge_ji
-from .two_nodes_gagge_sleep import two_nodes_gagge_sleep
-from .use_fans_heatwaves import use_fans_heatwaves
-from .utci import utci
-from .vertical_tmp_grad_ppd import vertical_tmp_grad_ppd
-from .wbgt import wbgt
-from .wci import wci
-from .wind_chill_temperature import wind_chill_temperature
-from .work_capacity_dunne import work_capacity_dunne
-from .work_capacity_hothaps import work_capacity_hothaps
-from .work_capacity_iso import work_capacity_iso
-from .work_capacity_niosh import work_capacity_niosh
+"""Thermal comfort models.
+
+The models are imported on first access, e.g. ``from pythermalcomfort.models import
+utci`` imports only the modules that UTCI needs, so the modules and the compiled
+kernels of the other models are not loaded.
+"""
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .adaptive_ashrae import adaptive_ashrae
+    from .adaptive_en import adaptive_en
+    from .ankle_draft import ankle_draft
+    from .at import at
+    from .clo_tout import clo_tout
+    from .cooling_effect import cooling_effect
+    from .discomfort_index import discomfort_index
+    from .esi import esi
+    from .heat_index_lu import heat_index_lu
+    from .heat_index_rothfusz import heat_index_rothfusz
+    from .humidex import humidex
+    from .jos3 import JOS3
+    from .net import net
+    from .outdoor_indices import outdoor_indices
+    from .pet_steady import pet_steady
+    from .phs import phs
+    from .pmv_a import pmv_a
+    from .pmv_athb import pmv_athb
+    from .pmv_e import pmv_e
+    from .pmv_ppd_ashrae import pmv_ppd_ashrae
+    from .pmv_ppd_iso import pmv_ppd_iso
+    from .ridge_regression_predict_t_re_t_sk import ridge_regression_predict_t_re_t_sk
+    from .set_tmp import set_tmp
+    from .solar_gain import solar_gain
+    from .sports_heat_stress_risk import Sports, sports_heat_stress_risk
+    from .thi import thi
+    from .two_nodes_gagge import two_nodes_gagge
+    from .two_nodes_gagge_ji import two_nodes_gagge_ji
+    from .two_nodes_gagge_sleep import two_nodes_gagge_sleep
+    from .use_fans_heatwaves import use_fans_heatwaves
+    from .utci import utci
+    from .vertical_tmp_grad_ppd import vertical_tmp_grad_ppd
+    from .wbgt import wbgt
+    from .wci import wci
+    from .wind_chill_temperature import wind_chill_temperature
+    from .work_capacity_dunne import work_capacity_dunne
+    from .work_capacity_hothaps import work_capacity_hothaps
+    from .work_capacity_iso import work_capacity_iso
+    from .work_capacity_niosh import work_capacity_niosh
+
+# name of the module defining each public object
+_MODULES = {
+    "JOS3": "jos3",
+    "Sports": "sports_heat_stress_risk",
+    "adaptive_ashrae": "adaptive_ashrae",
+    "adaptive_en": "adaptive_en",
+    "ankle_draft": "ankle_draft",
+    "at": "at",
+    "clo_tout": "clo_tout",
+    "cooling_effect": "cooling_effect",
+    "discomfort_index": "discomfort_index",
+    "esi": "esi",
+    "heat_index_lu": "heat_index_lu",
+    "heat_index_rothfusz": "heat_index_rothfusz",
+    "humidex": "humidex",
+    "net": "net",
+    "outdoor_indices": "outdoor_indices",
+    "pet_steady": "pet_steady",
+    "phs": "phs",
+    "pmv_a": "pmv_a",
+    "pmv_athb": "pmv_athb",
+    "pmv_e": "pmv_e",
+    "pmv_ppd_ashrae": "pmv_ppd_ashrae",
+    "pmv_ppd_iso": "pmv_ppd_iso",
+    "ridge_regression_predict_t_re_t_sk": "ridge_regression_predict_t_re_t_sk",
+    "set_tmp": "set_tmp",
+    "solar_gain": "solar_gain",
+    "sports_heat_stress_risk": "sports_heat_stress_risk",
+    "thi": "thi",
+    "two_nodes_gagge": "two_nodes_gagge",
+    "two_nodes_gagge_ji": "two_nodes_gagge_ji",
+    "two_nodes_gagge_sleep": "two_nodes_gagge_sleep",
+    "use_fans_heatwaves": "use_fans_heatwaves",
+    "utci": "utci",
+    "vertical_tmp_grad_ppd": "vertical_tmp_grad_ppd",
+    "wbgt": "wbgt",
+    "wci": "wci",
+    "wind_chill_temperature": "wind_chill_temperature",
+    "work_capacity_dunne": "work_capacity_dunne",
+    "work_capacity_hothaps": "work_capacity_hothaps",
+    "work_capacity_iso": "work_capacity_iso",
+    "work_capacity_niosh": "work_capacity_niosh",
+}
 
 __all__ = [
     "JOS3",
@@ -52,6 +110,7 @@ __all__ = [
     "heat_index_rothfusz",
     "humidex",
     "net",
+    "outdoor_indices",
     "pet_steady",
     "phs",
     "pmv_a",
@@ -78,3 +137,35 @@ __all__ = [
     "work_capacity_iso",
     "work_capacity_niosh",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model on first access."""
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _ModelsModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # importing a submodule sets it as an attribute of this package, most of
+        # them have the name of their model, which must not be shadowed
+        if (
+            isinstance(value, types.ModuleType)
+            and _MODULES.get(name) == name
+            and value.__name__ == f"{__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ModelsModule
@@ -0,0 +1,95 @@
+"""Applicability limits of the standards evaluated inside the compiled kernels.
+
+These scalar predicates mirror the limits applied by
+:py:func:`pythermalcomfort.utilities._check_standard_compliance_array` but they
+are compiled with numba so that the model kernels can short-circuit rows that
+are outside the applicability limits before running any iterative solver,
+without allocating one masked array per input.
+
+A NaN input is never within the limits, as it happens with
+:py:func:`pythermalcomfort.shared_functions.valid_range`.
+"""
+
+import math
+
+from numba import boolean, float64, jit, vectorize
+
+
+@jit(nopython=True, cache=True)
+def _within(x, lower, upper):
+    return lower <= x <= upper
+
+
+@jit(nopython=True, cache=True)
+def _iso_7730_2005_valid(tdb, tr, v, met, clo):
+    """Check the ISO 7730:2005 limits, see page 3 of the standard."""
+    return (
+        _within(tdb, 10.0, 30.0)
+        and _within(tr, 10.0, 40.0)
+        and _within(v, 0.0, 1.0)
+        and _within(met, 0.8, 4.0)
+        and _within(clo, 0.0, 2.0)
+    )
+
+
+@jit(nopython=True, cache=True)
+def _ashrae_55_2023_valid(tdb, tr, v, met, clo, airspeed_control):
+    """Check the ASHRAE 55:2023 limits, based on table 7.3.4 of the standard."""
+    if not (
+        _within(tdb, 10.0, 40.0)
+        and _within(tr, 10.0, 40.0)
+        and _within(v, 0.0, 2.0)
+        and _within(met, 1.0, 4.0)
+        and _within(clo, 0.0, 1.5)
+    ):
+        return False
+
+    if airspeed_control or clo >= 0.7 or met >= 1.3:
+        return True
+
+    # occupants without control over the air speed, ASHRAE 55 section 5.3.3
+    if v > 0.8:
+        return False
+    to = (tdb * math.sqrt(10 * v) + tr) / (1 + math.sqrt(10 * v))
+    if to <= 23:
+        return v <= 0.2
+    if to < 25.5:
+        v_limit = 50.49 - 4.4047 * to + 0.096425 * to * to
+        return v <= v_limit
+    return True
+
+
+@jit(nopython=True, cache=True)
+def _iso_7933_valid(tdb, tr, v, p_a, met, clo, p_a_min):
+    """Check the ISO 7933 limits, see Annex A of the standard.
+
+    The 2004 and 2023 versions only differ in the lower limit of the partial
+    vapour pressure, which is passed as ``p_a_min`` [kPa]. The metabolic rate
+    is expressed in [W/m2].
+    """
+    return (
+        _within(tdb, 15.0, 50.0)
+        and _within(p_a, p_a_min, 4.5)
+        and _within(tr, 0.0, 60.0)
+        and _within(v, 0.0, 3.0)
+        and _within(met, 100.0, 450.0)
+        and _within(clo, 0.1, 1.0)
+    )
+
+
+@jit(nopython=True, cache=True)
+def _utci_valid(tdb, tr, v):
+    """Check the UTCI limits of the polynomial approximation."""
+    return (
+        _within(tdb, -50.0, 50.0)
+        and _within(tr - tdb, -30.0, 70.0)
+        and _within(v, 0.5, 17.0)
+    )
+
+
+@vectorize(
+    [boolean(float64, float64, float64, float64, float64, boolean)],
+    cache=True,
+)
+def _ashrae_55_2023_compliance(tdb, tr, v, met, clo, airspeed_control):
+    return _ashrae_55_2023_valid(tdb, tr, v, met, clo, airspeed_control)
@@ -0,0 +1,199 @@
+"""Equations of the closed-form outdoor heat and cold stress indices.
+
+Each equation is a scalar function compiled with numba. The individual models
+call it through a ufunc, and the fused kernel used by
+:py:func:`pythermalcomfort.models.outdoor_indices.outdoor_indices` calls it
+directly, reading each input once per element and writing all the requested
+indices in the same pass.
+"""
+
+import numpy as np
+from numba import float64, jit, vectorize
+
+# position of each index in the rows of the output array of the kernel
+OUTDOOR_INDICES = (
+    "at",
+    "humidex",
+    "hi",
+    "di",
+    "thi",
+    "wci",
+    "wct",
+    "net",
+    "esi",
+)
+_AT, _HUMIDEX, _HI, _DI, _THI, _WCI, _WCT, _NET, _ESI = range(len(OUTDOOR_INDICES))
+
+
+@jit(nopython=True, cache=True)
+def _round(x):
+    """Round to one decimal as numpy.around does."""
+    return np.rint(x * 10.0) / 10.0
+
+
+@jit(nopython=True, cache=True)
+def _at(tdb, p_vap, v, q, with_q):
+    """Apparent temperature, p_vap is the vapour pressure [hPa]."""
+    if with_q:
+        return tdb + 0.348 * p_vap - 0.7 * v + 0.7 * q / (v + 10) - 4.25
+    return tdb + 0.33 * p_vap - 0.7 * v - 4.00
+
+
+@jit(nopython=True, cache=True)
+def _humidex_rana(tdb, rh):
+    return tdb + 5 / 9 * ((6.112 * 10 ** (7.5 * tdb / (237.7 + tdb)) * rh / 100) - 10)
+
+
+@jit(nopython=True, cache=True)
+def _heat_index_rothfusz(tdb, rh):
+    hi = -8.784695 + 1.61139411 * tdb + 2.338549 * rh - 0.14611605 * tdb * rh
+    hi += -1.2308094 * 10**-2 * tdb**2 - 1.6424828 * 10**-2 * rh**2
+    hi += 2.211732 * 10**-3 * tdb**2 * rh + 7.2546 * 10**-4 * tdb * rh**2
+    hi += -3.582 * 10**-6 * tdb**2 * rh**2
+    return hi
+
+
+@jit(nopython=True, cache=True)
+def _discomfort_index(tdb, rh):
+    return tdb - 0.55 * (1 - 0.01 * rh) * (tdb - 14.5)
+
+
+@jit(nopython=True, cache=True)
+def _thi(tdb, rh):
+    return 1.8 * tdb + 32 - 0.55 * (1 - 0.01 * rh) * (1.8 * tdb - 26)
+
+
+@jit(nopython=True, cache=True)
+def _wci(tdb, v):
+    # the factor 1.163 is used to convert to W/m^2
+    return (10.45 + 10 * v**0.5 - v) * (33 - tdb) * 1.163
+
+
+@jit(nopython=True, cache=True)
+def _wct(tdb, v):
+    return 13.12 + 0.6215 * tdb - 11.37 * v**0.16 + 0.3965 * tdb * v**0.16
+
+
+@jit(nopython=True, cache=True)
+def _net(tdb, rh, v):
+    frac = 1.0 / (1.76 + 1.4 * v**0.75)
+    return 37 - (37 - tdb) / (0.68 - 0.0014 * rh + frac) - 0.29 * tdb * (1 - 0.01 * rh)
+
+
+@jit(nopython=True, cache=True)
+def _esi(tdb, rh, sol_radiation_global):
+    return (
+        0.63 * tdb
+        - 0.03 * rh
+        + 0.002 * sol_radiation_global
+        + 0.0054 * (tdb * rh)
+        - 0.073 * (0.1 + sol_radiation_global) ** (-1)
+    )
+
+
+@vectorize([float64(float64, float64, float64, float64, float64)], cache=True)
+def _at_optimized(tdb, p_vap, v, q, with_q):
+    return _at(tdb, p_vap, v, q, with_q != 0)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def _humidex_rana_optimized(tdb, rh):
+    return _humidex_rana(tdb, rh)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def _heat_index_rothfusz_optimized(tdb, rh):
+    return _heat_index_rothfusz(tdb, rh)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def _discomfort_index_optimized(tdb, rh):
+    return _discomfort_index(tdb, rh)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def _thi_optimized(tdb, rh):
+    return _thi(tdb, rh)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def _wci_optimized(tdb, v):
+    return _wci(tdb, v)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def _wct_optimized(tdb, v):
+    return _wct(tdb, v)
+
+
+@vectorize([float64(float64, float64, float64)], cache=True)
+def _net_optimized(tdb, rh, v):
+    return _net(tdb, rh, v)
+
+
+@vectorize([float64(float64, float64, float64)], cache=True)
+def _esi_optimized(tdb, rh, sol_radiation_global):
+    return _esi(tdb, rh, sol_radiation_global)
+
+
+@jit(nopython=True, cache=True)
+def _outdoor_optimized(
+    tdb,
+    rh,
+    p_vap,
+    v,
+    q,
+    sol_radiation_global,
+    codes,
+    with_q,
+    limit_inputs,
+    round_output,
+    out,
+):
+    """Write the indices listed in `codes` into the rows of `out`.
+
+    The inputs are one-dimensional arrays with either one element, which is
+    used for all the rows, or as many elements as the columns of `out`. The
+    vapour pressure `p_vap` [hPa] is only used by the apparent temperature.
+    """
+    n = out.shape[1]
+    for i in range(n):
+        _tdb = tdb[0] if tdb.size == 1 else tdb[i]
+        _rh = rh[0] if rh.size == 1 else rh[i]
+        _p_vap = p_vap[0] if p_vap.size == 1 else p_vap[i]
+        _v = v[0] if v.size == 1 else v[i]
+        _q = q[0] if q.size == 1 else q[i]
+        _sol = (
+            sol_radiation_global[0]
+            if sol_radiation_global.size == 1
+            else sol_radiation_global[i]
+        )
+
+        for row in range(codes.size):
+            code = codes[row]
+            rounded = round_output
+            if code == _AT:
+                value = _at(_tdb, _p_vap, _v, _q, with_q)
+            elif code == _HUMIDEX:
+                value = _humidex_rana(_tdb, _rh)
+            elif code == _HI:
+                # heat index should only be calculated for temperatures above 27 °C
+                if limit_inputs and not _tdb >= 27.0:
+                    value = np.nan
+                else:
+                    value = _heat_index_rothfusz(_tdb, _rh)
+            elif code == _DI:
+                value = _discomfort_index(_tdb, _rh)
+                rounded = True  # the discomfort index is always rounded
+            elif code == _THI:
+                value = _thi(_tdb, _rh)
+            elif code == _WCI:
+                value = _wci(_tdb, _v)
+            elif code == _WCT:
+                value = _wct(_tdb, _v)
+            elif code == _NET:
+                value = _net(_tdb, _rh, _v)
+            else:
+                value = _esi(_tdb, _rh, _sol)
+
+            out[row, i] = _round(value) if rounded else value
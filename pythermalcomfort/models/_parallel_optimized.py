@@ -0,0 +1,71 @@
+"""Compiled kernels that switch to several threads for large arrays.
+
+The ufuncs created by :py:func:`_vectorize_parallel` run on one thread for small
+inputs. When the broadcast inputs have at least ``parallel_threshold()``
+elements they run the same function compiled with ``target="parallel"``, which
+splits the elements between the numba threads. The number of threads is the one
+set with :py:func:`numba.set_num_threads`, at most ``NUMBA_NUM_THREADS``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numba import vectorize
+
+# number of elements above which the kernels run on several threads, it can be
+# changed with the PYTHERMALCOMFORT_PARALLEL_THRESHOLD environment variable or
+# with pythermalcomfort.parallel.threads
+_THRESHOLD: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "pythermalcomfort_parallel_threshold",
+    default=int(os.environ.get("PYTHERMALCOMFORT_PARALLEL_THRESHOLD", 100_000)),
+)
+# the default numba threading layer aborts if two threads launch a parallel
+# kernel at the same time, the other callers run the single-threaded kernel
+_LAUNCH = threading.Lock()
+
+
+def parallel_threshold() -> int:
+    """Return the number of elements above which the kernels use several threads."""
+    return _THRESHOLD.get()
+
+
+class _ParallelUfunc:
+    """A ufunc with a multi-threaded variant compiled on first use."""
+
+    def __init__(self, func: Callable[..., Any], signatures: list[Any]) -> None:
+        self._func = func
+        self._signatures = signatures
+        self._serial = vectorize(signatures, cache=True)(func)
+        self._parallel = None
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args: Any) -> Any:
+        size = max((np.size(arg) for arg in args), default=0)
+        if size < _THRESHOLD.get() or not _LAUNCH.acquire(blocking=False):
+            return self._serial(*args)
+        try:
+            if self._parallel is None:
+                self._parallel = vectorize(self._signatures, target="parallel")(
+                    self._func
+                )
+            return self._parallel(*args)
+        finally:
+            _LAUNCH.release()
+
+
+def _vectorize_parallel(
+    signatures: list[Any],
+) -> Callable[[Callable[..., Any]], _ParallelUfunc]:
+    """Compile a function as :py:func:`numba.vectorize` with a parallel variant."""
+
+    def decorator(func: Callable[..., Any]) -> _ParallelUfunc:
+        return _ParallelUfunc(func, signatures)
+
+    return decorator
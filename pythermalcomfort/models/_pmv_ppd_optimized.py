@@ -1,24 +1,31 @@
 import numpy as np
-from numba import float64, vectorize
+from numba import boolean, float64, int64, jit, vectorize
 
+from pythermalcomfort.models._compliance_optimized import (
+    _ashrae_55_2023_valid,
+    _iso_7730_2005_valid,
+)
+from pythermalcomfort.models._parallel_optimized import _vectorize_parallel
+from pythermalcomfort.models._units_optimized import _f_to_c, _fps_to_ms
+from pythermalcomfort.solvers import record, record_failures, recording, returning_nan
 from pythermalcomfort.utilities import met_to_w_m2
 
+# maximum number of iterations of the clothing surface temperature
+_PMV_MAX_ITERATIONS = 150
+# tolerance of the clothing surface temperature of the "standard" precision
+_PMV_EPS = 0.00015
 
-@vectorize(
-    [
-        float64(
-            float64,
-            float64,
-            float64,
-            float64,
-            float64,
-            float64,
-            float64,
-        ),
-    ],
-    cache=True,
-)
-def _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme):
+
+@jit(nopython=True, cache=True)
+def _pmv_solve(tdb, tr, vr, rh, met, clo, wme, eps=_PMV_EPS, x0=np.nan):
+    """Return the PMV, the iterations and the clothing surface temperature.
+
+    The clothing surface temperature is iterated as the absolute temperature
+    divided by 100, starting from `x0`, e.g. the solution of a similar element,
+    or from the estimate of ISO 7730 if `x0` is nan. The iteration stops when
+    it changes by less than `eps`. If it does not converge it stops after
+    `_PMV_MAX_ITERATIONS` and the PMV and the temperature are nan.
+    """
     pa = rh * 10 * np.exp(16.6536 - 4030.183 / (tdb + 235))
 
     icl = 0.155 * clo  # thermal insulation of the clothing in M2K/W
@@ -42,9 +49,13 @@ def _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme):
     p3 = p1 * 100
     p4 = p1 * taa
     p5 = (308.7 - 0.028 * mw) + (p2 * (tra / 100.0) ** 4)
-    xn = t_cla / 100
-    xf = t_cla / 50
-    eps = 0.00015
+    if np.isnan(x0):
+        xn = t_cla / 100
+        xf = t_cla / 50
+    else:
+        # an estimate away from x0, so that the loop runs at least once
+        xn = x0
+        xf = x0 + 2 * eps
 
     n = 0
     while np.abs(xn - xf) > eps:
@@ -53,8 +64,8 @@ def _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme):
         hc = max(hcn, hcf)
         xn = (p5 + p4 * hc - p2 * xf**4) / (100 + p3 * hc)
         n += 1
-        if n > 150:
-            raise StopIteration("Max iterations exceeded")
+        if n > _PMV_MAX_ITERATIONS:
+            return np.nan, n, np.nan
 
     tcl = 100 * xn - 273
 
@@ -74,4 +85,276 @@ def _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme):
     ts = 0.303 * np.exp(-0.036 * m) + 0.028
     _pmv = ts * (mw - hl1 - hl2 - hl3 - hl4 - hl5 - hl6)
 
+    return _pmv, n, xn
+
+
+@jit(nopython=True, cache=True)
+def _pmv_scalar(tdb, tr, vr, rh, met, clo, wme, nan_on_failure=False, eps=_PMV_EPS):
+    _pmv, n, _ = _pmv_solve(tdb, tr, vr, rh, met, clo, wme, eps)
+    if n > _PMV_MAX_ITERATIONS and not nan_on_failure:
+        raise StopIteration("Max iterations exceeded")
+    return _pmv
+
+
+@_vectorize_parallel(
+    [
+        float64(
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+        ),
+    ],
+)
+def _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme):
+    return _pmv_scalar(tdb, tr, vr, rh, met, clo, wme)
+
+
+@jit(nopython=True, cache=True)
+def _pmv_iso_element(tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, eps, x0):
+    """Return the PMV of ISO 7730, its iterations and clothing surface temperature.
+
+    The inputs outside the applicability limits are not solved, see
+    :py:func:`_pmv_solve`.
+    """
+    if units_ip:
+        tdb = _f_to_c(tdb)
+        tr = _f_to_c(tr)
+        vr = _fps_to_ms(vr)
+
+    if limit_inputs and not _iso_7730_2005_valid(tdb, tr, vr, met, clo):
+        return np.nan, 0, np.nan
+
+    _pmv, n, xn = _pmv_solve(tdb, tr, vr, rh, met, clo, wme, eps, x0)
+
+    if limit_inputs and not -2 <= _pmv <= 2:  # this is the ISO limit
+        return np.nan, n, xn
+    return _pmv, n, xn
+
+
+@_vectorize_parallel(
+    [
+        float64(
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+            boolean,
+            float64,
+        ),
+    ],
+)
+def _pmv_iso_optimized(
+    tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, nan_on_failure, eps
+):
+    _pmv, n, _ = _pmv_iso_element(
+        tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, eps, np.nan
+    )
+    if n > _PMV_MAX_ITERATIONS and not nan_on_failure:
+        raise StopIteration("Max iterations exceeded")
+    return _pmv
+
+
+@jit(nopython=True, cache=True)
+def _pmv_ashrae_element(
+    tdb, tr, vr, rh, met, clo, wme, ce, limit_inputs, airspeed_control, eps, x0
+):
+    """Return the PMV of ASHRAE 55, its iterations and clothing surface temperature.
+
+    The inputs outside the applicability limits are not solved, see
+    :py:func:`_pmv_solve`.
+    """
+    # the applicability limits are checked against the inputs before applying
+    # the cooling effect
+    if limit_inputs and not _ashrae_55_2023_valid(
+        tdb, tr, vr, met, clo, airspeed_control
+    ):
+        return np.nan, 0, np.nan
+
+    # if v_r is higher than 0.1 follow methodology ASHRAE Appendix H, H3
+    if ce > 0:
+        vr = 0.1
+    return _pmv_solve(tdb - ce, tr - ce, vr, rh, met, clo, wme, eps, x0)
+
+
+@_vectorize_parallel(
+    [
+        float64(
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+            boolean,
+            float64,
+        ),
+    ],
+)
+def _pmv_ashrae_optimized(
+    tdb,
+    tr,
+    vr,
+    rh,
+    met,
+    clo,
+    wme,
+    ce,
+    limit_inputs,
+    airspeed_control,
+    nan_on_failure,
+    eps,
+):
+    _pmv, n, _ = _pmv_ashrae_element(
+        tdb, tr, vr, rh, met, clo, wme, ce, limit_inputs, airspeed_control, eps, np.nan
+    )
+    if n > _PMV_MAX_ITERATIONS and not nan_on_failure:
+        raise StopIteration("Max iterations exceeded")
     return _pmv
+
+
+# the iterations of the kernels above, for the solver diagnostics. The inputs
+# that the kernels do not solve have zero iterations
+@vectorize(
+    [int64(float64, float64, float64, float64, float64, float64, float64, float64)],
+    cache=True,
+)
+def _pmv_iterations(tdb, tr, vr, rh, met, clo, wme, eps):
+    return _pmv_solve(tdb, tr, vr, rh, met, clo, wme, eps)[1]
+
+
+@vectorize(
+    [
+        int64(
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+            float64,
+        ),
+    ],
+    cache=True,
+)
+def _pmv_iso_iterations(tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, eps):
+    return _pmv_iso_element(
+        tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, eps, np.nan
+    )[1]
+
+
+@vectorize(
+    [
+        int64(
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+            float64,
+        ),
+    ],
+    cache=True,
+)
+def _pmv_ashrae_iterations(
+    tdb, tr, vr, rh, met, clo, wme, ce, limit_inputs, airspeed_control, eps
+):
+    return _pmv_ashrae_element(
+        tdb, tr, vr, rh, met, clo, wme, ce, limit_inputs, airspeed_control, eps, np.nan
+    )[1]
+
+
+# the kernels above in the warm-start mode: the elements of the raveled inputs
+# are solved in order, each one starting from the clothing surface temperature
+# of the last element that was solved. They return the PMV and the iterations
+@jit(nopython=True, cache=True)
+def _pmv_iso_sequential(tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, eps):
+    pmv = np.empty(tdb.size)
+    iterations = np.empty(tdb.size, dtype=np.int64)
+    x0 = np.nan
+    for i in range(tdb.size):
+        pmv[i], iterations[i], xn = _pmv_iso_element(
+            tdb[i],
+            tr[i],
+            vr[i],
+            rh[i],
+            met[i],
+            clo[i],
+            wme[i],
+            limit_inputs,
+            units_ip,
+            eps,
+            x0,
+        )
+        if not np.isnan(xn):
+            x0 = xn
+    return pmv, iterations
+
+
+@jit(nopython=True, cache=True)
+def _pmv_ashrae_sequential(
+    tdb, tr, vr, rh, met, clo, wme, ce, limit_inputs, airspeed_control, eps
+):
+    pmv = np.empty(tdb.size)
+    iterations = np.empty(tdb.size, dtype=np.int64)
+    x0 = np.nan
+    for i in range(tdb.size):
+        pmv[i], iterations[i], xn = _pmv_ashrae_element(
+            tdb[i],
+            tr[i],
+            vr[i],
+            rh[i],
+            met[i],
+            clo[i],
+            wme[i],
+            ce[i],
+            limit_inputs,
+            airspeed_control,
+            eps,
+            x0,
+        )
+        if not np.isnan(xn):
+            x0 = xn
+    return pmv, iterations
+
+
+def _pmv_warm_start(model: str, kernel, inputs: tuple, *args) -> np.ndarray:
+    """Return the PMV of the broadcast `inputs` computed by a sequential kernel.
+
+    The iterations are recorded for the solver diagnostics. The elements that
+    do not converge raise StopIteration, or are recorded as failures in the
+    nan-on-failure mode.
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in inputs))
+    shape = arrays[0].shape
+    pmv, iterations = kernel(*(np.ravel(a) for a in arrays), *args)
+    pmv, iterations = pmv.reshape(shape)[()], iterations.reshape(shape)
+
+    failed = iterations > _PMV_MAX_ITERATIONS
+    if recording():
+        record(model, "t_cl", iterations, ~failed)
+    if returning_nan():
+        record_failures(model, "t_cl", failed)
+    elif failed.any():
+        raise StopIteration("Max iterations exceeded")
+    return pmv
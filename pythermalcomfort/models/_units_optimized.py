@@ -0,0 +1,28 @@
+"""Unit conversions evaluated inside the compiled kernels.
+
+These scalar functions apply the same affine conversions as
+:py:func:`pythermalcomfort.utilities.units_converter` so that a kernel can
+receive inputs in IP units and convert them element by element, without
+allocating one converted array per input and one for each output. They are
+used by the kernels of :py:func:`pythermalcomfort.models.pmv_ppd_iso.pmv_ppd_iso`
+and :py:func:`pythermalcomfort.models.utci.utci`. The models without a compiled
+kernel, e.g. :py:func:`pythermalcomfort.models.adaptive_ashrae.adaptive_ashrae`,
+keep using :py:func:`pythermalcomfort.utilities.units_converter`.
+"""
+
+from numba import jit
+
+
+@jit(nopython=True, cache=True)
+def _f_to_c(tmp):
+    return (tmp - 32) * 5 / 9
+
+
+@jit(nopython=True, cache=True)
+def _c_to_f(tmp):
+    return (tmp * 9 / 5) + 32
+
+
+@jit(nopython=True, cache=True)
+def _fps_to_ms(v):
+    return v / 3.281
@@ -4,6 +4,7 @@ import numpy as np
 
 from pythermalcomfort.classes_input import ASHRAEInputs
 from pythermalcomfort.classes_return import AdaptiveASHRAE
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.shared_functions import valid_range
 from pythermalcomfort.utilities import (
     Models,
@@ -14,6 +15,7 @@ from pythermalcomfort.utilities import (
 )
 
 
+@profiled
 def adaptive_ashrae(
     tdb: float | list[float],
     tr: float | list[float],
@@ -98,13 +100,17 @@ def adaptive_ashrae(
         v=v,
         units=units,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
     t_running_mean = np.asarray(t_running_mean)
     v = np.asarray(v)
+    lap("array conversion")
     standard = "ashrae"
 
+    # this model has no compiled kernel, the IP inputs and outputs are converted
+    # with one array operation each, as any other step of the model
     if units.upper() == Units.IP.value:
         tdb, tr, t_running_mean, v = units_converter(
             tdb=tdb,
@@ -112,6 +118,7 @@ def adaptive_ashrae(
             tmp_running_mean=t_running_mean,
             v=v,
         )
+    lap("unit conversion")
 
     tdb_valid, tr_valid, v_valid = _check_standard_compliance_array(
         Models.ashrae_55_2023.value,
@@ -120,6 +127,7 @@ def adaptive_ashrae(
         v=v,
     )
     trm_valid = valid_range(t_running_mean, (10.0, 33.5))
+    lap("compliance masking")
 
     to = operative_tmp(tdb, tr, v, standard=standard)
 
@@ -131,6 +139,7 @@ def adaptive_ashrae(
 
     # Relation between comfort and outdoor temperature
     t_cmf = 0.31 * t_running_mean + 17.8
+    lap("kernel")
 
     if limit_inputs:
         all_valid = ~(
@@ -140,8 +149,10 @@ def adaptive_ashrae(
             | np.isnan(trm_valid)
         )
         t_cmf = np.where(all_valid, t_cmf, np.nan)
+    lap("compliance masking")
 
     t_cmf = np.around(t_cmf, 1)
+    lap("rounding")
 
     tmp_cmf_80_low = t_cmf - 3.5
     tmp_cmf_90_low = t_cmf - 2.5
@@ -150,6 +161,7 @@ def adaptive_ashrae(
 
     acceptability_80 = (tmp_cmf_80_low <= to) & (to <= tmp_cmf_80_up)
     acceptability_90 = (tmp_cmf_90_low <= to) & (to <= tmp_cmf_90_up)
+    lap("kernel")
 
     if units.upper() == Units.IP.value:
         (
@@ -166,6 +178,7 @@ def adaptive_ashrae(
             tmp_cmf_90_low=tmp_cmf_90_low,
             tmp_cmf_90_up=tmp_cmf_90_up,
         )
+    lap("unit conversion")
 
     return AdaptiveASHRAE(
         tmp_cmf=t_cmf,
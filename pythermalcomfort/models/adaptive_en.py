@@ -4,10 +4,12 @@ import numpy as np
 
 from pythermalcomfort.classes_input import ENInputs
 from pythermalcomfort.classes_return import AdaptiveEN
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.shared_functions import valid_range
 from pythermalcomfort.utilities import Units, operative_tmp, units_converter
 
 
+@profiled
 def adaptive_en(
     tdb: float | list[float],
     tr: float | list[float],
@@ -79,11 +81,13 @@ def adaptive_en(
     """
     # Validate inputs using the ENInputs class
     ENInputs(tdb=tdb, tr=tr, t_running_mean=t_running_mean, v=v, units=units)
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
     t_running_mean = np.asarray(t_running_mean)
     v = np.asarray(v)
+    lap("array conversion")
     standard = "iso"
 
     if units.upper() == Units.IP.value:
@@ -93,8 +97,10 @@ def adaptive_en(
             tmp_running_mean=t_running_mean,
             v=v,
         )
+    lap("unit conversion")
 
     trm_valid = valid_range(t_running_mean, (10.0, 33.5))
+    lap("compliance masking")
 
     to = operative_tmp(tdb, tr, v, standard=standard)
 
@@ -105,10 +111,12 @@ def adaptive_en(
     ce = np.where(ce == 999, 2.2, ce)
 
     t_cmf = 0.33 * t_running_mean + 18.8
+    lap("kernel")
 
     if limit_inputs:
         all_valid = ~(np.isnan(trm_valid))
         t_cmf = np.where(all_valid, t_cmf, np.nan)
+    lap("compliance masking")
 
     t_cmf_i_lower = t_cmf - 3.0
     t_cmf_ii_lower = t_cmf - 4.0
@@ -120,6 +128,7 @@ def adaptive_en(
     acceptability_i = (t_cmf_i_lower <= to) & (to <= t_cmf_i_upper)
     acceptability_ii = (t_cmf_ii_lower <= to) & (to <= t_cmf_ii_upper)
     acceptability_iii = (t_cmf_iii_lower <= to) & (to <= t_cmf_iii_upper)
+    lap("kernel")
 
     if units.upper() == Units.IP.value:
         t_cmf, t_cmf_i_upper, t_cmf_ii_upper, t_cmf_iii_upper = units_converter(
@@ -135,6 +144,7 @@ def adaptive_en(
             tmp_cmf_cat_ii_low=t_cmf_ii_lower,
             tmp_cmf_cat_iii_low=t_cmf_iii_lower,
         )
+    lap("unit conversion")
 
     return AdaptiveEN(
         tmp_cmf=np.around(t_cmf, 1),
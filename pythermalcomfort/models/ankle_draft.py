@@ -5,6 +5,7 @@ import numpy as np
 from pythermalcomfort.classes_input import AnkleDraftInputs
 from pythermalcomfort.classes_return import AnkleDraft
 from pythermalcomfort.models.pmv_ppd_ashrae import pmv_ppd_ashrae
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import (
     Models,
     Units,
@@ -13,6 +14,7 @@ from pythermalcomfort.utilities import (
 )
 
 
+@profiled
 def ankle_draft(
     tdb: float | list[float],
     tr: float | list[float],
@@ -98,6 +100,7 @@ def ankle_draft(
         v_ankle=v_ankle,
         units=units,
     )
+    lap("validation")
 
     # Convert lists to numpy arrays
     tdb = np.asarray(tdb)
@@ -107,9 +110,11 @@ def ankle_draft(
     met = np.asarray(met)
     clo = np.asarray(clo)
     v_ankle = np.asarray(v_ankle)
+    lap("array conversion")
 
     if units.upper() == Units.IP.value:
         tdb, tr, vr, v_ankle = units_converter(tdb=tdb, tr=tr, vr=vr, vel=v_ankle)
+    lap("unit conversion")
 
     tdb_valid, tr_valid, v_valid, v_limited = _check_standard_compliance_array(
         standard=Models.ashrae_55_2023.value,
@@ -123,6 +128,7 @@ def ankle_draft(
         raise ValueError(
             "This equation is only applicable for air speed lower than 0.2 m/s",
         )
+    lap("compliance masking")
 
     tsv = pmv_ppd_ashrae(
         tdb,
@@ -139,5 +145,6 @@ def ankle_draft(
         * 100,
         1,
     )
+    lap("kernel")
     acceptability = ppd_val <= 20
     return AnkleDraft(ppd_ad=ppd_val, acceptability=acceptability)
@@ -4,15 +4,20 @@ import numpy as np
 
 from pythermalcomfort.classes_input import ATInputs
 from pythermalcomfort.classes_return import AT
-from pythermalcomfort.utilities import psy_ta_rh
+from pythermalcomfort.models._outdoor_optimized import _at_optimized
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.utilities import Conditions, _unpack_conditions, p_sat
 
 
+@profiled
 def at(
-    tdb: float | list[float],
-    rh: float | list[float],
-    v: float | list[float],
+    tdb: float | list[float] = None,
+    rh: float | list[float] = None,
+    v: float | list[float] = None,
     q: float | list[float] = None,
     round_output: bool = True,
+    *,
+    conditions: Conditions | None = None,
 ) -> AT:
     """Calculate the Apparent Temperature (AT). The AT is defined as the temperature at
     the reference humidity level producing the same amount of discomfort as that
@@ -31,7 +36,7 @@ def at(
     Parameters
     ----------
     tdb : float or list of floats
-        Dry bulb air temperature, [°C]
+        Dry bulb air temperature, [°C].
     rh : float or list of floats
         Relative humidity, [%]
     v : float or list of floats
@@ -40,6 +45,11 @@ def at(
         Net radiation absorbed per unit area of body surface [W/m2]
     round_output : bool, default True
         If True, rounds the output value; if False, does not round it.
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb`, `rh` and `v` that are not passed are taken from it. Its cached vapour
+        pressure is used when `tdb` and `rh` are taken from it.
 
     Returns
     -------
@@ -55,25 +65,29 @@ def at(
         at(tdb=25, rh=30, v=0.1)
         # AT(at=24.1)
     """
+    use_cache = conditions is not None and tdb is None and rh is None
+    tdb, rh, v = _unpack_conditions("at", conditions, tdb=tdb, rh=rh, v=v)
+
     # Validate inputs
     ATInputs(tdb=tdb, rh=rh, v=v, q=q, round_output=round_output)
+    lap("validation")
 
     # Convert lists to numpy arrays if necessary
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
     v = np.asarray(v)
+    lap("array conversion")
 
-    # Calculate vapor pressure
-    p_vap = psy_ta_rh(tdb, rh).p_vap / 100
+    # Calculate vapor pressure [hPa]
+    p_vap = conditions.p_vap / 100 if use_cache else rh / 100 * p_sat(tdb) / 100
 
     # Calculate apparent temperature
-    if q is not None:
-        q = np.asarray(q)
-        t_at = tdb + 0.348 * p_vap - 0.7 * v + 0.7 * q / (v + 10) - 4.25
-    else:
-        t_at = tdb + 0.33 * p_vap - 0.7 * v - 4.00
+    with_q = q is not None
+    t_at = _at_optimized(tdb, p_vap, v, q if with_q else np.nan, with_q)
+    lap("kernel")
 
     if round_output:
         t_at = np.around(t_at, 1)
+    lap("rounding")
 
     return AT(at=t_at)
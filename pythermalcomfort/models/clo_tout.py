@@ -6,9 +6,11 @@ import numpy as np
 
 from pythermalcomfort.classes_input import CloTOutInputs
 from pythermalcomfort.classes_return import CloTOut
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import Units, units_converter
 
 
+@profiled
 def clo_tout(
     tout: float | list[float],
     units: Literal["SI", "IP"] = Units.SI.value,
@@ -64,16 +66,20 @@ def clo_tout(
         tout=tout,
         units=units,
     )
+    lap("validation")
 
     # Convert tout to NumPy array for vectorized operations
     tout = np.asarray(tout)
+    lap("array conversion")
 
     # Convert units if necessary
     if units.upper() == Units.IP.value:
         tout = units_converter(tmp=tout)[0]
+    lap("unit conversion")
 
     clo = np.where(tout < 26, np.power(10, -0.1635 - 0.0066 * tout), 0.46)
     clo = np.where(tout < 5, 0.818 - 0.0364 * tout, clo)
     clo = np.where(tout < -5, 1, clo)
+    lap("kernel")
 
     return CloTOut(clo_tout=np.around(clo, 2))
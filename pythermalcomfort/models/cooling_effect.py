@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import warnings
 from typing import Literal
 
@@ -8,10 +9,21 @@ from scipy import optimize
 
 from pythermalcomfort.classes_input import CEInputs
 from pythermalcomfort.classes_return import CE
+from pythermalcomfort.memo import memoized
 from pythermalcomfort.models.set_tmp import set_tmp
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import (
+    muted,
+    record_elements,
+    recording,
+    warm_starting,
+)
 from pythermalcomfort.utilities import Units, units_converter
 
 
+@profiled
+@memoized
 def cooling_effect(
     tdb: float | list[float],
     tr: float | list[float],
@@ -116,6 +128,7 @@ def cooling_effect(
         wme=wme,
         units=units,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -124,32 +137,67 @@ def cooling_effect(
     met = np.asarray(met)
     clo = np.asarray(clo)
     wme = np.asarray(wme)
+    lap("array conversion")
 
     if units.upper() == Units.IP.value:
         tdb, tr, vr = units_converter(tdb=tdb, tr=tr, v=vr)
+    lap("unit conversion")
 
     still_air_threshold = 0.1
 
-    _ce = _cooling_effect_vectorised(
-        tdb=tdb,
-        tr=tr,
-        still_air_threshold=still_air_threshold,
-        rh=rh,
-        met=met,
-        clo=clo,
-        wme=wme,
-        vr=vr,
-    )
+    stats = [] if recording() else None
+    # the calls of set_tmp in the root solver are not recorded
+    with muted():
+        _ce = _cooling_effect_vectorised(
+            tdb=tdb,
+            tr=tr,
+            still_air_threshold=still_air_threshold,
+            rh=rh,
+            met=met,
+            clo=clo,
+            wme=wme,
+            vr=vr,
+            stats=stats,
+            xtol=tolerances().cooling_effect,
+            # the cooling effect of the previous element, updated by each element
+            seed={} if warm_starting() else None,
+        )
+    if stats is not None:
+        record_elements("cooling_effect", "brentq", stats, np.shape(_ce))
+    lap("kernel")
 
     if units.upper() == Units.IP.value:
         _ce = _ce / 1.8 * 3.28
+    lap("unit conversion")
 
     return CE(ce=np.around(_ce, 2))
 
 
-@np.vectorize
-def _cooling_effect_vectorised(tdb, tr, still_air_threshold, rh, met, clo, wme, vr):
+# half width of the interval around the previous cooling effect, in which the
+# root is searched first in the warm-start mode, °C
+_WARM_START_BRACKET = 0.25
+
+
+@functools.partial(np.vectorize, otypes=[float], excluded={"stats", "xtol", "seed"})
+def _cooling_effect_vectorised(
+    tdb,
+    tr,
+    still_air_threshold,
+    rh,
+    met,
+    clo,
+    wme,
+    vr,
+    stats=None,
+    xtol=2e-12,
+    seed=None,
+):
+    # the iterations of the root solver are appended to stats, if it is a list.
+    # xtol is the absolute tolerance of the root. If seed is a dict, the root is
+    # first searched around the cooling effect of the previous element it holds
     if vr <= 0.1:
+        if stats is not None:
+            stats.append((0, True))
         return 0.0
 
     initial_set_tmp = set_tmp(
@@ -182,10 +230,30 @@ def _cooling_effect_vectorised(tdb, tr, still_air_threshold, rh, met, clo, wme,
             - initial_set_tmp
         )
 
-    try:
-        ce = optimize.brentq(function, 0.0, 40)
-    except ValueError:
-        ce = 0.0
+    brackets = [(0.0, 40)]
+    if seed and "ce" in seed:
+        brackets.insert(
+            0,
+            (
+                max(seed["ce"] - _WARM_START_BRACKET, 0.0),
+                seed["ce"] + _WARM_START_BRACKET,
+            ),
+        )
+    ce, iterations, converged = 0.0, 0, False
+    for low, high in brackets:
+        try:
+            ce, result = optimize.brentq(
+                function, low, high, xtol=xtol, full_output=True
+            )
+        except ValueError:
+            # the interval does not bracket a root
+            continue
+        iterations, converged = result.iterations, result.converged
+        break
+    if seed is not None and converged:
+        seed["ce"] = ce
+    if stats is not None:
+        stats.append((iterations, converged))
 
     if ce == 0.0:
         warnings.warn(
@@ -4,12 +4,18 @@ import numpy as np
 
 from pythermalcomfort.classes_input import DIInputs
 from pythermalcomfort.classes_return import DI
+from pythermalcomfort.models._outdoor_optimized import _discomfort_index_optimized
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.shared_functions import mapping
+from pythermalcomfort.utilities import Conditions, _unpack_conditions
 
 
+@profiled
 def discomfort_index(
-    tdb: float | list[float],
-    rh: float | list[float],
+    tdb: float | list[float] = None,
+    rh: float | list[float] = None,
+    *,
+    conditions: Conditions | None = None,
 ) -> DI:
     """Calculate the Discomfort Index (DI).
 
@@ -31,6 +37,10 @@ def discomfort_index(
         Dry bulb air temperature, [°C].
     rh : float or list of floats
         Relative humidity, [%].
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb` and `rh` that are not passed are taken from it.
 
     Returns
     -------
@@ -54,16 +64,21 @@ def discomfort_index(
             result.discomfort_condition
         )  # ['Less than 50% feels discomfort', 'Most of the population feels discomfort']
     """
+    tdb, rh = _unpack_conditions("discomfort_index", conditions, tdb=tdb, rh=rh)
+
     # Validate inputs using the DiscomfortIndexInputs class
     DIInputs(
         tdb=tdb,
         rh=rh,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
+    lap("array conversion")
 
-    di = tdb - 0.55 * (1 - 0.01 * rh) * (tdb - 14.5)
+    di = _discomfort_index_optimized(tdb, rh)
+    lap("kernel")
 
     di_categories = {
         21: "No discomfort",
@@ -74,7 +89,10 @@ def discomfort_index(
         99: "State of medical emergency",
     }
 
-    return DI(
-        di=np.around(di, 1),
-        discomfort_condition=mapping(di, di_categories, right=False),
-    )
+    discomfort_condition = mapping(di, di_categories, right=False)
+    lap("category mapping")
+
+    di = np.around(di, 1)
+    lap("rounding")
+
+    return DI(di=di, discomfort_condition=discomfort_condition)
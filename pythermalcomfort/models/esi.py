@@ -4,8 +4,11 @@ import numpy as np
 
 from pythermalcomfort.classes_input import ESIInputs
 from pythermalcomfort.classes_return import ESI
+from pythermalcomfort.models._outdoor_optimized import _esi_optimized
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def esi(
     tdb: float | list[float],
     rh: float | list[float],
@@ -49,20 +52,18 @@ def esi(
         sol_radiation_global=sol_radiation_global,
         round_output=round_output,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
     sol_radiation_global = np.asarray(sol_radiation_global)
+    lap("array conversion")
 
-    _esi = (
-        0.63 * tdb
-        - 0.03 * rh
-        + 0.002 * sol_radiation_global
-        + 0.0054 * (tdb * rh)
-        - 0.073 * (0.1 + sol_radiation_global) ** (-1)
-    )
+    _esi = _esi_optimized(tdb, rh, sol_radiation_global)
+    lap("kernel")
 
     if round_output:
         _esi = np.round(_esi, 1)
+    lap("rounding")
 
     return ESI(esi=_esi)
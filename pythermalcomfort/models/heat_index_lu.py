@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import functools
 import math
 
 import numpy as np
 
 from pythermalcomfort.classes_input import HIInputs
 from pythermalcomfort.classes_return import HI
+from pythermalcomfort.memo import memoized
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import (
+    record_elements,
+    record_failures,
+    recording,
+    returning_nan,
+)
 
 
+@profiled
+@memoized
 def heat_index_lu(
     tdb: float | list[float],
     rh: float | list[float],
@@ -47,22 +59,45 @@ def heat_index_lu(
         round_output=round_output,
         limit_inputs=False,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
+    lap("array conversion")
 
-    hi = _lu_heat_index_vectorized(tdb + 273.15, rh / 100) - 273.15
+    # the elements that do not converge are nan if stats is a list
+    nan_on_failure = returning_nan()
+    stats = [] if recording() or nan_on_failure else None
+    hi = (
+        _lu_heat_index_vectorized(
+            tdb + 273.15, rh / 100, stats=stats, tol=tolerances().heat_index_lu
+        )
+        - 273.15
+    )
+    if stats is not None:
+        if recording():
+            record_elements("heat_index_lu", "bisection", stats, np.shape(hi))
+        failed = np.reshape([not converged for _, converged in stats], np.shape(hi))
+        if nan_on_failure:
+            record_failures("heat_index_lu", "bisection", failed)
+        elif failed.any():
+            raise SystemExit("the root solver did not converge")
+    lap("kernel")
 
     if round_output:
         hi = np.around(hi, 1)
+    lap("rounding")
 
     return HI(hi=hi)
 
 
-# combining the two functions find_eqvar and find_T
-@np.vectorize
+# combining the two functions find_eqvar and find_T. If stats is a list, the
+# iterations of all the bisections of each element, and whether they converged,
+# are appended to it and the elements that do not converge are nan. tol is the
+# tolerance of the bisections
+@functools.partial(np.vectorize, otypes=[float], excluded={"stats", "tol"})
 def _lu_heat_index_vectorized(
-    tdb: np.ndarray, rh: np.ndarray
+    tdb: np.ndarray, rh: np.ndarray, stats: list | None = None, tol: float = 1e-8
 ) -> np.ndarray:  # Thermodynamic parameters
     t_c_k = 273.16  # K
     p_triple_point = 611.65  # Pa
@@ -130,9 +165,9 @@ def _lu_heat_index_vectorized(
     )  # Pa m^2/W, mass transfer resistance through air, when being naked
 
     # tolerance and maximum iteration for the root solver
-    tol = 1e-8
-    tol_t = 1e-8
+    tol_t = tol
     max_iter = 100
+    iterations = 0
 
     # Thermo-regulatory functions
     def qv(ta, pa):  # respiratory heat loss, W/m^2
@@ -314,6 +349,7 @@ def _lu_heat_index_vectorized(
         return t, _region
 
     def solve(f, x1, x2, _tol, _max_iter):
+        nonlocal iterations
         a = x1
         b = x2
         fa = f(a)
@@ -321,6 +357,7 @@ def _lu_heat_index_vectorized(
         if fa * fb > 0.0:
             raise SystemExit("wrong initial interval in the root solver")
         for i in range(_max_iter):
+            iterations += 1
             c = (a + b) / 2.0
             fc = f(c)
             if fb * fc > 0.0:
@@ -334,8 +371,16 @@ def _lu_heat_index_vectorized(
                 raise SystemExit("reaching maximum iteration in the root solver")
 
     dic = {"phi": 1, "rf": 2, "rs": 3, "rs*": 3, "d_tc_dt": 4}
-    eq_vars = find_eq_var(tdb, rh)
-    hi, region = find_t(eq_vars[0], eq_vars[dic[eq_vars[0]]])
+    try:
+        eq_vars = find_eq_var(tdb, rh)
+        hi, region = find_t(eq_vars[0], eq_vars[dic[eq_vars[0]]])
+    except SystemExit:
+        if stats is None:
+            raise
+        stats.append((iterations, False))
+        return np.nan
+    if stats is not None:
+        stats.append((iterations, True))
     if tdb == 0.0:
         hi = 0.0
     return hi
@@ -4,14 +4,20 @@ import numpy as np
 
 from pythermalcomfort.classes_input import HIInputs
 from pythermalcomfort.classes_return import HI
+from pythermalcomfort.models._outdoor_optimized import _heat_index_rothfusz_optimized
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.shared_functions import mapping
+from pythermalcomfort.utilities import Conditions, _unpack_conditions
 
 
+@profiled
 def heat_index_rothfusz(
-    tdb: float | list[float],
-    rh: float | list[float],
+    tdb: float | list[float] = None,
+    rh: float | list[float] = None,
     round_output: bool = True,
     limit_inputs: bool = True,
+    *,
+    conditions: Conditions | None = None,
 ) -> HI:
     """Calculate the Heat Index (HI) in accordance with the Rothfusz (1990) model
     [Rothfusz1990]_.
@@ -24,6 +30,10 @@ def heat_index_rothfusz(
         Relative humidity, [%].
     round_output : bool, optional
         If True, rounds output value. If False, it does not round it. Defaults to True.
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb` and `rh` that are not passed are taken from it.
 
     Returns
     -------
@@ -41,6 +51,8 @@ def heat_index_rothfusz(
         print(result.hi)  # 29.7
         print(result.stress_category)  # "caution"
     """
+    tdb, rh = _unpack_conditions("heat_index_rothfusz", conditions, tdb=tdb, rh=rh)
+
     # Validate inputs using the HeatIndexInputs class
     HIInputs(
         tdb=tdb,
@@ -48,14 +60,14 @@ def heat_index_rothfusz(
         round_output=round_output,
         limit_inputs=limit_inputs,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
+    lap("array conversion")
 
-    hi = -8.784695 + 1.61139411 * tdb + 2.338549 * rh - 0.14611605 * tdb * rh
-    hi += -1.2308094 * 10**-2 * tdb**2 - 1.6424828 * 10**-2 * rh**2
-    hi += 2.211732 * 10**-3 * tdb**2 * rh + 7.2546 * 10**-4 * tdb * rh**2
-    hi += -3.582 * 10**-6 * tdb**2 * rh**2
+    hi = _heat_index_rothfusz_optimized(tdb, rh)
+    lap("kernel")
 
     # heat index should only be calculated for temperatures above 27 °C
     if limit_inputs:
@@ -64,6 +76,7 @@ def heat_index_rothfusz(
         hi_valid = np.where(all_valid, hi, np.nan)
     else:
         hi_valid = hi
+    lap("compliance masking")
 
     heat_index_categories = {
         27.0: "no risk",
@@ -75,5 +88,9 @@ def heat_index_rothfusz(
 
     if round_output:
         hi_valid = np.around(hi_valid, 1)
+    lap("rounding")
+
+    stress_category = mapping(hi_valid, heat_index_categories)
+    lap("category mapping")
 
-    return HI(hi=hi_valid, stress_category=mapping(hi_valid, heat_index_categories))
+    return HI(hi=hi_valid, stress_category=stress_category)
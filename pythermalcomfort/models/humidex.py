@@ -4,14 +4,19 @@ import numpy as np
 
 from pythermalcomfort.classes_input import HumidexInputs, HumidexModels
 from pythermalcomfort.classes_return import Humidex
-from pythermalcomfort.utilities import dew_point_tmp
+from pythermalcomfort.models._outdoor_optimized import _humidex_rana_optimized
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.utilities import Conditions, _unpack_conditions, dew_point_tmp
 
 
+@profiled
 def humidex(
-    tdb: float | list[float],
-    rh: float | list[float],
+    tdb: float | list[float] = None,
+    rh: float | list[float] = None,
     model: str = "rana",
     round_output: bool = True,
+    *,
+    conditions: Conditions | None = None,
 ) -> Humidex:
     """Calculate the humidex (short for "humidity index"). It has been developed by the
     Canadian Meteorological service. It was introduced in 1965 and then it was revised
@@ -35,6 +40,12 @@ def humidex(
             .. _Rana et al. (2013): https://doi.org/10.1016/j.enbuild.2013.04.019
     round_output : bool, optional
         If True, rounds output value. If False, it does not round it. Defaults to True.
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb` and `rh` that are not passed are taken from it. The 'masterson'
+        model uses its cached dew point temperature when `tdb` and `rh` are
+        taken from it.
 
     Returns
     -------
@@ -57,15 +68,20 @@ def humidex(
         print(result.discomfort)
         # ['Little or no discomfort', 'Evident discomfort']
     """
+    use_cache = conditions is not None and tdb is None and rh is None
+    tdb, rh = _unpack_conditions("humidex", conditions, tdb=tdb, rh=rh)
+
     # Validate inputs using the HumidexInputs class
     HumidexInputs(
         tdb=tdb,
         rh=rh,
         round_output=round_output,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
+    lap("array conversion")
 
     if np.any(rh > 100) or np.any(rh < 0):
         raise ValueError("Relative humidity must be between 0 and 100%")
@@ -75,18 +91,21 @@ def humidex(
             "Invalid model. The model must be either 'rana' or 'masterson'",
         )
 
-    hi = tdb + 5 / 9 * ((6.112 * 10 ** (7.5 * tdb / (237.7 + tdb)) * rh / 100) - 10)
+    hi = _humidex_rana_optimized(tdb, rh)
     if model == HumidexModels.masterson.value:
+        t_dp = conditions.dew_point_tmp if use_cache else dew_point_tmp(tdb=tdb, rh=rh)
         hi = tdb + 5 / 9 * (
             6.11
             * np.exp(
-                5417.753 * (1 / 273.15 - 1 / (dew_point_tmp(tdb=tdb, rh=rh) + 273.15)),
+                5417.753 * (1 / 273.15 - 1 / (t_dp + 273.15)),
             )
             - 10
         )
+    lap("kernel")
 
     if round_output:
         hi = np.around(hi, 1)
+    lap("rounding")
 
     stress_category = np.full_like(hi, "Heat stroke probable", dtype=object)
     stress_category[hi <= 30] = "Little or no discomfort"
@@ -94,5 +113,6 @@ def humidex(
     stress_category[(hi > 35) & (hi <= 40)] = "Evident discomfort"
     stress_category[(hi > 40) & (hi <= 45)] = "Intense discomfort; avoid exertion"
     stress_category[(hi > 45) & (hi <= 54)] = "Dangerous discomfort"
+    lap("category mapping")
 
     return Humidex(humidex=hi, discomfort=stress_category)
@@ -28,6 +28,8 @@ from pythermalcomfort.jos3_functions.matrix import (
 )
 from pythermalcomfort.jos3_functions.parameters import ALL_OUT_PARAMS, Default
 from pythermalcomfort.models.pmv_ppd_iso import pmv_ppd_iso
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import muted, record_failures, returning_nan
 from pythermalcomfort.utilities import Models, Postures, antoine, met_to_w_m2
 
 
@@ -548,7 +550,8 @@ class JOS3:
         Returns
         -------
         to : float
-            Operative temperature [°C].
+            Operative temperature [°C], nan if it is not found in the
+            nan-on-failure mode, see :py:func:`pythermalcomfort.solvers.nan_on_failure`.
         """
         # Default parameters
         initial_to = 28
@@ -559,33 +562,41 @@ class JOS3:
         retry_attempts = 100
 
         to = initial_to
+        nan_on_failure = returning_nan()
 
         # Main loop for finding PMV=0
         for _i in range(max_iterations):
-            pmv_value = pmv_ppd_iso(
-                to,
-                to,
-                v,
-                rh,
-                met,
-                clo,
-                model=Models.iso_7730_2005.value,
-            ).pmv
-
-            # Check for NaN and handle retries
+            # the failures of the PMV are reported as the ones of the search
+            with muted():
+                pmv_value = pmv_ppd_iso(
+                    to,
+                    to,
+                    v,
+                    rh,
+                    met,
+                    clo,
+                    model=Models.iso_7730_2005.value,
+                ).pmv
+
+            # Check for NaN and handle retries, not in the nan-on-failure mode
+            if np.isnan(pmv_value) and nan_on_failure:
+                record_failures("JOS3", "to", np.array(True))
+                return np.nan
             if np.isnan(pmv_value):
                 for _retry in range(retry_attempts):
                     adjustment_factor = retry_adjustment_factor
                     to = initial_to  # Reset to initial temperature for retry
-                    pmv_value = pmv_ppd_iso(
-                        to,
-                        to,
-                        v,
-                        rh,
-                        met,
-                        clo,
-                        model=Models.iso_7730_2005.value,
-                    ).pmv
+                    # the failures of the PMV are reported as the ones of the search
+                    with muted():
+                        pmv_value = pmv_ppd_iso(
+                            to,
+                            to,
+                            v,
+                            rh,
+                            met,
+                            clo,
+                            model=Models.iso_7730_2005.value,
+                        ).pmv
 
                     if abs(pmv_value) < tolerance:
                         return to
@@ -598,11 +609,16 @@ class JOS3:
 
             # Check if the PMV is within tolerance
             if abs(pmv_value) < tolerance:
+                if nan_on_failure:
+                    record_failures("JOS3", "to", np.array(False))
                 return to
 
             # Adjust the operative temperature using the adjustment factor
             to = to - pmv_value / adjustment_factor
 
+        if nan_on_failure:
+            record_failures("JOS3", "to", np.array(True))
+            return np.nan
         return to
 
     # TODO check the name of the function and the docstring
@@ -653,6 +669,7 @@ class JOS3:
 
         return dict_out
 
+    @profiled
     def simulate(self, times: int, dtime=60, output: bool = True) -> None:
         """Run the JOS-3 model simulation.
 
@@ -699,6 +716,7 @@ class JOS3:
 
             # Execute the simulation step
             dict_data: JOS3Output = self._run(dtime=dtime, output=output)
+            lap("kernel")
 
             # If output is True, append the results to the history
             if output:
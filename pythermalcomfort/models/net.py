@@ -4,13 +4,19 @@ import numpy as np
 
 from pythermalcomfort.classes_input import NETInputs
 from pythermalcomfort.classes_return import NET
+from pythermalcomfort.models._outdoor_optimized import _net_optimized
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.utilities import Conditions, _unpack_conditions
 
 
+@profiled
 def net(
-    tdb: float | list[float],
-    rh: float | list[float],
-    v: float | list[float],
+    tdb: float | list[float] = None,
+    rh: float | list[float] = None,
+    v: float | list[float] = None,
     round_output: bool = True,
+    *,
+    conditions: Conditions | None = None,
 ) -> NET:
     """Calculate the Normal Effective Temperature (NET). Missenard (1933)
     devised a formula for calculating effective temperature. The index
@@ -39,6 +45,10 @@ def net(
         Wind speed [m/s] at 1.2 m above the ground.
     round_output : bool, optional
         If True, rounds output value. If False, it does not round it. Defaults to True.
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb`, `rh` and `v` that are not passed are taken from it.
 
     Returns
     -------
@@ -59,6 +69,8 @@ def net(
         print(result.net)  # [37.0, 26.38977535]
 
     """
+    tdb, rh, v = _unpack_conditions("net", conditions, tdb=tdb, rh=rh, v=v)
+
     # Validate inputs using the NetInputs class
     NETInputs(
         tdb=tdb,
@@ -66,15 +78,18 @@ def net(
         v=v,
         round_output=round_output,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
     v = np.asarray(v)
+    lap("array conversion")
 
-    frac = 1.0 / (1.76 + 1.4 * v**0.75)
-    et = 37 - (37 - tdb) / (0.68 - 0.0014 * rh + frac) - 0.29 * tdb * (1 - 0.01 * rh)
+    et = _net_optimized(tdb, rh, v)
+    lap("kernel")
 
     if round_output:
         et = np.around(et, 1)
+    lap("rounding")
 
     return NET(net=et)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import numpy as np
+
+from pythermalcomfort.classes_input import OutdoorIndicesInputs
+from pythermalcomfort.classes_return import OutdoorIndices
+from pythermalcomfort.models._outdoor_optimized import (
+    OUTDOOR_INDICES,
+    _outdoor_optimized,
+)
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.utilities import p_sat
+
+# inputs needed by each index in addition to tdb and rh
+_NEEDS_V = ("at", "wci", "wct", "net")
+_NEEDS_SOL = ("esi",)
+
+
+def _as_kernel_input(x, shape: tuple[int, ...]) -> np.ndarray:
+    """Return a 1D float array with either one element or one element per row."""
+    x = np.asarray(x, dtype=np.float64)
+    if x.size == 1:
+        return x.reshape(1)
+    if x.shape != shape:
+        x = np.broadcast_to(x, shape)
+    return np.ascontiguousarray(x).reshape(-1)
+
+
+@profiled
+def outdoor_indices(
+    tdb: float | list[float],
+    rh: float | list[float],
+    v: float | list[float] = None,
+    q: float | list[float] = None,
+    sol_radiation_global: float | list[float] = None,
+    indices: list[str] | None = None,
+    round_output: bool = True,
+    limit_inputs: bool = True,
+) -> OutdoorIndices:
+    """Calculate several closed-form outdoor heat and cold stress indices at once.
+
+    A single compiled kernel reads each input once and writes all the requested
+    indices, hence computing the whole panel costs about as much as computing the
+    most expensive index. The results are the same as the ones of
+    :py:func:`~pythermalcomfort.models.at.at`,
+    :py:func:`~pythermalcomfort.models.humidex.humidex` (Rana et al. model),
+    :py:func:`~pythermalcomfort.models.heat_index_rothfusz.heat_index_rothfusz`,
+    :py:func:`~pythermalcomfort.models.discomfort_index.discomfort_index`,
+    :py:func:`~pythermalcomfort.models.thi.thi`,
+    :py:func:`~pythermalcomfort.models.wci.wci`,
+    :py:func:`~pythermalcomfort.models.wind_chill_temperature.wind_chill_temperature`,
+    :py:func:`~pythermalcomfort.models.net.net` and
+    :py:func:`~pythermalcomfort.models.esi.esi`. The categories returned by some
+    of these models are not calculated.
+
+    Parameters
+    ----------
+    tdb : float or list of floats
+        Dry bulb air temperature, [°C].
+    rh : float or list of floats
+        Relative humidity, [%].
+    v : float or list of floats, optional
+        Wind speed, [m/s]. Required by `at`, `wci`, `wct` and `net`.
+    q : float or list of floats, optional
+        Net radiation absorbed per unit area of body surface [W/m2], used by `at`.
+    sol_radiation_global : float or list of floats, optional
+        Global solar radiation, [W/m2]. Required by `esi`.
+    indices : list of str, optional
+        Indices to calculate, any of 'at', 'humidex', 'hi', 'di', 'thi', 'wci',
+        'wct', 'net' and 'esi'. Defaults to all the indices whose inputs are
+        provided.
+    round_output : bool, optional
+        If True, rounds output values. If False, it does not round them. Defaults
+        to True. The discomfort index is always rounded, as in
+        :py:func:`~pythermalcomfort.models.discomfort_index.discomfort_index`.
+    limit_inputs : bool, optional
+        If True, the heat index is only calculated for tdb >= 27 °C, otherwise it
+        returns nan. Defaults to True.
+
+    Returns
+    -------
+    OutdoorIndices
+        A dataclass containing the requested indices. See
+        :py:class:`~pythermalcomfort.classes_return.OutdoorIndices` for more details.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import outdoor_indices
+
+        result = outdoor_indices(tdb=[30, 35], rh=50, v=1, indices=["at", "hi"])
+        print(result.at)  # [32.3, 39.6]
+        print(result.hi)  # [31.0, 40.7]
+        print(result.wci)  # None
+    """
+    OutdoorIndicesInputs(
+        tdb=tdb,
+        rh=rh,
+        v=v,
+        q=q,
+        sol_radiation_global=sol_radiation_global,
+        round_output=round_output,
+        limit_inputs=limit_inputs,
+    )
+    lap("validation")
+
+    if indices is None:
+        indices = [
+            name
+            for name in OUTDOOR_INDICES
+            if (v is not None or name not in _NEEDS_V)
+            and (sol_radiation_global is not None or name not in _NEEDS_SOL)
+        ]
+    unknown = [name for name in indices if name not in OUTDOOR_INDICES]
+    if unknown:
+        msg = f"Unknown indices {unknown}, choose among {list(OUTDOOR_INDICES)}"
+        raise ValueError(msg)
+    if v is None and any(name in _NEEDS_V for name in indices):
+        raise ValueError("The wind speed v is required to calculate at, wci, wct, net")
+    if sol_radiation_global is None and "esi" in indices:
+        raise ValueError("The global solar radiation is required to calculate esi")
+
+    inputs = [tdb, rh, v, q, sol_radiation_global]
+    shape = np.broadcast_shapes(*[np.shape(x) for x in inputs if x is not None])
+    tdb, rh, v, q, sol_radiation_global = (
+        _as_kernel_input(np.nan if x is None else x, shape) for x in inputs
+    )
+    lap("array conversion")
+
+    # vapour pressure [hPa] used by the apparent temperature
+    p_vap = rh / 100 * p_sat(tdb) / 100 if "at" in indices else np.full(1, np.nan)
+
+    codes = np.array([OUTDOOR_INDICES.index(name) for name in indices], dtype=np.int64)
+    out = np.empty((codes.size, int(np.prod(shape))))
+    _outdoor_optimized(
+        tdb,
+        rh,
+        p_vap,
+        v,
+        q,
+        sol_radiation_global,
+        codes,
+        inputs[3] is not None,
+        limit_inputs,
+        round_output,
+        out,
+    )
+    lap("kernel")
+
+    return OutdoorIndices(
+        **{name: out[row].reshape(shape)[()] for row, name in enumerate(indices)}
+    )
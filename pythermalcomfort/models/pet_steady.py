@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 import numpy.typing as npt
 from scipy import optimize
 
 from pythermalcomfort.classes_input import PETSteadyInputs
 from pythermalcomfort.classes_return import PETSteady
+from pythermalcomfort.memo import memoized
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import record_elements, recording, warm_starting
 from pythermalcomfort.utilities import Postures, Sex, body_surface_area, p_sat
 
 
+@profiled
+@memoized
 def pet_steady(
     tdb: float | list[float],
     tr: float | list[float],
@@ -114,27 +121,38 @@ def pet_steady(
         height=height,
         wme=wme,
     )
+    lap("validation")
 
-    return PETSteady(
-        pet=_pet_steady_vectorised(
-            tdb=tdb,
-            tr=tr,
-            v=v,
-            rh=rh,
-            met=met,
-            clo=clo,
-            p_atm=p_atm,
-            position=position,
-            age=age,
-            sex=sex,
-            weight=weight,
-            height=height,
-            wme=wme,
-        ),
+    stats = [] if recording() else None
+    pet = _pet_steady_vectorised(
+        tdb=tdb,
+        tr=tr,
+        v=v,
+        rh=rh,
+        met=met,
+        clo=clo,
+        p_atm=p_atm,
+        position=position,
+        age=age,
+        sex=sex,
+        weight=weight,
+        height=height,
+        wme=wme,
+        stats=stats,
+        # the solutions of the previous element, updated by each element
+        seed={} if warm_starting() else None,
     )
+    if stats is not None:
+        record_elements("pet_steady", "fsolve", stats, np.shape(pet))
+    lap("kernel")
+
+    return PETSteady(pet=pet)
 
 
-@np.vectorize
+# the function evaluations of the two solves of each element, and whether both
+# converged, are appended to stats, if it is a list. If seed is a dict, the
+# solves start from the solutions of the previous element it holds
+@functools.partial(np.vectorize, otypes=[float], excluded={"stats", "seed"})
 def _pet_steady_vectorised(
     tdb,
     tr,
@@ -149,6 +167,8 @@ def _pet_steady_vectorised(
     weight,
     height,
     wme,
+    stats=None,
+    seed=None,
 ) -> npt.ArrayLike:
     met_factor = 58.2  # met conversion factor
     met = met * met_factor  # metabolic rate
@@ -470,13 +490,22 @@ def _pet_steady_vectorised(
 
         # solving for PET
         pet_guess = _t_stable[2]  # start with the clothing temperature
+        if seed and "pet" in seed:
+            pet_guess = seed["pet"]
 
-        return round(optimize.fsolve(f, pet_guess)[0], 2)
+        pet, info, ier, _ = optimize.fsolve(f, pet_guess, full_output=True)
+        if seed is not None and ier == 1:
+            seed["pet"] = pet
+        if stats is not None:
+            stats.append((n_eval + info["nfev"], converged and ier == 1))
+        return round(pet[0], 2)
 
     # initial guess
     t_guess = np.asarray([36.7, 34, 0.5 * (tdb + tr)])
+    if seed and "t_stable" in seed:
+        t_guess = seed["t_stable"]
     # solve for Tc, Tsk, Tcl temperatures
-    t_stable = optimize.fsolve(
+    t_stable, info, ier, _ = optimize.fsolve(
         solve_pet,
         t_guess,
         args=(
@@ -488,6 +517,10 @@ def _pet_steady_vectorised(
             clo,
             True,
         ),
+        full_output=True,
     )
+    n_eval, converged = info["nfev"], ier == 1
+    if seed is not None and converged:
+        seed["t_stable"] = t_stable
     # compute PET
     return pet_fc(t_stable)
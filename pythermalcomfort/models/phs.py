@@ -7,15 +7,20 @@ from numba import jit, prange
 
 from pythermalcomfort.classes_input import PHSInputs
 from pythermalcomfort.classes_return import PHS
+from pythermalcomfort.memo import memoized
+from pythermalcomfort.models._compliance_optimized import _iso_7933_valid
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import record, recording
 from pythermalcomfort.utilities import (
     Models,
     Postures,
-    _check_standard_compliance_array,
     met_to_w_m2,
     p_sat,
 )
 
 
+@profiled
+@memoized
 def phs(
     tdb: float | list[float],
     tr: float | list[float],
@@ -219,38 +224,9 @@ def phs(
         wme=wme,
         posture=posture,
     )
+    lap("validation")
 
-    default_kwargs = {
-        "i_mst": 0.38,
-        "a_p": 0.54,
-        "drink": 1,
-        "weight": 75,
-        "height": 1.8,
-        "walk_sp": 0,
-        "theta": 0,
-        "acclimatized": 100,
-        "duration": 480,
-        "f_r": 0.97,
-        "t_sk": 34.1,
-        "t_cr": 36.8,
-        "t_re": None,
-        "t_cr_eq": None,
-        "t_sk_t_cr_wg": 0.3,
-        "sweat_rate_watt": 0,
-        "limit_inputs": True,
-        "evap_load_wm2_min": 0,
-    }
-
-    if model == Models.iso_7933_2023.value:
-        # override changed default kwargs for 2023 standard
-        overrides_2023 = {
-            "f_r": 0.42,
-            "t_re": 36.8,
-            "t_cr_eq": 36.8,
-        }
-        default_kwargs.update(overrides_2023)
-
-    kwargs = {**default_kwargs, **kwargs}
+    kwargs = _phs_settings(model, kwargs)
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -260,6 +236,7 @@ def phs(
     clo = np.asarray(clo)
     wme = np.asarray(wme) * met_to_w_m2
     posture = np.asarray(posture)
+    lap("array conversion")
 
     i_mst = kwargs["i_mst"]
     a_p = kwargs["a_p"]
@@ -282,40 +259,9 @@ def phs(
     sweat_rate_watt = kwargs[
         "sweat_rate_watt"
     ]  # instantaneous regulatory sweat rate at skin, [W·m⁻²]
-    # basic physical validation for carry-over state (supports scalar and array-like)
-    t_arr = np.asarray(t_sk_t_cr_wg)
-    sweat_arr = np.asarray(sweat_rate_watt)
-    evap_arr = np.asarray(evap_load_wm2_min)
-    if np.any(sweat_arr < 0):
-        raise ValueError("sweat_rate_watt must be >= 0")
-    if np.any(evap_arr < 0):
-        raise ValueError("evap_load_wm2_min must be >= 0")
-    if np.any((t_arr < 0.0) | (t_arr > 1.0)):
-        raise ValueError("t_sk_t_cr_wg must be within [0, 1]")
     limit_inputs = kwargs["limit_inputs"]
 
-    if model == Models.iso_7933_2023.value:
-        p_a = 0.6105 * np.exp(17.27 * tdb / (tdb + 237.3)) * rh / 100
-    else:  # model == Models.iso_7933_2004.value:
-        p_a = p_sat(tdb) / 1000 * rh / 100
-
-    acclimatized = int(acclimatized)
-    if acclimatized not in [0, 100]:
-        raise ValueError("Acclimatized should be 0 or 100")
-
-    if drink not in [0, 1]:
-        raise ValueError("Drink should be 0 or 1")
-
-    if weight <= 0 or weight > 1000:
-        raise ValueError(
-            "The weight of the person should be in kg and it cannot exceed 1000",
-        )
-
-    # Use explicit None sentinel for missing t_re and t_cr_eq
-    if t_re is None:
-        t_re = t_cr
-    if t_cr_eq is None:
-        t_cr_eq = t_cr
+    p_a = _phs_p_a(tdb, rh, model)
 
     posture_code = _posture_to_code(posture)
     model_code = _MODEL_2023 if model == Models.iso_7933_2023.value else _MODEL_2004
@@ -354,6 +300,9 @@ def phs(
         wme,
     )
     output_shape = tdb_b.shape
+    # iterations of the clothing and core temperatures of each element
+    counters = np.zeros((tdb_b.size, 2), dtype=np.int64) if recording() else None
+    lap("array conversion")
 
     (
         t_re,
@@ -394,7 +343,15 @@ def phs(
         evap_load_wm2_min=np.ravel(evap_load_wm2_min_b),
         sweat_rate_watt=np.ravel(sweat_rate_watt_b),
         model_code=model_code,
+        limit_inputs=limit_inputs,
+        counters=counters,
     )
+    if counters is not None:
+        # the iterations stop only once they converge
+        for solver, iterations in zip(("t_cl", "t_cr"), counters.T, strict=True):
+            iterations = iterations.reshape(output_shape)
+            record("phs", solver, iterations, np.ones(output_shape, dtype=bool))
+    lap("kernel")
 
     t_re = t_re.reshape(output_shape)
     t_sk = t_sk.reshape(output_shape)
@@ -407,6 +364,7 @@ def phs(
     d_lim_loss_50 = d_lim_loss_50.reshape(output_shape)
     d_lim_loss_95 = d_lim_loss_95.reshape(output_shape)
     d_lim_t_re = d_lim_t_re.reshape(output_shape)
+    lap("array conversion")
 
     output = {
         "t_re": t_re,
@@ -422,44 +380,92 @@ def phs(
         "evap_load_wm2_min": evap_load_wm2_min,
     }
 
-    if limit_inputs:
-        (
-            tdb_valid,
-            tr_valid,
-            v_valid,
-            p_a_valid,
-            met_valid,
-            clo_valid,
-        ) = _check_standard_compliance_array(
-            model,
-            tdb=tdb,
-            tr=tr,
-            v=v,
-            met=met,
-            clo=clo,
-            p_a=p_a,
-        )
-        all_valid = ~(
-            np.isnan(tdb_valid)
-            | np.isnan(tr_valid)
-            | np.isnan(v_valid)
-            | np.isnan(p_a_valid)
-            | np.isnan(met_valid)
-            | np.isnan(clo_valid)
-        )
-        for key in output:
-            output[key] = np.where(all_valid, output[key], np.nan)
-
     if round_output:
         for key in output:
             if key != "t_sk_t_cr_wg":
                 output[key] = np.around(output[key], 1)
             else:
                 output[key] = np.around(output[key], 2)
+    lap("rounding")
 
     return PHS(**output)
 
 
+def _phs_settings(model: str, kwargs: dict) -> dict:
+    """Return the keyword arguments of :py:func:`phs` with their defaults, after
+    checking them.
+    """
+    default_kwargs = {
+        "i_mst": 0.38,
+        "a_p": 0.54,
+        "drink": 1,
+        "weight": 75,
+        "height": 1.8,
+        "walk_sp": 0,
+        "theta": 0,
+        "acclimatized": 100,
+        "duration": 480,
+        "f_r": 0.97,
+        "t_sk": 34.1,
+        "t_cr": 36.8,
+        "t_re": None,
+        "t_cr_eq": None,
+        "t_sk_t_cr_wg": 0.3,
+        "sweat_rate_watt": 0,
+        "limit_inputs": True,
+        "evap_load_wm2_min": 0,
+    }
+
+    if model == Models.iso_7933_2023.value:
+        # override changed default kwargs for 2023 standard
+        overrides_2023 = {
+            "f_r": 0.42,
+            "t_re": 36.8,
+            "t_cr_eq": 36.8,
+        }
+        default_kwargs.update(overrides_2023)
+
+    kwargs = {**default_kwargs, **kwargs}
+
+    # basic physical validation for carry-over state (supports scalar and array-like)
+    t_arr = np.asarray(kwargs["t_sk_t_cr_wg"])
+    sweat_arr = np.asarray(kwargs["sweat_rate_watt"])
+    evap_arr = np.asarray(kwargs["evap_load_wm2_min"])
+    if np.any(sweat_arr < 0):
+        raise ValueError("sweat_rate_watt must be >= 0")
+    if np.any(evap_arr < 0):
+        raise ValueError("evap_load_wm2_min must be >= 0")
+    if np.any((t_arr < 0.0) | (t_arr > 1.0)):
+        raise ValueError("t_sk_t_cr_wg must be within [0, 1]")
+
+    kwargs["acclimatized"] = int(kwargs["acclimatized"])
+    if kwargs["acclimatized"] not in [0, 100]:
+        raise ValueError("Acclimatized should be 0 or 100")
+
+    if kwargs["drink"] not in [0, 1]:
+        raise ValueError("Drink should be 0 or 1")
+
+    if kwargs["weight"] <= 0 or kwargs["weight"] > 1000:
+        raise ValueError(
+            "The weight of the person should be in kg and it cannot exceed 1000",
+        )
+
+    # Use explicit None sentinel for missing t_re and t_cr_eq
+    if kwargs["t_re"] is None:
+        kwargs["t_re"] = kwargs["t_cr"]
+    if kwargs["t_cr_eq"] is None:
+        kwargs["t_cr_eq"] = kwargs["t_cr"]
+    return kwargs
+
+
+def _phs_p_a(tdb: np.ndarray, rh: np.ndarray, model: str) -> np.ndarray:
+    """Partial vapour pressure [kPa] as calculated by each version of ISO 7933."""
+    if model == Models.iso_7933_2023.value:
+        return 0.6105 * np.exp(17.27 * tdb / (tdb + 237.3)) * rh / 100
+    # model == Models.iso_7933_2004.value:
+    return p_sat(tdb) / 1000 * rh / 100
+
+
 # Constants
 const_t_eq = math.exp(-1 / 10)
 const_t_sk = math.exp(-1 / 3)
@@ -558,6 +564,7 @@ def _phs_optimized_scalar(
     evap_load_wm2_min,
     sweat_rate_watt,
     model_code,
+    counters=None,
 ):
     # DuBois body surface area [m2]
     a_dubois = 0.202 * (weight**0.425) * (height**0.725)
@@ -727,6 +734,8 @@ def _phs_optimized_scalar(
             t_cl_new = (fcl * (hc_dyn * tdb + h_r * tr) + t_sk / i_cl_dyn) / (
                 fcl * (hc_dyn + h_r) + 1 / i_cl_dyn
             )
+            if counters is not None:
+                counters[0] += 1
             if abs(t_cl - t_cl_new) <= 0.001:
                 break
             t_cl = (t_cl + t_cl_new) / 2
@@ -786,6 +795,8 @@ def _phs_optimized_scalar(
                 - t_sk * t_sk_t_cr_wg / 2
             )
             t_cr = (t_cr + t_cr0 * (1 - t_sk_t_cr_wg0 / 2)) / (1 - t_sk_t_cr_wg / 2)
+            if counters is not None:
+                counters[1] += 1
             if abs(t_cr - t_cr_new) <= 0.001:
                 break
             t_cr_new = (t_cr_new + t_cr) / 2
@@ -857,8 +868,11 @@ def _phs_optimized_array(
     evap_load_wm2_min,
     sweat_rate_watt,
     model_code,
+    limit_inputs,
+    counters=None,
 ):
-    # n == number of flattened input elements
+    # n == number of flattened input elements, counters, if given, has a row
+    # of iteration counts for each of them
     out_t_re = np.empty_like(tdb, dtype=np.float64)
     out_t_sk = np.empty_like(tdb, dtype=np.float64)
     out_t_cr = np.empty_like(tdb, dtype=np.float64)
@@ -873,7 +887,27 @@ def _phs_optimized_array(
 
     n = tdb.size
 
+    # lower limit of the partial vapour pressure [kPa], see Annex A of ISO 7933
+    p_a_min = 0.5 if model_code == _MODEL_2023 else 0.0
+
     for i in prange(n):
+        # inputs outside the applicability limits are not simulated
+        if limit_inputs and not _iso_7933_valid(
+            tdb[i], tr[i], v[i], p_a[i], met[i], clo[i], p_a_min
+        ):
+            out_t_re[i] = np.nan
+            out_t_sk[i] = np.nan
+            out_t_cr[i] = np.nan
+            out_t_cr_eq[i] = np.nan
+            out_t_sk_t_cr_wg[i] = np.nan
+            out_sweat_rate_watt[i] = np.nan
+            out_evap_load_wm2_min[i] = np.nan
+            out_sw_tot_g[i] = np.nan
+            out_d_lim_loss_50[i] = np.nan
+            out_d_lim_loss_95[i] = np.nan
+            out_d_lim_t_re[i] = np.nan
+            continue
+
         (
             out_t_re[i],
             out_t_sk[i],
@@ -913,6 +947,7 @@ def _phs_optimized_array(
             evap_load_wm2_min[i],
             sweat_rate_watt[i],
             model_code,
+            None if counters is None else counters[i],
         )
 
     return (
@@ -928,3 +963,127 @@ def _phs_optimized_array(
         out_d_lim_loss_95,
         out_d_lim_t_re,
     )
+
+
+@jit(nopython=True, cache=True)
+def _phs_optimized_series(
+    tdb,
+    tr,
+    v,
+    p_a,
+    met,
+    clo,
+    posture_code,
+    wme,
+    duration,
+    drink,
+    acclimatized,
+    weight,
+    i_mst,
+    a_p,
+    height,
+    walk_sp,
+    theta,
+    f_r,
+    state,
+    initial_state,
+    model_code,
+    limit_inputs,
+):
+    """Simulate consecutive exposure periods, one per element, in order.
+
+    `state` holds t_sk, t_cr, t_re, t_cr_eq, t_sk_t_cr_wg, evap_load_wm2_min and
+    sweat_rate_watt at the start of the first period and is updated in place
+    with their values at the end of the last one. The rows of the output are
+    t_re, t_sk, t_cr, t_cr_eq, t_sk_t_cr_wg, sweat_rate_watt,
+    evap_load_wm2_min, sweat_loss_g, d_lim_loss_50, d_lim_loss_95 and d_lim_t_re. A period whose inputs are
+    not finite or outside the applicability limits returns nan and the next
+    period starts again from `initial_state`.
+    """
+    n = tdb.size
+    out = np.empty((11, n), dtype=np.float64)
+    p_a_min = 0.5 if model_code == _MODEL_2023 else 0.0
+
+    for i in range(n):
+        finite = (
+            np.isfinite(tdb[i])
+            and np.isfinite(tr[i])
+            and np.isfinite(v[i])
+            and np.isfinite(p_a[i])
+            and np.isfinite(met[i])
+            and np.isfinite(clo[i])
+            and np.isfinite(wme[i])
+        )
+        if not finite or (
+            limit_inputs
+            and not _iso_7933_valid(
+                tdb[i], tr[i], v[i], p_a[i], met[i], clo[i], p_a_min
+            )
+        ):
+            out[:, i] = np.nan
+            state[:] = initial_state
+            continue
+
+        (
+            t_re,
+            t_sk,
+            t_cr,
+            t_cr_eq,
+            t_sk_t_cr_wg,
+            sweat_rate_watt,
+            evap_load_wm2_min,
+            sw_tot_g,
+            d_lim_loss_50,
+            d_lim_loss_95,
+            d_lim_t_re,
+        ) = _phs_optimized_scalar(
+            tdb[i],
+            tr[i],
+            v[i],
+            p_a[i],
+            met[i],
+            clo[i],
+            posture_code[i],
+            drink,
+            acclimatized,
+            weight,
+            wme[i],
+            i_mst,
+            a_p,
+            height,
+            walk_sp,
+            theta,
+            duration[i],
+            f_r,
+            state[0],
+            state[1],
+            state[2],
+            state[3],
+            state[4],
+            state[5],
+            state[6],
+            model_code,
+        )
+        out[0, i] = t_re
+        out[1, i] = t_sk
+        out[2, i] = t_cr
+        out[3, i] = t_cr_eq
+        out[4, i] = t_sk_t_cr_wg
+        out[5, i] = sweat_rate_watt
+        out[6, i] = evap_load_wm2_min
+        out[7, i] = sw_tot_g
+        out[8, i] = d_lim_loss_50
+        out[9, i] = d_lim_loss_95
+        out[10, i] = d_lim_t_re
+        if np.isfinite(t_re) and np.isfinite(t_sk) and np.isfinite(t_cr):
+            state[0] = t_sk
+            state[1] = t_cr
+            state[2] = t_re
+            state[3] = t_cr_eq
+            state[4] = t_sk_t_cr_wg
+            state[5] = evap_load_wm2_min
+            state[6] = sweat_rate_watt
+        else:
+            state[:] = initial_state
+
+    return out
@@ -7,9 +7,11 @@ import numpy as np
 from pythermalcomfort.classes_input import APMVInputs
 from pythermalcomfort.classes_return import APMV
 from pythermalcomfort.models.pmv_ppd_iso import pmv_ppd_iso
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import Models, Units
 
 
+@profiled
 def pmv_a(
     tdb: float | list[float],
     tr: float | list[float],
@@ -114,6 +116,7 @@ def pmv_a(
         wme=wme,
         units=units,
     )
+    lap("validation")
 
     _pmv = pmv_ppd_iso(
         tdb,
@@ -129,5 +132,6 @@ def pmv_a(
     ).pmv
 
     pmv_value = np.around(_pmv / (1 + a_coefficient * _pmv), 2)
+    lap("kernel")
 
     return APMV(a_pmv=pmv_value)
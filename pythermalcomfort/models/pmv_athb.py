@@ -4,10 +4,27 @@ import numpy as np
 
 from pythermalcomfort.classes_input import ATHBInputs
 from pythermalcomfort.classes_return import ATHB
-from pythermalcomfort.models._pmv_ppd_optimized import _pmv_ppd_optimized
+from pythermalcomfort.models._pmv_ppd_optimized import (
+    _PMV_MAX_ITERATIONS,
+    _pmv_iso_optimized,
+    _pmv_iso_sequential,
+    _pmv_iterations,
+    _pmv_warm_start,
+)
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import (
+    nan_failures,
+    record,
+    record_failures,
+    recording,
+    returning_nan,
+    warm_starting,
+)
 from pythermalcomfort.utilities import met_to_w_m2
 
 
+@profiled
 def pmv_athb(
     tdb: float | list[float],
     tr: float | list[float],
@@ -84,6 +101,7 @@ def pmv_athb(
     """
     # Validate inputs using the ATHBInputs class
     ATHBInputs(tdb=tdb, tr=tr, vr=vr, rh=rh, met=met, t_running_mean=t_running_mean)
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -91,6 +109,7 @@ def pmv_athb(
     met = np.asarray(met)
     rh = np.asarray(rh)
     t_running_mean = np.asarray(t_running_mean)
+    lap("array conversion")
 
     met_adapted = met - (0.234 * t_running_mean) / 58.2
 
@@ -107,7 +126,53 @@ def pmv_athb(
             ),
         )
 
-    pmv_res = _pmv_ppd_optimized(tdb, tr, vr, rh, met_adapted, clo_adapted, 0)
+    eps = tolerances().pmv
+    if warm_starting():
+        # each element starts from the clothing temperature of the previous one
+        pmv_res = _pmv_warm_start(
+            "pmv_athb",
+            _pmv_iso_sequential,
+            (tdb, tr, vr, rh, met_adapted, clo_adapted, 0),
+            False,
+            False,
+            eps,
+        )
+    else:
+        if recording():
+            iterations = _pmv_iterations(
+                tdb, tr, vr, rh, met_adapted, clo_adapted, 0, eps
+            )
+            record("pmv_athb", "t_cl", iterations, iterations <= _PMV_MAX_ITERATIONS)
+
+        # the PMV without the applicability limits of ISO 7730
+        nan_on_failure = returning_nan()
+        pmv_res = _pmv_iso_optimized(
+            tdb,
+            tr,
+            vr,
+            rh,
+            met_adapted,
+            clo_adapted,
+            0,
+            False,
+            False,
+            nan_on_failure,
+            eps,
+        )
+        if nan_on_failure:
+            failed = nan_failures(
+                pmv_res,
+                lambda *inputs: _pmv_iterations(*inputs) > _PMV_MAX_ITERATIONS,
+                tdb,
+                tr,
+                vr,
+                rh,
+                met_adapted,
+                clo_adapted,
+                0,
+                eps,
+            )
+            record_failures("pmv_athb", "t_cl", failed)
     ts = 0.303 * np.exp(-0.036 * met_adapted * met_to_w_m2) + 0.028
     l_adapted = pmv_res / ts
 
@@ -122,5 +187,6 @@ def pmv_athb(
         - 0.0002909 * l_adapted * met_adapted * t_running_mean,
         3,
     )
+    lap("kernel")
 
     return ATHB(athb_pmv=athb_pmv)
@@ -5,9 +5,11 @@ import numpy as np
 from pythermalcomfort.classes_input import EPMVInputs
 from pythermalcomfort.classes_return import EPMV
 from pythermalcomfort.models.pmv_ppd_iso import pmv_ppd_iso
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import Models, Units
 
 
+@profiled
 def pmv_e(
     tdb: float | list[float],
     tr: float | list[float],
@@ -114,6 +116,7 @@ def pmv_e(
         wme=wme,
         units=units,
     )
+    lap("validation")
 
     default_kwargs = {"units": units, "limit_inputs": limit_inputs}
     met = np.asarray(met)
@@ -142,5 +145,6 @@ def pmv_e(
     ).pmv
 
     e_pmv_value = np.around(_pmv * e_coefficient, 2)
+    lap("kernel")
 
     return EPMV(e_pmv=e_pmv_value)
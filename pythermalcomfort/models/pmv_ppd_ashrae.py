@@ -4,17 +4,34 @@ import numpy as np
 
 from pythermalcomfort.classes_input import PMVPPDInputs
 from pythermalcomfort.classes_return import PMVPPD
-from pythermalcomfort.models._pmv_ppd_optimized import _pmv_ppd_optimized
+from pythermalcomfort.models._compliance_optimized import _ashrae_55_2023_compliance
+from pythermalcomfort.models._pmv_ppd_optimized import (
+    _PMV_MAX_ITERATIONS,
+    _pmv_ashrae_iterations,
+    _pmv_ashrae_optimized,
+    _pmv_ashrae_sequential,
+    _pmv_warm_start,
+)
 from pythermalcomfort.models.cooling_effect import cooling_effect
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.shared_functions import _finalize_scalar_or_array, mapping
+from pythermalcomfort.solvers import (
+    nan_failures,
+    record,
+    record_failures,
+    recording,
+    returning_nan,
+    warm_starting,
+)
 from pythermalcomfort.utilities import (
     Models,
     Units,
-    _check_standard_compliance_array,
     units_converter,
 )
 
 
+@profiled
 def pmv_ppd_ashrae(
     tdb: float | list[float],
     tr: float | list[float],
@@ -153,6 +170,7 @@ def pmv_ppd_ashrae(
         limit_inputs=limit_inputs,
         airspeed_control=airspeed_control,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -161,9 +179,11 @@ def pmv_ppd_ashrae(
     met = np.asarray(met)
     clo = np.asarray(clo)
     wme = np.asarray(wme)
+    lap("array conversion")
 
     if units.upper() == Units.IP.value:
         tdb, tr, vr = units_converter(tdb=tdb, tr=tr, v=vr)
+    lap("unit conversion")
 
     model = model.lower()
     if model not in [Models.ashrae_55_2023.value]:
@@ -173,61 +193,99 @@ def pmv_ppd_ashrae(
         )
         raise ValueError(error_msg)
 
-    (
-        tdb_valid,
-        tr_valid,
-        v_valid,
-        met_valid,
-        clo_valid,
-    ) = _check_standard_compliance_array(
-        standard=Models.ashrae_55_2023.value,
-        tdb=tdb,
-        tr=tr,
-        v=vr,
-        met=met,
-        clo=clo,
-        airspeed_control=airspeed_control,
-    )
+    tdb, tr, vr, rh, met, clo, wme = np.broadcast_arrays(tdb, tr, vr, rh, met, clo, wme)
+    lap("array conversion")
 
-    # if v_r is higher than 0.1 follow methodology ASHRAE Appendix H, H3
-    ce = np.where(
-        vr > 0.1,
-        cooling_effect(tdb=tdb, tr=tr, vr=vr, rh=rh, met=met, clo=clo, wme=wme).ce,
-        0.0,
-    )
+    # if v_r is higher than 0.1 follow methodology ASHRAE Appendix H, H3. The
+    # cooling effect is only solved for the inputs within the applicability limits
+    ce = np.zeros(tdb.shape)
+    solve_ce = vr > 0.1
+    if limit_inputs:
+        solve_ce &= _ashrae_55_2023_compliance(tdb, tr, vr, met, clo, airspeed_control)
+    if np.any(solve_ce):
+        ce[solve_ce] = cooling_effect(
+            tdb=tdb[solve_ce],
+            tr=tr[solve_ce],
+            vr=vr[solve_ce],
+            rh=rh[solve_ce],
+            met=met[solve_ce],
+            clo=clo[solve_ce],
+            wme=wme[solve_ce],
+        ).ce
 
-    tdb = tdb - ce
-    tr = tr - ce
-    vr = np.where(ce > 0, 0.1, vr)
+    eps = tolerances().pmv
+    if warm_starting():
+        # each element starts from the clothing temperature of the previous one
+        pmv_array = _pmv_warm_start(
+            "pmv_ppd_ashrae",
+            _pmv_ashrae_sequential,
+            (tdb, tr, vr, rh, met, clo, wme, ce),
+            limit_inputs,
+            airspeed_control,
+            eps,
+        )
+    else:
+        if recording():
+            iterations = _pmv_ashrae_iterations(
+                tdb, tr, vr, rh, met, clo, wme, ce, limit_inputs, airspeed_control, eps
+            )
+            record(
+                "pmv_ppd_ashrae", "t_cl", iterations, iterations <= _PMV_MAX_ITERATIONS
+            )
 
-    pmv_array = _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme)
+        # inputs outside the applicability limits short-circuit to nan in the kernel
+        nan_on_failure = returning_nan()
+        pmv_array = _pmv_ashrae_optimized(
+            tdb,
+            tr,
+            vr,
+            rh,
+            met,
+            clo,
+            wme,
+            ce,
+            limit_inputs,
+            airspeed_control,
+            nan_on_failure,
+            eps,
+        )
+        if nan_on_failure:
+            failed = nan_failures(
+                pmv_array,
+                lambda *inputs: _pmv_ashrae_iterations(*inputs) > _PMV_MAX_ITERATIONS,
+                tdb,
+                tr,
+                vr,
+                rh,
+                met,
+                clo,
+                wme,
+                ce,
+                limit_inputs,
+                airspeed_control,
+                eps,
+            )
+            record_failures("pmv_ppd_ashrae", "t_cl", failed)
 
     ppd_array = 100.0 - 95.0 * np.exp(
         -0.03353 * pmv_array**4.0 - 0.2179 * pmv_array**2.0,
     )
+    lap("kernel")
 
     # Calculate compliance: True if -0.5 < PMV < 0.5
     compliance_array = (pmv_array > -0.5) & (pmv_array < 0.5)
     # Ensure object dtype for compliance array
     compliance_array = np.asarray(compliance_array, dtype=object)
 
-    # Checks that inputs are within the bounds accepted by the model if not return nan
     if limit_inputs:
-        all_valid = ~(
-            np.isnan(tdb_valid)
-            | np.isnan(tr_valid)
-            | np.isnan(v_valid)
-            | np.isnan(met_valid)
-            | np.isnan(clo_valid)
-        )
-        pmv_array = np.where(all_valid, pmv_array, np.nan)
-        ppd_array = np.where(all_valid, ppd_array, np.nan)
-        compliance_array = np.where(all_valid, compliance_array, np.nan)
+        compliance_array[np.isnan(pmv_array)] = np.nan
         compliance_array = _finalize_scalar_or_array(compliance_array)
+    lap("compliance masking")
 
     if round_output:
         pmv_array = np.round(pmv_array, 2)
         ppd_array = np.round(ppd_array, 1)
+    lap("rounding")
 
     thermal_sensation = {
         -2.5: "Cold",
@@ -239,9 +297,7 @@ def pmv_ppd_ashrae(
         10: "Hot",
     }
 
-    return PMVPPD(
-        pmv=pmv_array,
-        ppd=ppd_array,
-        tsv=mapping(pmv_array, thermal_sensation),
-        compliance=compliance_array,
-    )
+    tsv = mapping(pmv_array, thermal_sensation)
+    lap("category mapping")
+
+    return PMVPPD(pmv=pmv_array, ppd=ppd_array, tsv=tsv, compliance=compliance_array)
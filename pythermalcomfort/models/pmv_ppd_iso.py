@@ -4,16 +4,28 @@ import numpy as np
 
 from pythermalcomfort.classes_input import PMVPPDInputs
 from pythermalcomfort.classes_return import PMVPPD
-from pythermalcomfort.models._pmv_ppd_optimized import _pmv_ppd_optimized
-from pythermalcomfort.shared_functions import mapping, valid_range
-from pythermalcomfort.utilities import (
-    Models,
-    Units,
-    _check_standard_compliance_array,
-    units_converter,
+from pythermalcomfort.models._pmv_ppd_optimized import (
+    _PMV_MAX_ITERATIONS,
+    _pmv_iso_iterations,
+    _pmv_iso_optimized,
+    _pmv_iso_sequential,
+    _pmv_warm_start,
 )
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.shared_functions import mapping
+from pythermalcomfort.solvers import (
+    nan_failures,
+    record,
+    record_failures,
+    recording,
+    returning_nan,
+    warm_starting,
+)
+from pythermalcomfort.utilities import Models, Units
 
 
+@profiled
 def pmv_ppd_iso(
     tdb: float | list[float],
     tr: float | list[float],
@@ -144,6 +156,7 @@ def pmv_ppd_iso(
         units=units,
         limit_inputs=limit_inputs,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -152,9 +165,7 @@ def pmv_ppd_iso(
     met = np.asarray(met)
     clo = np.asarray(clo)
     wme = np.asarray(wme)
-
-    if units.upper() == Units.IP.value:
-        tdb, tr, vr = units_converter(tdb=tdb, tr=tr, v=vr)
+    lap("array conversion")
 
     model = model.lower()
     if model not in [Models.iso_7730_2005.value]:
@@ -162,45 +173,57 @@ def pmv_ppd_iso(
             "PMV calculations can only be performed in compliance with ISO 7730-2005",
         )
 
-    (
-        tdb_valid,
-        tr_valid,
-        v_valid,
-        met_valid,
-        clo_valid,
-    ) = _check_standard_compliance_array(
-        standard=Models.iso_7730_2005.value,
-        tdb=tdb,
-        tr=tr,
-        v=vr,
-        met=met,
-        clo=clo,
-    )
-
-    pmv_array = _pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme)
+    units_ip = units.upper() == Units.IP.value
+    eps = tolerances().pmv
+    if warm_starting():
+        # each element starts from the clothing temperature of the previous one
+        pmv_array = _pmv_warm_start(
+            "pmv_ppd_iso",
+            _pmv_iso_sequential,
+            (tdb, tr, vr, rh, met, clo, wme),
+            limit_inputs,
+            units_ip,
+            eps,
+        )
+    else:
+        if recording():
+            iterations = _pmv_iso_iterations(
+                tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, eps
+            )
+            record("pmv_ppd_iso", "t_cl", iterations, iterations <= _PMV_MAX_ITERATIONS)
+
+        # IP inputs are converted in the kernel, inputs outside the applicability
+        # limits short-circuit to nan
+        nan_on_failure = returning_nan()
+        pmv_array = _pmv_iso_optimized(
+            tdb, tr, vr, rh, met, clo, wme, limit_inputs, units_ip, nan_on_failure, eps
+        )
+        if nan_on_failure:
+            failed = nan_failures(
+                pmv_array,
+                lambda *inputs: _pmv_iso_iterations(*inputs) > _PMV_MAX_ITERATIONS,
+                tdb,
+                tr,
+                vr,
+                rh,
+                met,
+                clo,
+                wme,
+                limit_inputs,
+                units_ip,
+                eps,
+            )
+            record_failures("pmv_ppd_iso", "t_cl", failed)
 
     ppd_array = 100.0 - 95.0 * np.exp(
         -0.03353 * pmv_array**4.0 - 0.2179 * pmv_array**2.0,
     )
-
-    # Checks that inputs are within the bounds accepted by the model if not return nan
-    if limit_inputs:
-        pmv_valid = valid_range(pmv_array, (-2, 2))  # this is the ISO limit
-
-        all_valid = ~(
-            np.isnan(tdb_valid)
-            | np.isnan(tr_valid)
-            | np.isnan(v_valid)
-            | np.isnan(met_valid)
-            | np.isnan(clo_valid)
-            | np.isnan(pmv_valid)
-        )
-        pmv_array = np.where(all_valid, pmv_array, np.nan)
-        ppd_array = np.where(all_valid, ppd_array, np.nan)
+    lap("kernel")
 
     if round_output:
         pmv_array = np.round(pmv_array, 2)
         ppd_array = np.round(ppd_array, 1)
+    lap("rounding")
 
     thermal_sensation = {
         -2.5: "Cold",
@@ -212,8 +235,7 @@ def pmv_ppd_iso(
         10: "Hot",
     }
 
-    return PMVPPD(
-        pmv=pmv_array,
-        ppd=ppd_array,
-        tsv=mapping(pmv_array, thermal_sensation, right=False),
-    )
+    tsv = mapping(pmv_array, thermal_sensation, right=False)
+    lap("category mapping")
+
+    return PMVPPD(pmv=pmv_array, ppd=ppd_array, tsv=tsv)
@@ -11,6 +11,7 @@ import numpy as np
 
 from pythermalcomfort.classes_input import RidgeRegressionInputs
 from pythermalcomfort.classes_return import PredictedBodyTemperatures
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.shared_functions import valid_range
 from pythermalcomfort.utilities import Sex
 
@@ -190,6 +191,7 @@ def _check_ridge_regression_compliance(
     return age_valid, height_valid, weight_valid, temp_valid, rh_valid
 
 
+@profiled
 def ridge_regression_predict_t_re_t_sk(
     sex: Sex | str | list[Sex | str],
     age: float | list[float],
@@ -340,6 +342,7 @@ def ridge_regression_predict_t_re_t_sk(
         limit_inputs=limit_inputs,
         round_output=round_output,
     )
+    lap("validation")
 
     # Convert height from m to cm, handling both scalar and list-like inputs
     height_cm = np.asarray(height) * 100
@@ -367,6 +370,7 @@ def ridge_regression_predict_t_re_t_sk(
     inputs = np.broadcast_arrays(sex_value, age, height_cm, weight, tdb, rh)
     original_shape = inputs[0].shape
     flat_inputs = [np.ravel(i) for i in inputs]
+    lap("array conversion")
 
     if limit_inputs:
         (
@@ -382,6 +386,7 @@ def ridge_regression_predict_t_re_t_sk(
             flat_inputs[4],
             flat_inputs[5],
         )
+    lap("compliance masking")
 
     if t_re is not None and t_sk is not None:
         try:
@@ -438,6 +443,7 @@ def ridge_regression_predict_t_re_t_sk(
         final_features,
         duration=duration,
     )
+    lap("kernel")
 
     if limit_inputs:
         all_valid = ~(
@@ -451,10 +457,12 @@ def ridge_regression_predict_t_re_t_sk(
         validity_mask = all_valid[:, np.newaxis]
         final_t_re_hist = np.where(validity_mask, final_t_re_hist, np.nan)
         final_t_sk_hist = np.where(validity_mask, final_t_sk_hist, np.nan)
+    lap("compliance masking")
 
     if round_output:
         final_t_re_hist = np.round(final_t_re_hist, 2)
         final_t_sk_hist = np.round(final_t_sk_hist, 2)
+    lap("rounding")
 
     # If original input was scalar, return 1D array instead of 2D
     if not original_shape:
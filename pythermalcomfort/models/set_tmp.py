@@ -4,14 +4,21 @@ import numpy as np
 
 from pythermalcomfort.classes_input import SETInputs
 from pythermalcomfort.classes_return import SET
-from pythermalcomfort.models.two_nodes_gagge import two_nodes_gagge
-from pythermalcomfort.utilities import (
-    Models,
-    Postures,
-    _check_standard_compliance_array,
+from pythermalcomfort.memo import memoized
+from pythermalcomfort.models._compliance_optimized import _ashrae_55_2023_compliance
+from pythermalcomfort.models.two_nodes_gagge import (
+    _record_gagge_failures,
+    _record_gagge_iterations,
+    _set_optimized,
 )
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import recording, returning_nan
+from pythermalcomfort.utilities import Postures, p_sat_torr
 
 
+@profiled
+@memoized
 def set_tmp(
     tdb: float | list[float],
     tr: float | list[float],
@@ -99,6 +106,7 @@ def set_tmp(
     met = np.asarray(met)
     clo = np.asarray(clo)
     wme = np.asarray(wme)
+    lap("array conversion")
 
     # Validate inputs using the SetTmpInputs class
     SETInputs(
@@ -114,47 +122,61 @@ def set_tmp(
         position=position,
         limit_inputs=limit_inputs,
     )
-
-    set_array = two_nodes_gagge(
-        tdb=tdb,
-        tr=tr,
-        v=v,
-        rh=rh,
-        met=met,
-        clo=clo,
-        wme=wme,
-        body_surface_area=body_surface_area,
-        p_atm=p_atm,
-        position=position,
-        calculate_ce=calculate_ce,
-        round_output=False,
-    ).set
-
-    if limit_inputs:
-        (
-            tdb_valid,
-            tr_valid,
-            v_valid,
-            met_valid,
-            clo_valid,
-        ) = _check_standard_compliance_array(
-            standard=Models.ashrae_55_2023.value,
-            tdb=tdb,
-            tr=tr,
-            v=v,
-            met=met,
-            clo=clo,
+    lap("validation")
+
+    sitting = np.asarray(position) == Postures.sitting.value
+    nan_on_failure = returning_nan()
+    tolerance = tolerances().gagge
+    # the inputs of the two-node model, to count its iterations again element
+    # by element. The cooling effect calculation always assumes a standing person
+    kernel_inputs = {}
+    if recording() or nan_on_failure:
+        kernel_inputs = {
+            "tdb": tdb,
+            "tr": tr,
+            "v": v,
+            "met": met,
+            "clo": clo,
+            "vapor_pressure": rh * p_sat_torr(tdb) / 100,
+            "wme": wme,
+            "body_surface_area": body_surface_area,
+            "p_atm": p_atm,
+            "position": np.where(sitting & (not calculate_ce), "sitting", "standing"),
+            "calculate_ce": calculate_ce,
+            "tolerance": tolerance,
+        }
+    if recording():
+        _record_gagge_iterations(
+            "set_tmp",
+            solve=_ashrae_55_2023_compliance(tdb, tr, v, met, clo, True)
+            if limit_inputs
+            else None,
+            **kernel_inputs,
         )
-        all_valid = ~(
-            np.isnan(tdb_valid)
-            | np.isnan(tr_valid)
-            | np.isnan(v_valid)
-            | np.isnan(met_valid)
-            | np.isnan(clo_valid)
-        )
-        set_array = np.where(all_valid, set_array, np.nan)
+
+    # inputs outside the applicability limits short-circuit to nan in the kernel
+    set_array = _set_optimized(
+        tdb,
+        tr,
+        v,
+        rh,
+        met,
+        clo,
+        wme,
+        body_surface_area,
+        p_atm,
+        sitting,
+        calculate_ce,
+        limit_inputs,
+        nan_on_failure,
+        tolerance,
+    )
+    if nan_on_failure:
+        _record_gagge_failures("set_tmp", set_array, **kernel_inputs)
+    lap("kernel")
 
     if round_output:
         set_array = np.around(set_array, 1)
+    lap("rounding")
 
     return SET(set=set_array)
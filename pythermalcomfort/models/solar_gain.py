@@ -6,9 +6,11 @@ import numpy as np
 
 from pythermalcomfort.classes_input import SolarGainInputs
 from pythermalcomfort.classes_return import SolarGain
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import Postures, transpose_sharp_altitude
 
 
+@profiled
 def solar_gain(
     sol_altitude: float | list[float],
     sharp: float | list[float],
@@ -131,6 +133,7 @@ def solar_gain(
         asw=asw,
         floor_reflectance=floor_reflectance,
     )
+    lap("validation")
 
     sol_altitude = np.asarray(sol_altitude)
     sharp = np.asarray(sharp)
@@ -140,6 +143,7 @@ def solar_gain(
     f_bes = np.asarray(f_bes)
     asw = np.asarray(asw)
     floor_reflectance = np.asarray(floor_reflectance)
+    lap("array conversion")
 
     posture = posture.lower()
     if posture not in [
@@ -163,10 +167,12 @@ def solar_gain(
         floor_reflectance=floor_reflectance,
         posture=posture,
     )
+    lap("kernel")
 
     if round_output:
         erf = np.round(erf, 1)
         d_mrt = np.round(d_mrt, 1)
+    lap("rounding")
 
     return SolarGain(erf=erf, delta_mrt=d_mrt)
 
@@ -9,6 +9,8 @@ from scipy.optimize import brentq
 from pythermalcomfort.classes_input import SportsHeatStressInputs
 from pythermalcomfort.classes_return import SportsHeatStressRisk
 from pythermalcomfort.models import phs
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import muted, record_elements, recording
 from pythermalcomfort.utilities import validate_type
 
 
@@ -85,6 +87,7 @@ class Sports:
     WALKING = _SportsValues(clo=0.5, met=5.0, vr=0.5, duration=180)
 
 
+@profiled
 def sports_heat_stress_risk(
     tdb: float | list[float] | np.ndarray,
     tr: float | list[float] | np.ndarray,
@@ -175,21 +178,33 @@ def sports_heat_stress_risk(
 
     # Validate inputs using the input dataclass
     inputs = SportsHeatStressInputs(tdb=tdb, tr=tr, rh=rh, vr=vr, sport=sport)
+    lap("validation")
 
     # Convert to numpy arrays for vectorized calculation
     tdb = np.asarray(inputs.tdb, dtype=float)
     tr = np.asarray(inputs.tr, dtype=float)
     rh = np.asarray(inputs.rh, dtype=float)
     vr = np.asarray(inputs.vr, dtype=float)
+    lap("array conversion")
 
     # Vectorize the calculation function to handle arrays
     # Returns (risk_level_interpolated, t_medium, t_high, t_extreme, recommendation) for each input
     vectorized_calc = np.vectorize(
-        _calc_risk_single_value, otypes=[float, float, float, float, str]
-    )
-    risk_levels, t_mediums, t_highs, t_extremes, recommendations = vectorized_calc(
-        tdb=tdb, tr=tr, rh=rh, vr=vr, sport=sport
+        _calc_risk_single_value,
+        otypes=[float, float, float, float, str],
+        excluded={"stats"},
     )
+    stats = [] if recording() else None
+    # the calls of phs in the root solver are not recorded
+    with muted():
+        risk_levels, t_mediums, t_highs, t_extremes, recommendations = vectorized_calc(
+            tdb=tdb, tr=tr, rh=rh, vr=vr, sport=sport, stats=stats
+        )
+    if stats is not None:
+        record_elements(
+            "sports_heat_stress_risk", "brentq", stats, np.shape(risk_levels)
+        )
+    lap("kernel")
 
     return SportsHeatStressRisk(
         risk_level_interpolated=risk_levels,
@@ -201,7 +216,12 @@ def sports_heat_stress_risk(
 
 
 def _calc_risk_single_value(
-    tdb: float, tr: float, rh: float, vr: float, sport: _SportsValues
+    tdb: float,
+    tr: float,
+    rh: float,
+    vr: float,
+    sport: _SportsValues,
+    stats: list[tuple[int, bool]] | None = None,
 ) -> tuple[float, float, float, float, str]:
     """Calculate the risk level and threshold temperatures for a single set of inputs.
 
@@ -217,6 +237,9 @@ def _calc_risk_single_value(
         Relative air speed, [m/s].
     sport : _SportsValues
         Sport-specific parameters (clo, met, vr, duration).
+    stats : list, optional
+        If given, the iterations of the root solver, summed over the two
+        thresholds, and whether both thresholds were found are appended to it.
 
     Returns
     -------
@@ -238,6 +261,8 @@ def _calc_risk_single_value(
 
     if tdb < min_t_medium:
         # Low risk - use default thresholds and risk level 0
+        if stats is not None:
+            stats.append((0, True))
         return (
             0.0,
             min_t_medium,
@@ -247,6 +272,8 @@ def _calc_risk_single_value(
         )
     if tdb > max_t_high:
         # Extreme risk - use maximum thresholds and risk level 3
+        if stats is not None:
+            stats.append((0, True))
         return (
             3.0,
             max_t_low,
@@ -275,13 +302,19 @@ def _calc_risk_single_value(
         sl_scalar = float(np.asarray(sl))
         return float(sl_scalar / float(sport.duration) * 45.0 - float(sweat_loss_g))
 
+    iterations = 0
+    converged = True
     for min_t, max_t in [(0, 36), (20, 50)]:
         try:
-            t_medium = brentq(calculate_threshold_water_loss, min_t, max_t)
+            t_medium, result = brentq(
+                calculate_threshold_water_loss, min_t, max_t, full_output=True
+            )
+            iterations += result.iterations
             break
         except ValueError:
             continue
     else:
+        converged = False
         msg = (
             f"Solver did not find a solution for low-medium threshold for {tdb=} and {rh=}: "
             f"all bracket ranges failed. Setting t_medium to max threshold of {max_t_low}°C."
@@ -309,11 +342,15 @@ def _calc_risk_single_value(
 
     for min_t, max_t in [(0, 36), (20, 50)]:
         try:
-            t_extreme = brentq(calculate_threshold_core, min_t, max_t)
+            t_extreme, result = brentq(
+                calculate_threshold_core, min_t, max_t, full_output=True
+            )
+            iterations += result.iterations
             break
         except ValueError:
             continue
     else:
+        converged = False
         msg = (
             f"Solver did not find a solution for high-extreme threshold for {tdb=} and {rh=}: "
             f"all bracket ranges failed. Setting t_extreme to max threshold of {max_t_high}°C."
@@ -321,6 +358,9 @@ def _calc_risk_single_value(
         warnings.warn(msg, stacklevel=2)
         t_extreme = max_t_high
 
+    if stats is not None:
+        stats.append((iterations, converged))
+
     # calculate t_high as the average of t_medium and t_extreme
     t_high = (
         (t_medium + t_extreme) / 2
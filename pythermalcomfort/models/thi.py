@@ -4,12 +4,18 @@ import numpy as np
 
 from pythermalcomfort.classes_input import THIInputs
 from pythermalcomfort.classes_return import THI
+from pythermalcomfort.models._outdoor_optimized import _thi_optimized
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.utilities import Conditions, _unpack_conditions
 
 
+@profiled
 def thi(
-    tdb: float | list[float],
-    rh: float | list[float],
+    tdb: float | list[float] = None,
+    rh: float | list[float] = None,
     round_output: bool = True,
+    *,
+    conditions: Conditions | None = None,
 ) -> THI:
     """Calculate the Temperature-Humidity Index (THI) defined in [Yan2025]_, equivalent
     to the definition in [Schlatter1987]_, but uses Celsius instead of Fahrenheit.
@@ -22,6 +28,10 @@ def thi(
         Relative humidity, [%].
     round_output : bool, optional
         If True, rounds output value. If False, it does not round it. Defaults to True.
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb` and `rh` that are not passed are taken from it.
 
     Returns
     -------
@@ -31,19 +41,25 @@ def thi(
         To access the `thi` value, use the `thi` attribute of the returned `THI`
         instance, e.g., `result.thi`.
     """
+    tdb, rh = _unpack_conditions("thi", conditions, tdb=tdb, rh=rh)
+
     # Validate inputs using the THIInputs class
     THIInputs(
         tdb=tdb,
         rh=rh,
         round_output=round_output,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     rh = np.asarray(rh)
+    lap("array conversion")
 
-    _thi = 1.8 * tdb + 32 - 0.55 * (1 - 0.01 * rh) * (1.8 * tdb - 26)
+    _thi = _thi_optimized(tdb, rh)
+    lap("kernel")
 
     if round_output:
         _thi = np.round(_thi, 1)
+    lap("rounding")
 
     return THI(thi=_thi)
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import math
+from typing import Any
 
 import numpy as np
-from numba import float64, jit, vectorize
+from numba import boolean, float64, jit
 
 from pythermalcomfort.classes_input import GaggeTwoNodesInputs
 from pythermalcomfort.classes_return import SET, GaggeTwoNodes
+from pythermalcomfort.models._compliance_optimized import _ashrae_55_2023_valid
+from pythermalcomfort.models._parallel_optimized import _vectorize_parallel
+from pythermalcomfort.precision import tolerances
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.solvers import (
+    record,
+    record_failures,
+    recording,
+    returning_nan,
+)
 from pythermalcomfort.utilities import Postures, met_to_w_m2, p_sat_torr
 
 
+@profiled
 def two_nodes_gagge(
     tdb: float | list[float],
     tr: float | list[float],
@@ -114,6 +126,7 @@ def two_nodes_gagge(
         max_sweating=max_sweating,
         w_max=w_max,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -123,9 +136,39 @@ def two_nodes_gagge(
     clo = np.asarray(clo)
     wme = np.asarray(wme)
     position = np.asarray(position)
+    lap("array conversion")
 
     vapor_pressure = rh * p_sat_torr(tdb) / 100
 
+    # the inputs of the kernel, to count its iterations again element by element.
+    # The cooling effect is calculated for a standing person with the default
+    # thermoregulation parameters
+    kernel_inputs = {
+        "tdb": tdb,
+        "tr": tr,
+        "v": v,
+        "met": met,
+        "clo": clo,
+        "vapor_pressure": vapor_pressure,
+        "wme": wme,
+        "body_surface_area": body_surface_area,
+        "p_atm": p_atm,
+        "tolerance": tolerances().gagge,
+        **(
+            {"position": "standing", "calculate_ce": True}
+            if calculate_ce
+            else {
+                "position": position,
+                "max_skin_blood_flow": max_skin_blood_flow,
+                "max_sweating": max_sweating,
+                "w_max": w_max,
+            }
+        ),
+    }
+    if recording():
+        _record_gagge_iterations("two_nodes_gagge", **kernel_inputs)
+    nan_on_failure = returning_nan()
+
     if calculate_ce:
         result = _gagge_two_nodes_optimized_return_set(
             tdb,
@@ -138,7 +181,12 @@ def two_nodes_gagge(
             body_surface_area,
             p_atm,
             1,
+            nan_on_failure,
+            kernel_inputs["tolerance"],
         )
+        if nan_on_failure:
+            _record_gagge_failures("two_nodes_gagge", result, **kernel_inputs)
+        lap("kernel")
         return SET(set=result)
 
     (
@@ -175,7 +223,12 @@ def two_nodes_gagge(
         max_skin_blood_flow=max_skin_blood_flow,
         max_sweating=max_sweating,
         w_max=w_max,
+        nan_on_failure=nan_on_failure,
+        tolerance=kernel_inputs["tolerance"],
     )
+    if nan_on_failure:
+        _record_gagge_failures("two_nodes_gagge", _set, **kernel_inputs)
+    lap("kernel")
 
     output = {
         "e_skin": e_skin,
@@ -201,10 +254,15 @@ def two_nodes_gagge(
     if round_output:
         for key in output:
             output[key] = np.around(output[key], 2)
+    lap("rounding")
 
     return GaggeTwoNodes(**output)
 
 
+# outputs of _gagge_two_nodes_optimized for the inputs that do not converge
+_GAGGE_FAILED = (np.nan,) * 18
+
+
 @jit(nopython=True, cache=True)
 def _gagge_two_nodes_optimized(
     tdb,
@@ -221,6 +279,9 @@ def _gagge_two_nodes_optimized(
     max_skin_blood_flow=90,
     max_sweating=500,
     w_max=None,
+    counters=None,
+    nan_on_failure=False,
+    tolerance=0.01,
 ) -> tuple[
     float,
     float,
@@ -319,7 +380,8 @@ def _gagge_two_nodes_optimized(
     q_res = 0.0023 * m * (44.0 - vapor_pressure)  # latent heat loss due to respiration
     c_res = 0.0014 * m * (34.0 - tdb)  # sensible convective heat loss respiration
 
-    while n_simulation < length_time_simulation:
+    failed = False  # the clothing temperature did not converge
+    while n_simulation < length_time_simulation and not failed:
         n_simulation += 1
 
         iteration_limit = 150  # for following while loop
@@ -340,14 +402,21 @@ def _gagge_two_nodes_optimized(
             r_a = 1.0 / (f_a_cl * h_t)
             t_op = (h_r * tr + h_cc * tdb) / h_t
             t_cl_new = (r_a * t_skin + r_clo * t_op) / (r_a + r_clo)
-            if abs(t_cl_new - t_cl) <= 0.01:
+            if abs(t_cl_new - t_cl) <= tolerance:
                 tc_converged = True
             t_cl = t_cl_new
             n_iterations += 1
+            if counters is not None:
+                counters[0] += 1
 
             if n_iterations > iteration_limit:
+                if nan_on_failure:
+                    failed = True
+                    break
                 max_iteration_exceeded = "Max iterations exceeded"
                 raise StopIteration(max_iteration_exceeded)
+        if failed:
+            break
 
         q_sensible = (t_skin - t_op) / (r_a + r_clo)  # total sensible heat loss, W
         # hf_cs rate of energy transport between core and skin, W
@@ -418,6 +487,9 @@ def _gagge_two_nodes_optimized(
         m = rm + met_shivering
         alfa = 0.0417737 + 0.7451833 / (m_bl + 0.585417)
 
+    if failed:
+        return _GAGGE_FAILED
+
     q_skin = q_sensible + e_skin  # total heat loss from skin, W
     # p_s_sk saturation vapour pressure of water of the skin
     p_s_sk = math.exp(18.6686 - 4030.183 / (t_skin + 235.0))
@@ -456,7 +528,7 @@ def _gagge_two_nodes_optimized(
     delta = 0.0001
     dx = 100.0
     set_old = round(t_skin - q_skin / h_d_s, 2)
-    while abs(dx) > 0.01:
+    while abs(dx) > tolerance:
         err_1 = (
             q_skin
             - h_d_s * (t_skin - set_old)
@@ -477,6 +549,8 @@ def _gagge_two_nodes_optimized(
         _set = set_old - delta * err_1 / (err_2 - err_1)
         dx = _set - set_old
         set_old = _set
+        if counters is not None:
+            counters[1] += 1
 
     # calculate Effective Temperature (ET)
     h_d = 1 / (r_a + r_clo)
@@ -484,7 +558,7 @@ def _gagge_two_nodes_optimized(
     et_old = t_skin - q_skin / h_d
     delta = 0.0001
     dx = 100.0
-    while abs(dx) > 0.01:
+    while abs(dx) > tolerance:
         err_1 = (
             q_skin
             - h_d * (t_skin - et_old)
@@ -502,6 +576,8 @@ def _gagge_two_nodes_optimized(
         et = et_old - delta * err_1 / (err_2 - err_1)
         dx = et - et_old
         et_old = et
+        if counters is not None:
+            counters[2] += 1
 
     tbm_l = (
         0.194 / met_to_w_m2
@@ -560,7 +636,7 @@ def _gagge_two_nodes_optimized(
     )
 
 
-@vectorize(
+@_vectorize_parallel(
     [  # signature: output(float64)
         float64(
             float64,
@@ -573,9 +649,10 @@ def _gagge_two_nodes_optimized(
             float64,
             float64,
             float64,
+            boolean,
+            float64,
         ),
     ],
-    cache=True,
 )
 def _gagge_two_nodes_optimized_return_set(
     tdb,
@@ -588,6 +665,8 @@ def _gagge_two_nodes_optimized_return_set(
     body_surface_area,
     p_atm,
     position,
+    nan_on_failure,
+    tolerance,
 ):
     return _gagge_two_nodes_optimized(
         tdb=tdb,
@@ -601,4 +680,134 @@ def _gagge_two_nodes_optimized_return_set(
         p_atm=p_atm,
         position=position,
         calculate_ce=True,
+        nan_on_failure=nan_on_failure,
+        tolerance=tolerance,
+    )[0]
+
+
+@_vectorize_parallel(
+    [
+        float64(
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+            boolean,
+            boolean,
+            float64,
+        ),
+    ],
+)
+def _set_optimized(
+    tdb,
+    tr,
+    v,
+    rh,
+    met,
+    clo,
+    wme,
+    body_surface_area,
+    p_atm,
+    sitting,
+    calculate_ce,
+    limit_inputs,
+    nan_on_failure,
+    tolerance,
+):
+    # inputs outside the ASHRAE 55 limits are not simulated
+    if limit_inputs and not _ashrae_55_2023_valid(tdb, tr, v, met, clo, True):
+        return np.nan
+
+    vapor_pressure = rh * math.exp(18.6686 - 4030.183 / (tdb + 235.0)) / 100
+
+    # the cooling effect calculation always assumes a standing person
+    position = "standing"
+    if sitting and not calculate_ce:
+        position = "sitting"
+
+    return _gagge_two_nodes_optimized(
+        tdb=tdb,
+        tr=tr,
+        v=v,
+        met=met,
+        clo=clo,
+        vapor_pressure=vapor_pressure,
+        wme=wme,
+        body_surface_area=body_surface_area,
+        p_atm=p_atm,
+        position=position,
+        calculate_ce=calculate_ce,
+        nan_on_failure=nan_on_failure,
+        tolerance=tolerance,
     )[0]
+
+
+# solvers of _gagge_two_nodes_optimized, in the order of its counters
+_GAGGE_SOLVERS = ("t_cl", "set", "et")
+
+
+def _gagge_iterations(
+    solve: np.ndarray | None = None, **inputs: Any
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the iterations of the solvers of the two-node model, and whether they converged.
+
+    The model is run again for each element of the broadcast `inputs`, the
+    keyword arguments of :py:func:`_gagge_two_nodes_optimized`, except for the
+    elements that are False in `solve`. The first axis of the returned arrays
+    is the solver, in the order of `_GAGGE_SOLVERS`, the others have the shape
+    of the inputs.
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(value) for value in inputs.values()))
+    shape = arrays[0].shape
+    # numeric inputs as floats, to reuse the compiled kernel
+    arrays = [
+        np.ravel(a.astype(np.float64) if a.dtype.kind in "iuf" else a) for a in arrays
+    ]
+    solve = np.ravel(np.broadcast_to(True if solve is None else solve, shape))
+
+    iterations = np.zeros((len(_GAGGE_SOLVERS), solve.size), dtype=np.int64)
+    converged = np.ones((len(_GAGGE_SOLVERS), solve.size), dtype=bool)
+    for i in np.flatnonzero(solve):
+        element = {key: a[i].item() for key, a in zip(inputs, arrays, strict=True)}
+        counters = np.zeros(len(_GAGGE_SOLVERS), dtype=np.int64)
+        try:
+            result = _gagge_two_nodes_optimized(**element, counters=counters)
+        except StopIteration:
+            # the clothing temperature did not converge, the searches did not run
+            converged[:, i] = False
+        else:
+            converged[1, i] = math.isfinite(result[0])
+            converged[2, i] = math.isfinite(result[13])
+        iterations[:, i] = counters
+
+    return (
+        iterations.reshape((len(_GAGGE_SOLVERS), *shape)),
+        converged.reshape((len(_GAGGE_SOLVERS), *shape)),
+    )
+
+
+def _record_gagge_iterations(
+    model: str, solve: np.ndarray | None = None, **inputs: Any
+) -> None:
+    """Record the iterations of the solvers of the two-node model, see :py:func:`_gagge_iterations`."""
+    iterations, converged = _gagge_iterations(solve, **inputs)
+    for solver, solver_iterations, solver_converged in zip(
+        _GAGGE_SOLVERS, iterations, converged, strict=True
+    ):
+        record(model, solver, solver_iterations, solver_converged)
+
+
+def _record_gagge_failures(model: str, result: np.ndarray, **inputs: Any) -> None:
+    """Record the nan elements of `result` for which the clothing temperature did not converge."""
+    solve = np.isnan(result)
+    failed = np.zeros(np.shape(result), dtype=bool)
+    if solve.any():
+        failed = ~_gagge_iterations(solve, **inputs)[1][0]
+    record_failures(model, "t_cl", failed)
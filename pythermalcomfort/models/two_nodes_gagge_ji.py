@@ -6,9 +6,11 @@ import numpy as np
 
 from pythermalcomfort.classes_input import GaggeTwoNodesJiInputs
 from pythermalcomfort.classes_return import GaggeTwoNodesJi
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import Postures
 
 
+@profiled
 def two_nodes_gagge_ji(
     tdb: float | list[float],
     tr: float | list[float],
@@ -126,6 +128,7 @@ def two_nodes_gagge_ji(
     wme = np.asarray(wme)
     body_surface_area = np.asarray(body_surface_area)
     p_atm = np.asarray(p_atm)
+    lap("array conversion")
 
     # Validate inputs
     GaggeTwoNodesJiInputs(
@@ -140,6 +143,7 @@ def two_nodes_gagge_ji(
         p_atm=p_atm,
         position=position,
     )
+    lap("validation")
 
     excluded_params = {
         "position",
@@ -171,6 +175,7 @@ def two_nodes_gagge_ji(
         initial_skin_temp=initial_skin_temp,
         initial_core_temp=initial_core_temp,
     )
+    lap("kernel")
 
     output_data = {}
     if results_array_of_dicts.ndim == 0:
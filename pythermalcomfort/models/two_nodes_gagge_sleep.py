@@ -6,8 +6,10 @@ import numpy as np
 
 from pythermalcomfort.classes_input import GaggeTwoNodesSleepInputs
 from pythermalcomfort.classes_return import GaggeTwoNodesSleep
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def two_nodes_gagge_sleep(
     tdb: float | list[float],
     tr: float | list[float],
@@ -107,6 +109,7 @@ def two_nodes_gagge_sleep(
         wme=wme,
         p_atm=p_atm,
     )
+    lap("validation")
 
     tdb = np.atleast_1d(tdb)
     tr = np.atleast_1d(tr)
@@ -114,6 +117,7 @@ def two_nodes_gagge_sleep(
     rh = np.atleast_1d(rh)
     clo = np.atleast_1d(clo)
     thickness_quilt = np.atleast_1d(thickness_quilt)
+    lap("array conversion")
 
     # These variables should have the same length, which will be the duration
     lengths = [len(x) for x in (tdb, tr, v, rh, clo, thickness_quilt)]
@@ -174,6 +178,7 @@ def two_nodes_gagge_sleep(
 
         # results should be a list of the local dataclass
         results.append(result)
+    lap("kernel")
 
     if not results:
         output = {}
@@ -7,12 +7,14 @@ import numpy as np
 from pythermalcomfort.classes_input import UseFansHeatwavesInputs
 from pythermalcomfort.classes_return import UseFansHeatwaves
 from pythermalcomfort.models.two_nodes_gagge import two_nodes_gagge
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import (
     Postures,
     _check_standard_compliance_array,
 )
 
 
+@profiled
 def use_fans_heatwaves(
     tdb: float | list[float],
     tr: float | list[float],
@@ -108,6 +110,7 @@ def use_fans_heatwaves(
         max_skin_blood_flow=max_skin_blood_flow,
         limit_inputs=limit_inputs,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -116,6 +119,7 @@ def use_fans_heatwaves(
     met = np.asarray(met)
     clo = np.asarray(clo)
     wme = np.asarray(wme)
+    lap("array conversion")
 
     output = two_nodes_gagge(
         tdb,
@@ -176,6 +180,7 @@ def use_fans_heatwaves(
     )
 
     output = {key: output[key] for key in output_vars}
+    lap("kernel")
 
     if limit_inputs:
         (
@@ -202,8 +207,10 @@ def use_fans_heatwaves(
             | np.isnan(clo_valid)
         )
         output = {key: np.where(all_valid, output[key], np.nan) for key in output_vars}
+    lap("compliance masking")
 
     if round_output:
         output = {key: np.around(output[key], 1) for key in output_vars}
+    lap("rounding")
 
     return UseFansHeatwaves(**output)
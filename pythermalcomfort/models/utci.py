@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
-from numba import float64, vectorize
+from numba import boolean, float64, jit
 
 from pythermalcomfort.classes_input import UTCIInputs
 from pythermalcomfort.classes_return import UTCI
-from pythermalcomfort.shared_functions import mapping, valid_range
-from pythermalcomfort.utilities import Units, units_converter
+from pythermalcomfort.memo import memoized
+from pythermalcomfort.models._compliance_optimized import _utci_valid
+from pythermalcomfort.models._parallel_optimized import _vectorize_parallel
+from pythermalcomfort.models._units_optimized import _c_to_f, _f_to_c, _fps_to_ms
+from pythermalcomfort.profiling import lap, profiled
+from pythermalcomfort.shared_functions import mapping
+from pythermalcomfort.utilities import Conditions, Units, _unpack_conditions
 
 
+@profiled
+@memoized
 def utci(
-    tdb: float | list[float],
-    tr: float | list[float],
-    v: float | list[float],
-    rh: float | list[float],
+    tdb: float | list[float] = None,
+    tr: float | list[float] = None,
+    v: float | list[float] = None,
+    rh: float | list[float] = None,
     units: str = Units.SI.value,
     limit_inputs: bool = True,
     round_output: bool = True,
+    *,
+    conditions: Conditions | None = None,
 ) -> UTCI:
     """Calculate the Universal Thermal Climate Index (UTCI).
 
@@ -49,6 +60,10 @@ def utci(
         -50 < tdb [°C] < 50, tdb - 70 < tr [°C] < tdb + 30, and for 0.5 < v [m/s] < 17.0. Defaults to True.
     round_output : bool, optional
         If True, rounds output value. If False, it does not round it. Defaults to True.
+    conditions : Conditions, optional
+        Keyword only. Environmental conditions in SI units, see
+        :py:class:`~pythermalcomfort.utilities.Conditions`. The inputs
+        `tdb`, `tr`, `v` and `rh` that are not passed are taken from it.
 
     Returns
     -------
@@ -71,6 +86,10 @@ def utci(
         result = utci(tdb=[25, 40], tr=25, v=1.0, rh=50)
         print(result.utci)  # [24.6, 40.6]
     """
+    if conditions is not None and units.upper() == Units.IP.value:
+        raise ValueError("The attributes of a Conditions object are in SI units")
+    tdb, tr, v, rh = _unpack_conditions("utci", conditions, tdb=tdb, tr=tr, v=v, rh=rh)
+
     # Validate inputs using the UtciInputs class
     UTCIInputs(
         tdb=tdb,
@@ -80,51 +99,20 @@ def utci(
         units=units,
         limit_inputs=limit_inputs,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
     v = np.asarray(v)
     rh = np.asarray(rh)
+    lap("array conversion")
 
-    if units.upper() == Units.IP.value:
-        tdb, tr, v = units_converter(tdb=tdb, tr=tr, v=v)
-
-    def exponential(t_db):
-        g = [
-            -2836.5744,
-            -6028.076559,
-            19.54263612,
-            -0.02737830188,
-            0.000016261698,
-            (7.0229056 * np.power(10.0, -10)),
-            (-1.8680009 * np.power(10.0, -13)),
-        ]
-        tk = t_db + 273.15  # air temp in K
-        es = 2.7150305 * np.log1p(tk)
-        for count, i in enumerate(g):
-            es = es + (i * np.power(tk, count - 2))
-        es = np.exp(es) * 0.01  # convert Pa to hPa
-        return es
-
-    eh_pa = exponential(tdb) * (rh / 100.0)
-    delta_t_tr = tr - tdb
-    pa = eh_pa / 10.0  # convert vapour pressure to kPa
-
-    utci_approx = _utci_optimized(tdb, v, delta_t_tr, pa)
-
-    # Checks that inputs are within the bounds accepted by the model if not return nan
-    if limit_inputs:
-        tdb_valid = valid_range(tdb, (-50.0, 50.0))
-        diff_valid = valid_range(tr - tdb, (-30.0, 70.0))
-        v_valid = valid_range(v, (0.5, 17.0))
-        all_valid = ~(np.isnan(tdb_valid) | np.isnan(diff_valid) | np.isnan(v_valid))
-        utci_approx = np.where(all_valid, utci_approx, np.nan)
-
-    if units.upper() == Units.IP.value:
-        utci_approx = units_converter(
-            tmp=utci_approx,
-            from_units=Units.SI.value.lower(),
-        )[0]
+    # IP inputs and outputs are converted in the kernel, inputs outside the
+    # applicability limits short-circuit to nan
+    utci_approx = _utci_limited_optimized(
+        tdb, tr, v, rh, limit_inputs, units.upper() == Units.IP.value
+    )
+    lap("kernel")
 
     stress_categories = {
         -40.0: "extreme cold stress",
@@ -141,27 +129,16 @@ def utci(
 
     if round_output:
         utci_approx = np.round(utci_approx, 1)
+    lap("rounding")
 
-    return UTCI(
-        utci=utci_approx,
-        stress_category=mapping(utci_approx, stress_categories),
-    )
+    stress_category = mapping(utci_approx, stress_categories)
+    lap("category mapping")
 
+    return UTCI(utci=utci_approx, stress_category=stress_category)
 
-@vectorize(
-    [
-        float64(
-            float64,
-            float64,
-            float64,
-            float64,
-        ),
-    ],
-    cache=True,
-)
-def _utci_optimized(
-    tdb: float64, v: float64, delta_t_tr: float64, pa: float64
-) -> float64:
+
+@jit(nopython=True, cache=True)
+def _utci_polynomial(tdb, v, delta_t_tr, pa):
     return (
         tdb
         + 0.607562052
@@ -519,3 +496,67 @@ def _utci_optimized(
         + (2.47090539 * (10 ** (-4))) * delta_t_tr * pa * pa * pa * pa * pa
         + 0.00148348065 * pa * pa * pa * pa * pa * pa
     )
+
+
+@_vectorize_parallel(
+    [
+        float64(
+            float64,
+            float64,
+            float64,
+            float64,
+        ),
+    ],
+)
+def _utci_optimized(
+    tdb: float64, v: float64, delta_t_tr: float64, pa: float64
+) -> float64:
+    return _utci_polynomial(tdb, v, delta_t_tr, pa)
+
+
+@_vectorize_parallel(
+    [
+        float64(
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+        ),
+    ],
+)
+def _utci_limited_optimized(
+    tdb: float64,
+    tr: float64,
+    v: float64,
+    rh: float64,
+    limit_inputs: bool,
+    units_ip: bool,
+) -> float64:
+    if units_ip:
+        tdb = _f_to_c(tdb)
+        tr = _f_to_c(tr)
+        v = _fps_to_ms(v)
+
+    if limit_inputs and not _utci_valid(tdb, tr, v):
+        return np.nan
+
+    # saturation vapour pressure [hPa]
+    tk = tdb + 273.15  # air temp in K
+    es = 2.7150305 * math.log1p(tk)
+    es += -2836.5744 * tk**-2
+    es += -6028.076559 * tk**-1
+    es += 19.54263612
+    es += -0.02737830188 * tk
+    es += 0.000016261698 * tk**2
+    es += 7.0229056e-10 * tk**3
+    es += -1.8680009e-13 * tk**4
+    es = math.exp(es) * 0.01  # convert Pa to hPa
+
+    pa = es * rh / 100.0 / 10.0  # vapour pressure in kPa
+    utci_approx = _utci_polynomial(tdb, v, tr - tdb, pa)
+
+    if units_ip:
+        return _c_to_f(utci_approx)
+    return utci_approx
@@ -5,9 +5,11 @@ import numpy as np
 from pythermalcomfort.classes_input import VerticalTGradPPDInputs
 from pythermalcomfort.classes_return import VerticalTGradPPD
 from pythermalcomfort.models import pmv_ppd_ashrae
+from pythermalcomfort.profiling import lap, profiled
 from pythermalcomfort.utilities import Models, _check_standard_compliance_array
 
 
+@profiled
 def vertical_tmp_grad_ppd(
     tdb: float | list[float],
     tr: float | list[float],
@@ -94,6 +96,7 @@ def vertical_tmp_grad_ppd(
         clo=clo,
         vertical_tmp_grad=vertical_tmp_grad,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     tr = np.asarray(tr)
@@ -101,6 +104,7 @@ def vertical_tmp_grad_ppd(
     met = np.asarray(met)
     clo = np.asarray(clo)
     vertical_tmp_grad = np.asarray(vertical_tmp_grad)
+    lap("array conversion")
 
     (
         tdb_valid,
@@ -116,6 +120,7 @@ def vertical_tmp_grad_ppd(
         met=met,
         clo=clo,
     )
+    lap("compliance masking")
 
     tsv = pmv_ppd_ashrae(
         tdb=tdb,
@@ -129,9 +134,11 @@ def vertical_tmp_grad_ppd(
     numerator = np.exp(0.13 * (tsv - 1.91) ** 2 + 0.15 * vertical_tmp_grad - 1.6)
     ppd_val = (numerator / (1 + numerator) - 0.345) * 100
     acceptability = ppd_val <= 5
+    lap("kernel")
 
     if round_output:
         ppd_val = np.round(ppd_val, 1)
+    lap("rounding")
 
     all_valid = ~(
         np.isnan(tdb_valid)
@@ -143,5 +150,6 @@ def vertical_tmp_grad_ppd(
 
     ppd_val = np.where(all_valid, ppd_val, np.nan)
     acceptability = np.where(all_valid, acceptability, np.nan)
+    lap("compliance masking")
 
     return VerticalTGradPPD(ppd_vg=ppd_val, acceptability=acceptability)
@@ -5,8 +5,10 @@ import numpy.typing as npt
 
 from pythermalcomfort.classes_input import WBGTInputs
 from pythermalcomfort.classes_return import WBGT
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def wbgt(
     twb: float | npt.ArrayLike,
     tg: float | npt.ArrayLike,
@@ -75,10 +77,12 @@ def wbgt(
         with_solar_load=with_solar_load,
         round_output=round_output,
     )
+    lap("validation")
 
     twb = np.asarray(twb)
     tg = np.asarray(tg)
     tdb = np.asarray(tdb) if tdb is not None else None
+    lap("array conversion")
 
     if with_solar_load and tdb is None:
         raise ValueError("Please enter the dry bulb air temperature")
@@ -87,8 +91,10 @@ def wbgt(
         t_wbg = 0.7 * twb + 0.2 * tg + 0.1 * tdb
     else:
         t_wbg = 0.7 * twb + 0.3 * tg
+    lap("kernel")
 
     if round_output:
         t_wbg = np.round(t_wbg, 1)
+    lap("rounding")
 
     return WBGT(wbgt=t_wbg)
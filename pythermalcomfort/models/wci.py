@@ -4,8 +4,11 @@ import numpy as np
 
 from pythermalcomfort.classes_input import WCIInputs
 from pythermalcomfort.classes_return import WCI
+from pythermalcomfort.models._outdoor_optimized import _wci_optimized
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def wci(
     tdb: float | list[float],
     v: float | list[float],
@@ -61,16 +64,17 @@ def wci(
         v=v,
         round_output=round_output,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     v = np.asarray(v)
+    lap("array conversion")
 
-    _wci = (10.45 + 10 * v**0.5 - v) * (33 - tdb)
-
-    # the factor 1.163 is used to convert to W/m^2
-    _wci = _wci * 1.163
+    _wci = _wci_optimized(tdb, v)
+    lap("kernel")
 
     if round_output:
         _wci = np.around(_wci, 1)
+    lap("rounding")
 
     return WCI(wci=_wci)
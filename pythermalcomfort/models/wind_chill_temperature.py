@@ -4,8 +4,11 @@ import numpy as np
 
 from pythermalcomfort.classes_input import WCTInputs
 from pythermalcomfort.classes_return import WCT
+from pythermalcomfort.models._outdoor_optimized import _wct_optimized
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def wind_chill_temperature(
     tdb: float | list[float],
     v: float | list[float],
@@ -52,13 +55,17 @@ def wind_chill_temperature(
         v=v,
         round_output=round_output,
     )
+    lap("validation")
 
     tdb = np.asarray(tdb)
     v = np.asarray(v)
+    lap("array conversion")
 
-    _wct = 13.12 + 0.6215 * tdb - 11.37 * v**0.16 + 0.3965 * tdb * v**0.16
+    _wct = _wct_optimized(tdb, v)
+    lap("kernel")
 
     if round_output:
         _wct = np.around(_wct, 1)
+    lap("rounding")
 
     return WCT(wct=_wct)
@@ -4,8 +4,10 @@ import numpy as np
 
 from pythermalcomfort.classes_input import WorkCapacityHothapsInputs, WorkIntensity
 from pythermalcomfort.classes_return import WorkCapacity
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def work_capacity_dunne(
     wbgt: float | list[float],
     work_intensity: str = WorkIntensity.HEAVY.value,
@@ -46,10 +48,12 @@ def work_capacity_dunne(
     """
     # validate inputs
     WorkCapacityHothapsInputs(wbgt=wbgt, work_intensity=work_intensity)
+    lap("validation")
 
     # convert str to enum
     work_intensity = WorkIntensity(work_intensity.lower())
     wbgt = np.asarray(wbgt)
+    lap("array conversion")
 
     capacity = np.clip((100 - (25 * (np.maximum(0, wbgt - 25)) ** (2 / 3))), 0, 100)
 
@@ -60,5 +64,6 @@ def work_capacity_dunne(
     }
 
     capacity = np.clip(capacity * factor_map[work_intensity], 0, 100)
+    lap("kernel")
 
     return WorkCapacity(capacity=capacity)
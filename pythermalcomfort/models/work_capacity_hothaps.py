@@ -4,8 +4,10 @@ import numpy as np
 
 from pythermalcomfort.classes_input import WorkCapacityHothapsInputs, WorkIntensity
 from pythermalcomfort.classes_return import WorkCapacity
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def work_capacity_hothaps(
     wbgt: float | list[float],
     work_intensity: str = WorkIntensity.HEAVY.value,
@@ -64,10 +66,12 @@ def work_capacity_hothaps(
     """
     # validate inputs
     WorkCapacityHothapsInputs(wbgt=wbgt, work_intensity=work_intensity)
+    lap("validation")
 
     # convert str to enum
     work_intensity = WorkIntensity(work_intensity.lower())
     wbgt = np.asarray(wbgt)
+    lap("array conversion")
 
     params = {
         WorkIntensity.HEAVY: {"divisor": 30.94, "exponent": 16.64},
@@ -77,5 +81,6 @@ def work_capacity_hothaps(
     divisor = params[work_intensity]["divisor"]
     exponent = params[work_intensity]["exponent"]
     capacity = np.clip(100 * (0.1 + (0.9 / (1 + (wbgt / divisor) ** exponent))), 0, 100)
+    lap("kernel")
 
     return WorkCapacity(capacity=capacity)
@@ -4,8 +4,10 @@ import numpy as np
 
 from pythermalcomfort.classes_input import WorkCapacityStandardsInputs
 from pythermalcomfort.classes_return import WorkCapacity
+from pythermalcomfort.profiling import lap, profiled
 
 
+@profiled
 def work_capacity_niosh(
     wbgt: float | list[float],
     met: float | list[float],
@@ -44,9 +46,11 @@ def work_capacity_niosh(
     """
     # Validate inputs
     WorkCapacityStandardsInputs(wbgt=wbgt, met=met)
+    lap("validation")
 
     wbgt = np.asarray(wbgt)
     met = np.asarray(met)
+    lap("array conversion")
 
     met_rest = 117  # assumed resting metabolic rate
 
@@ -54,5 +58,6 @@ def work_capacity_niosh(
     wbgt_lim_rest = 56.7 - 11.5 * np.log10(met_rest)
     capacity = ((wbgt_lim_rest - wbgt) / (wbgt_lim_rest - wbgt_lim)) * 100
     capacity = np.clip(capacity, 0, 100)
+    lap("kernel")
 
     return WorkCapacity(capacity=capacity)
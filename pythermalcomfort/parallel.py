@@ -0,0 +1,485 @@
+"""Run the models that are bound by the Python interpreter in a pool of processes.
+
+Models such as :py:func:`~pythermalcomfort.models.pet_steady.pet_steady` or
+:py:func:`~pythermalcomfort.models.heat_index_lu.heat_index_lu` solve each element
+with Python code, so a single call uses a single core. :py:func:`run` splits the
+broadcast inputs in chunks of rows and computes them in separate processes. The
+inputs and the numeric outputs are exchanged through shared memory, hence each
+worker reads and writes its rows without copying the arrays. The same
+mechanism is available for custom multiprocessing code with
+:py:class:`SharedArrays` and :py:func:`run_slice`.
+
+The compiled kernels of the PMV, UTCI and SET models instead run on several
+threads of the same process for large arrays, see :py:func:`threads`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import multiprocessing
+import os
+import weakref
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numba
+import numpy as np
+
+from pythermalcomfort.models import two_nodes_gagge_sleep
+from pythermalcomfort.models._parallel_optimized import _THRESHOLD
+
+# executor and number of processes set by the `parallel` context manager
+_POOL: contextvars.ContextVar[tuple[Executor, int] | None] = contextvars.ContextVar(
+    "pythermalcomfort_parallel_pool", default=None
+)
+# models whose rows depend on the results of the previous ones
+_SEQUENTIAL = (two_nodes_gagge_sleep,)
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """Name, shape and type of an array stored in a shared memory segment."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class SharedHandle:
+    """Description of the arrays of :py:class:`SharedArrays`, sent to the workers.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Broadcast shape of the inputs.
+    inputs : dict of str to segment
+        Shared segments of the input arrays.
+    outputs : dict of str to segment
+        Shared segments of the output arrays.
+    """
+
+    shape: tuple[int, ...]
+    inputs: dict[str, _Segment]
+    outputs: dict[str, _Segment]
+
+
+def _create(shape: tuple[int, ...], dtype: np.dtype) -> tuple[SharedMemory, np.ndarray]:
+    size = max(math.prod(shape) * dtype.itemsize, 1)
+    memory = SharedMemory(create=True, size=size)
+    return memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+
+def _release(memories: list[SharedMemory], unlink: bool) -> None:
+    for memory in memories:
+        try:
+            memory.close()
+        except BufferError:
+            # an array still uses the segment, it is unmapped when it is deleted
+            pass
+        if unlink:
+            memory.unlink()
+    memories.clear()
+
+
+class SharedArrays:
+    """Input and output arrays in shared memory, used by processes without copies.
+
+    The inputs are broadcast against each other and copied once into shared
+    memory segments, and an uninitialised shared array is allocated for each
+    output. Workers receive :py:attr:`handle`, which is small and cheap to
+    pickle, and access the arrays with :py:func:`attach` or compute a model on a
+    slice of them with :py:func:`run_slice`. The segments are released when the
+    ``with`` block ends, when :py:meth:`close` is called or, at the latest,
+    when the object is garbage collected.
+
+    Parameters
+    ----------
+    inputs : dict of str to array_like
+        Input arrays, named as the arguments of the model.
+    outputs : dict of str to dtype or (dtype, shape), optional
+        Output arrays, named as the fields of the result of the model. Their
+        shape is the broadcast shape of the inputs, followed by `shape` for
+        models that return several values per element.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        from pythermalcomfort.models import heat_index_lu
+        from pythermalcomfort.parallel import SharedArrays, run_slice
+
+        with SharedArrays({"tdb": tdb, "rh": rh}, {"hi": float}) as shared:
+            n, step = shared["tdb"].size, 1_000_000
+            with ProcessPoolExecutor() as executor:
+                for start in range(0, n, step):
+                    executor.submit(
+                        run_slice, heat_index_lu, shared.handle, start, start + step
+                    )
+            hi = shared["hi"].copy()
+    """
+
+    def __init__(
+        self, inputs: Mapping[str, Any], outputs: Mapping[str, Any] | None = None
+    ) -> None:
+        arrays = {name: np.asarray(values) for name, values in inputs.items()}
+        self.shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+        self._memories: list[SharedMemory] = []
+        self._arrays: dict[str, np.ndarray] = {}
+        self._finalizer = weakref.finalize(self, _release, self._memories, True)
+        segments: tuple[dict[str, _Segment], dict[str, _Segment]] = ({}, {})
+        try:
+            for name, values in arrays.items():
+                array = self._add(segments[0], name, self.shape, values.dtype)
+                array[...] = np.broadcast_to(values, self.shape)
+            for name, spec in (outputs or {}).items():
+                dtype, trailing = spec if isinstance(spec, tuple) else (spec, ())
+                shape = (*self.shape, *trailing)
+                self._add(segments[1], name, shape, np.dtype(dtype))
+        except BaseException:
+            self.close()
+            raise
+        self.handle = SharedHandle(self.shape, *segments)
+
+    def _add(
+        self,
+        segments: dict[str, _Segment],
+        name: str,
+        shape: tuple[int, ...],
+        dtype: np.dtype,
+    ) -> np.ndarray:
+        memory, array = _create(shape, dtype)
+        self._memories.append(memory)
+        self._arrays[name] = array
+        segments[name] = _Segment(memory.name, shape, dtype.str)
+        return array
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def __enter__(self) -> SharedArrays:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the shared memory segments.
+
+        The arrays returned by ``shared[name]`` must not be used afterwards, copy
+        the results before closing.
+        """
+        self._arrays.clear()
+        self._finalizer()
+
+
+@contextmanager
+def attach(handle: SharedHandle) -> Iterator[dict[str, np.ndarray]]:
+    """Access the arrays of :py:class:`SharedArrays` from a worker process.
+
+    Parameters
+    ----------
+    handle : SharedHandle
+        The :py:attr:`SharedArrays.handle` of the arrays.
+
+    Yields
+    ------
+    dict of str to ndarray
+        The input and output arrays, which are views of the shared memory and
+        must not be used after the ``with`` block.
+    """
+    memories: list[SharedMemory] = []
+    arrays = {}
+    try:
+        for name, segment in {**handle.inputs, **handle.outputs}.items():
+            memory = SharedMemory(name=segment.name)
+            memories.append(memory)
+            arrays[name] = np.ndarray(
+                segment.shape, dtype=np.dtype(segment.dtype), buffer=memory.buf
+            )
+        yield arrays
+    finally:
+        arrays.clear()
+        _release(memories, unlink=False)
+
+
+def _rows(array: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    """View the elements of the grid `shape` in `array` as rows, in C order."""
+    return array.reshape((math.prod(shape), *array.shape[len(shape) :]))
+
+
+def _compute_rows(
+    model: Callable[..., Any],
+    handle: SharedHandle,
+    arrays: dict[str, np.ndarray],
+    start: int,
+    stop: int,
+    constants: dict[str, Any],
+) -> dict[str, Any]:
+    kwargs = {
+        name: _rows(arrays[name], handle.shape)[start:stop] for name in handle.inputs
+    }
+    result = model(**constants, **kwargs)
+    returned = {}
+    for f in fields(result):
+        value = getattr(result, f.name)
+        if f.name in handle.outputs:
+            rows = _rows(arrays[f.name], handle.shape)[start:stop]
+            rows[...] = np.asarray(value).reshape(rows.shape)
+        elif value is not None:
+            returned[f.name] = value
+    return returned
+
+
+def run_slice(
+    model: Callable[..., Any],
+    handle: SharedHandle,
+    start: int,
+    stop: int,
+    **constants: Any,
+) -> dict[str, Any]:
+    """Compute a model on a slice of the arrays of :py:class:`SharedArrays`.
+
+    It is meant to run in a worker process: the inputs are read from the shared
+    memory and the outputs that have a shared array are written into it, without
+    copies.
+
+    Parameters
+    ----------
+    model : callable
+        A model of :py:mod:`pythermalcomfort.models`.
+    handle : SharedHandle
+        The :py:attr:`SharedArrays.handle` of the arrays.
+    start, stop : int
+        Elements to compute, counted in C order over the broadcast shape of the
+        inputs.
+    **constants
+        Other inputs of the model, the same for all the elements.
+
+    Returns
+    -------
+    dict of str to any
+        The outputs of the model that do not have a shared array, e.g. the text
+        categories.
+    """
+    with attach(handle) as arrays:
+        return _compute_rows(model, handle, arrays, start, stop, constants)
+
+
+def _n_jobs(n_jobs: int | None) -> int:
+    if n_jobs is None:
+        pool = _POOL.get()
+        return 1 if pool is None else pool[1]
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be greater than 0, or -1 to use all the CPUs")
+    return n_jobs
+
+
+def _executor(n_jobs: int) -> ProcessPoolExecutor:
+    # forking a process after a parallel numba kernel has run hangs the children
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=n_jobs, mp_context=context)
+
+
+@contextmanager
+def parallel(n_jobs: int = -1) -> Iterator[None]:
+    """Compute the calls to :py:func:`run` in the block with `n_jobs` processes.
+
+    The processes are started once and reused by all the calls in the block,
+    which avoids paying their start-up time, and the import of the models, on
+    every call.
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        Number of processes. Defaults to -1, which uses all the CPUs.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import pet_steady
+        from pythermalcomfort.parallel import parallel, run
+
+        with parallel(n_jobs=8):
+            result = run(pet_steady, tdb=tdb, tr=tr, v=v, rh=rh, met=1.2, clo=0.5)
+    """
+    n_jobs = _n_jobs(n_jobs)
+    with _executor(n_jobs) as executor:
+        token = _POOL.set((executor, n_jobs))
+        try:
+            yield
+        finally:
+            _POOL.reset(token)
+
+
+@contextmanager
+def threads(
+    n_threads: int | None = None, threshold: int | None = None
+) -> Iterator[None]:
+    """Set the threads used by the compiled kernels in the block.
+
+    The kernels of `pmv_ppd_iso`, `pmv_ppd_ashrae`, `pmv_athb`, `utci`,
+    `set_tmp`, `cooling_effect` and `two_nodes_gagge` run on several threads when
+    their inputs have at least `threshold` elements, without copying the arrays
+    to other processes. Smaller inputs run on one thread, since starting the
+    threads would take longer than the calculation.
+
+    Parameters
+    ----------
+    n_threads : int, optional
+        Number of threads, between 1 and the ``NUMBA_NUM_THREADS`` environment
+        variable, which defaults to the number of CPUs. Defaults to the current
+        number of numba threads.
+    threshold : int, optional
+        Number of elements above which the kernels use several threads.
+        Defaults to the ``PYTHERMALCOMFORT_PARALLEL_THRESHOLD`` environment
+        variable, or to 100000.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import pmv_ppd_iso
+        from pythermalcomfort.parallel import threads
+
+        with threads(n_threads=16):
+            result = pmv_ppd_iso(tdb=tdb, tr=tr, vr=vr, rh=rh, met=1.2, clo=0.5)
+    """
+    if threshold is not None and threshold < 0:
+        raise ValueError("threshold must not be negative")
+    previous = numba.get_num_threads()
+    if n_threads is not None:
+        numba.set_num_threads(n_threads)
+    token = _THRESHOLD.set(_THRESHOLD.get() if threshold is None else threshold)
+    try:
+        yield
+    finally:
+        _THRESHOLD.reset(token)
+        numba.set_num_threads(previous)
+
+
+def run(
+    model: Callable[..., Any],
+    n_jobs: int | None = None,
+    chunk_size: int | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Compute a model over arrays of inputs with a pool of processes.
+
+    The array inputs are broadcast against each other, stored in shared memory
+    and split in chunks of rows, which are computed in parallel. The numeric
+    outputs are written by the workers directly into shared arrays. The result
+    has the same type as the one returned by `model`, with the values in the
+    same order as the inputs.
+
+    Parameters
+    ----------
+    model : callable
+        A model of :py:mod:`pythermalcomfort.models`, e.g.
+        :py:func:`~pythermalcomfort.models.pet_steady.pet_steady`. The models that
+        compute each element with Python code benefit the most, e.g. `pet_steady`,
+        `heat_index_lu`, `cooling_effect`, `sports_heat_stress_risk`, `solar_gain`
+        and `two_nodes_gagge_ji`. `two_nodes_gagge_sleep` cannot be split because
+        each row of its inputs depends on the results of the previous one.
+    n_jobs : int, optional
+        Number of processes, -1 to use all the CPUs. Defaults to the value set by
+        :py:func:`parallel`, or to 1, which calls `model` in the current process.
+    chunk_size : int, optional
+        Number of rows computed by a worker at a time. Defaults to a quarter of
+        the rows per process.
+    **kwargs
+        Inputs of the model. Lists and arrays are split between the processes,
+        the other values are passed unchanged to every call.
+
+    Returns
+    -------
+    dataclass
+        The result of `model` for all the inputs.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+
+        from pythermalcomfort.models import heat_index_lu
+        from pythermalcomfort.parallel import run
+
+        tdb = np.random.default_rng(0).uniform(20, 45, 1_000_000)
+        result = run(heat_index_lu, n_jobs=-1, tdb=tdb, rh=50)
+    """
+    if model in _SEQUENTIAL:
+        msg = f"{model.__name__} cannot be split, each row depends on the previous one"
+        raise ValueError(msg)
+    n_jobs = _n_jobs(n_jobs)
+    arrays = {name: np.asarray(v) for name, v in kwargs.items() if np.ndim(v) > 0}
+    constants = {name: v for name, v in kwargs.items() if name not in arrays}
+    shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+    n_rows = math.prod(shape)
+    if chunk_size is None:
+        chunk_size = math.ceil(n_rows / (4 * n_jobs)) if n_rows else 1
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+    if n_jobs == 1 or not arrays or n_rows <= chunk_size:
+        return model(**kwargs)
+
+    # the type and shape of each output are found from the first row
+    first = model(
+        **constants,
+        **{
+            name: np.broadcast_to(a, shape)[(0,) * len(shape)].reshape(1)
+            for name, a in arrays.items()
+        },
+    )
+    outputs = {}
+    for f in fields(first):
+        value = np.asarray(getattr(first, f.name))
+        if getattr(first, f.name) is not None and value.dtype.kind in "biuf":
+            outputs[f.name] = (value.dtype, value.shape[1:])
+
+    with SharedArrays(arrays, outputs) as shared:
+        pool = _POOL.get()
+        executor = _executor(n_jobs) if pool is None else pool[0]
+        try:
+            futures = [
+                executor.submit(
+                    run_slice,
+                    model,
+                    shared.handle,
+                    start,
+                    min(start + chunk_size, n_rows),
+                    **constants,
+                )
+                for start in range(0, n_rows, chunk_size)
+            ]
+            returned = [future.result() for future in futures]
+        finally:
+            if pool is None:
+                executor.shutdown()
+
+        values = {}
+        for f in fields(first):
+            value = getattr(first, f.name)
+            if f.name in outputs:
+                # copy the values out of the shared memory before it is released
+                array = shared[f.name].copy()
+            elif value is None:
+                values[f.name] = None
+                continue
+            else:
+                array = np.concatenate(
+                    [np.atleast_1d(np.asarray(chunk[f.name])) for chunk in returned]
+                )
+                array = array.reshape(shape + array.shape[1:])
+            values[f.name] = list(array) if isinstance(value, list) else array
+    return type(first)(**values)
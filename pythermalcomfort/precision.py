@@ -0,0 +1,143 @@
+"""Trade-off between the accuracy and the speed of the iterative solvers.
+
+The tolerances of the iterative solvers of the models are set by a precision
+preset:
+
+* "standard", the default, the tolerances of the reference implementations,
+* "fast", looser tolerances for screening studies, the solvers stop after
+  fewer iterations and the results differ slightly from the standard ones,
+* "exact", tighter tolerances, the results are converged well below their
+  rounding and are used as reference for the error bounds of the other presets.
+
+The preset is set in a block with :py:func:`precision`, or for the whole
+process with the environment variable ``PYTHERMALCOMFORT_PRECISION``. The
+maximum number of iterations of the solvers does not change with the preset,
+it only stops the inputs that do not converge.
+
+The maximum absolute errors against the "exact" preset, over random inputs
+within the applicability limits of each model, rounded up, are
+
+======================  ==================  ===========  ===========
+Model                   Tolerance           "standard"   "fast"
+======================  ==================  ===========  ===========
+PMV                     ``pmv``             0.01         0.02
+SET                     ``gagge``           0.0001 °C    0.001 °C
+Heat index (Lu)         ``heat_index_lu``   1e-6 °C      0.02 °C
+Cooling effect          ``cooling_effect``  0.01 °C      0.02 °C
+======================  ==================  ===========  ===========
+
+the PMV errors apply to :py:func:`~pythermalcomfort.models.pmv_ppd_iso`,
+:py:func:`~pythermalcomfort.models.pmv_ppd_ashrae` and
+:py:func:`~pythermalcomfort.models.pmv_athb`, the SET ones to
+:py:func:`~pythermalcomfort.models.set_tmp` and
+:py:func:`~pythermalcomfort.models.two_nodes_gagge`, before the outputs are
+rounded. The cooling effect is always rounded to 0.01 °C, its errors are one or
+two rounding steps.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+PRECISION_ENV = "PYTHERMALCOMFORT_PRECISION"
+
+
+@dataclass(frozen=True)
+class Tolerances:
+    """Tolerances of the iterative solvers of a precision preset.
+
+    Attributes
+    ----------
+    pmv : float
+        Tolerance of the clothing surface temperature of the PMV, [hK], the
+        iterated variable is the absolute temperature divided by 100.
+    gagge : float
+        Tolerance of the clothing surface temperature, the SET and the ET of
+        the two-node model, [°C].
+    heat_index_lu : float
+        Tolerance of the bisections of the heat index by Lu and Romps, [K] or
+        [Pa m²/W].
+    cooling_effect : float
+        Absolute tolerance of the root of the cooling effect, [°C].
+    """
+
+    pmv: float
+    gagge: float
+    heat_index_lu: float
+    cooling_effect: float
+
+
+PRESETS = {
+    "standard": Tolerances(
+        pmv=0.00015, gagge=0.01, heat_index_lu=1e-8, cooling_effect=2e-12
+    ),
+    "fast": Tolerances(pmv=0.0005, gagge=0.1, heat_index_lu=1e-3, cooling_effect=5e-3),
+    "exact": Tolerances(
+        pmv=1e-8, gagge=1e-6, heat_index_lu=1e-10, cooling_effect=1e-12
+    ),
+}
+
+
+def _preset(name: str) -> str:
+    if name not in PRESETS:
+        msg = f"Unknown precision {name!r}, it should be one of {list(PRESETS)}."
+        raise ValueError(msg)
+    return name
+
+
+# preset of the process, set by the environment variable
+_DEFAULT = _preset(os.environ.get(PRECISION_ENV, "").strip() or "standard")
+_precision: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "pythermalcomfort_precision", default=_DEFAULT
+)
+
+
+def current() -> str:
+    """Return the name of the precision preset in use."""
+    return _precision.get()
+
+
+def tolerances() -> Tolerances:
+    """Return the tolerances of the precision preset in use."""
+    return PRESETS[_precision.get()]
+
+
+@contextmanager
+def precision(preset: str) -> Iterator[Tolerances]:
+    """Set the precision of the iterative solvers of the models called in the block.
+
+    Parameters
+    ----------
+    preset : str
+        "standard", "fast" or "exact", see :py:data:`PRESETS`.
+
+    Yields
+    ------
+    Tolerances
+        The tolerances of the preset.
+
+    Raises
+    ------
+    ValueError
+        If `preset` is not one of the presets.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import heat_index_lu
+        from pythermalcomfort.precision import precision
+
+        with precision("fast"):
+            result = heat_index_lu(tdb=[25, 35], rh=[50, 70])
+        print(result.hi)  # [25.  61.4]
+    """
+    token = _precision.set(_preset(preset))
+    try:
+        yield PRESETS[preset]
+    finally:
+        _precision.reset(token)
@@ -0,0 +1,269 @@
+"""Opt-in timing of the stages of the models.
+
+When profiling is enabled, each call of a public model records the time spent
+in each of its stages:
+
+* validation, the checks of the inputs by the classes of
+  :py:mod:`pythermalcomfort.classes_input`,
+* array conversion, the conversion of the inputs to numpy arrays,
+* unit conversion, the conversion of IP inputs and outputs,
+* kernel, the calculation itself, including the iterative solvers,
+* compliance masking, setting to nan the results of the inputs outside the
+  applicability limits,
+* rounding, the rounding of the outputs,
+* category mapping, the mapping of the outputs to categories,
+* memoization, finding the distinct rows of the inputs and copying their
+  results, see :py:mod:`pythermalcomfort.memo`,
+* other, the rest of the call, e.g. building the returned dataclass.
+
+A model that calls another model, e.g. :py:func:`~pythermalcomfort.models.ankle_draft`
+calls :py:func:`~pythermalcomfort.models.pmv_ppd_ashrae`, reports the time spent
+in that model as nested, the stages of the inner call are reported with the
+inner model.
+
+Profiling is enabled in a block with :py:func:`profile`, or for the whole
+process by setting the environment variable ``PYTHERMALCOMFORT_PROFILE`` to 1,
+:py:func:`global_report` then returns the report. If the variable is set to the
+path of a file instead, the report is also written to it as JSON when the
+process exits. When profiling is disabled, the models only pay a few function
+calls.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+PROFILE_ENV = "PYTHERMALCOMFORT_PROFILE"
+
+STAGES = (
+    "validation",
+    "array conversion",
+    "unit conversion",
+    "kernel",
+    "compliance masking",
+    "rounding",
+    "category mapping",
+    "memoization",
+    "other",
+)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass
+class ModelProfile:
+    """Time spent in the calls of a model.
+
+    Attributes
+    ----------
+    calls : int
+        Number of calls.
+    total_s : float
+        Total time of the calls, [s].
+    nested_s : float
+        Time spent in the other models called by the model, [s].
+    stages : dict
+        Time spent in each stage, [s], see :py:data:`STAGES`.
+    """
+
+    calls: int = 0
+    total_s: float = 0.0
+    nested_s: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class ProfileReport:
+    """Time spent in each stage of the models called while profiling.
+
+    Attributes
+    ----------
+    models : dict
+        :py:class:`ModelProfile` of each model, by qualified name, e.g.
+        "pmv_ppd_iso" or "JOS3.simulate".
+    """
+
+    models: dict[str, ModelProfile] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a dictionary that can be saved as JSON."""
+        with _lock:
+            return {
+                name: {
+                    "calls": model.calls,
+                    "total_s": model.total_s,
+                    "nested_s": model.nested_s,
+                    "stages": {
+                        stage: model.stages[stage]
+                        for stage in STAGES
+                        if stage in model.stages
+                    },
+                }
+                for name, model in self.models.items()
+            }
+
+    def reset(self) -> None:
+        """Forget the calls recorded so far."""
+        with _lock:
+            self.models.clear()
+
+    def __str__(self) -> str:
+        lines = []
+        for name, model in sorted(
+            self.to_dict().items(), key=lambda item: -item[1]["total_s"]
+        ):
+            calls = f"{model['calls']} call{'s' if model['calls'] != 1 else ''}"
+            lines.append(f"{name}: {calls}, {model['total_s'] * 1000:.3f} ms")
+            parts = dict(model["stages"])
+            if model["nested_s"]:
+                parts["nested models"] = model["nested_s"]
+            for stage, seconds in parts.items():
+                share = seconds / model["total_s"] * 100 if model["total_s"] else 0
+                lines.append(
+                    f"    {stage:<20} {seconds * 1000:>12.3f} ms {share:>6.1f}%"
+                )
+        return "\n".join(lines)
+
+
+class _Call:
+    """The time of a running call of a model, split in stages by :py:func:`lap`."""
+
+    __slots__ = ("last", "name", "nested", "start", "stages", "unaccounted_nested")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = self.last = time.perf_counter()
+        self.nested = 0.0
+        # time of the nested models since the last lap
+        self.unaccounted_nested = 0.0
+        self.stages: dict[str, float] = {}
+
+    def lap(self, stage: str, now: float) -> None:
+        elapsed = now - self.last - self.unaccounted_nested
+        self.stages[stage] = self.stages.get(stage, 0.0) + elapsed
+        self.last = now
+        self.unaccounted_nested = 0.0
+
+
+_lock = threading.Lock()
+_reports: list[ProfileReport] = []
+_current: contextvars.ContextVar[_Call | None] = contextvars.ContextVar(
+    "pythermalcomfort_profiled_call", default=None
+)
+
+
+def _record(call: _Call, total: float) -> None:
+    with _lock:
+        for report in _reports:
+            model = report.models.setdefault(call.name, ModelProfile())
+            model.calls += 1
+            model.total_s += total
+            model.nested_s += call.nested
+            for stage, seconds in call.stages.items():
+                model.stages[stage] = model.stages.get(stage, 0.0) + seconds
+
+
+def profiled(func: _F) -> _F:
+    """Record the calls of a public model while profiling is enabled."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _reports:
+            return func(*args, **kwargs)
+        parent = _current.get()
+        call = _Call(name)
+        token = _current.set(call)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+            end = time.perf_counter()
+            call.lap("other", end)
+            total = end - call.start
+            if parent is not None:
+                parent.nested += total
+                parent.unaccounted_nested += total
+            _record(call, total)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def lap(stage: str) -> None:
+    """Charge the time since the start of the model, or the last lap, to `stage`.
+
+    It is called by the models at the end of each stage and does nothing when
+    profiling is disabled.
+    """
+    call = _current.get()
+    if call is not None:
+        call.lap(stage, time.perf_counter())
+
+
+@contextmanager
+def profile() -> Iterator[ProfileReport]:
+    """Profile the models called in the block.
+
+    Yields
+    ------
+    ProfileReport
+        Filled with the calls of the block, the calls of the other threads are
+        recorded too.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import pmv_ppd_iso
+        from pythermalcomfort.profiling import profile
+
+        with profile() as report:
+            pmv_ppd_iso(tdb=[22, 25], tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+        print(report)
+        print(report.models["pmv_ppd_iso"].stages["kernel"])
+    """
+    report = ProfileReport()
+    with _lock:
+        _reports.append(report)
+    try:
+        yield report
+    finally:
+        with _lock:
+            _reports.remove(report)
+
+
+_global_report: ProfileReport | None = None
+
+
+def global_report() -> ProfileReport | None:
+    """Return the report of the process, None if ``PYTHERMALCOMFORT_PROFILE`` is not set."""
+    return _global_report
+
+
+def _write_report(path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(_global_report.to_dict(), f, indent=2)
+
+
+def _enable_from_env() -> None:
+    global _global_report
+    value = os.environ.get(PROFILE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no"):
+        return
+    _global_report = ProfileReport()
+    _reports.append(_global_report)
+    if value.lower() not in ("1", "true", "yes"):
+        atexit.register(_write_report, value)
+
+
+_enable_from_env()
@@ -0,0 +1,222 @@
+"""Local HTTP/JSON server computing the models in micro-batches.
+
+The server runs in a single long-lived process, so the models are imported and
+their compiled kernels loaded once. The requests for the same model received
+within a short time window are computed with a single vectorised call by a
+:py:class:`~pythermalcomfort.aio.MicroBatcher`. It is meant to run on a local
+network, next to the clients, and has no authentication.
+
+Endpoints:
+
+* ``POST /models/<model>`` computes a model, the body is a JSON object with its
+  inputs, e.g. ``{"tdb": 25, "tr": 25, "vr": 0.1, "rh": 50, "met": 1.2, "clo": 0.5}``,
+  and the response a JSON object with its outputs. Missing values are null.
+* ``GET /models`` lists the models.
+* ``GET /metrics`` returns the number of requests and errors, the throughput, the
+  mean batch size and the latency percentiles of each model.
+* ``GET /health`` returns ``{"status": "ok"}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import fields
+from http import HTTPStatus
+from typing import Any
+
+import numpy as np
+
+from pythermalcomfort.aio import MicroBatcher
+from pythermalcomfort.batch import _INDICES, INDICES
+
+# number of recent requests of each model used for the latency percentiles
+_LATENCY_WINDOW = 10_000
+_MAX_BODY = 1 << 20
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _to_json(value: Any) -> Any:
+    """Convert an output to JSON values, with null for nan and infinity."""
+    if value is None:
+        return None
+    array = np.asarray(value)
+    if array.dtype.kind == "f":
+        array = np.where(np.isfinite(array), array, None)
+    return array.tolist()
+
+
+class _ModelMetrics:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+
+class ComfortServer:
+    """HTTP/JSON server computing the models in micro-batches.
+
+    Parameters
+    ----------
+    models : list of str, optional
+        Names of the models served, see :py:data:`pythermalcomfort.batch.INDICES`.
+        Defaults to all of them.
+    max_delay : float, optional
+        Maximum time, [s], a request waits for other requests of the same model
+        before they are computed together. Defaults to 0.002.
+    max_batch_size : int, optional
+        Number of rows that triggers the computation of a batch without waiting.
+        Defaults to 65536.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import asyncio
+
+        from pythermalcomfort.server import ComfortServer
+
+        asyncio.run(ComfortServer(["pmv_ppd_iso"]).serve("127.0.0.1", 8000))
+    """
+
+    def __init__(
+        self,
+        models: Sequence[str] | None = None,
+        max_delay: float = 0.002,
+        max_batch_size: int = 65_536,
+    ) -> None:
+        models = list(INDICES if models is None else models)
+        unknown = [name for name in models if name not in _INDICES]
+        if unknown:
+            msg = f"unknown models {unknown}, choose among {list(INDICES)}"
+            raise ValueError(msg)
+        self._batchers = {
+            name: MicroBatcher(_INDICES[name].model, max_delay, max_batch_size)
+            for name in models
+        }
+        self._metrics = {name: _ModelMetrics() for name in models}
+        self._start = time.monotonic()
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the throughput and latency metrics of each model."""
+        uptime = time.monotonic() - self._start
+        models = {}
+        for name, metrics in self._metrics.items():
+            batcher = self._batchers[name]
+            latencies = np.array(metrics.latencies) * 1000
+            models[name] = {
+                "requests": metrics.requests,
+                "errors": metrics.errors,
+                "throughput_rps": metrics.requests / uptime if uptime else 0.0,
+                "batches": batcher.batches,
+                "mean_batch_size": batcher.rows / batcher.batches
+                if batcher.batches
+                else 0.0,
+                "latency_ms": {
+                    key: float(np.percentile(latencies, q)) if latencies.size else None
+                    for key, q in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+                },
+            }
+        return {"uptime_s": uptime, "models": models}
+
+    async def _compute(self, name: str, body: bytes) -> dict[str, Any]:
+        if name not in self._batchers:
+            msg = f"unknown model '{name}'"
+            raise _HTTPError(HTTPStatus.NOT_FOUND, msg)
+        try:
+            inputs = json.loads(body or b"{}")
+        except ValueError as e:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, f"invalid JSON: {e}") from e
+        if not isinstance(inputs, dict):
+            msg = "the body must be a JSON object with the inputs of the model"
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, msg)
+
+        metrics = self._metrics[name]
+        metrics.requests += 1
+        start = time.perf_counter()
+        try:
+            result = await self._batchers[name](**inputs)
+        except (TypeError, ValueError, KeyError) as e:
+            metrics.errors += 1
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from e
+        metrics.latencies.append(time.perf_counter() - start)
+        return {f.name: _to_json(getattr(result, f.name)) for f in fields(result)}
+
+    async def _route(self, method: str, path: str, body: bytes) -> Any:
+        if path == "/health" and method == "GET":
+            return {"status": "ok"}
+        if path == "/metrics" and method == "GET":
+            return self.metrics()
+        if path == "/models" and method == "GET":
+            return list(self._batchers)
+        if path.startswith("/models/"):
+            if method != "POST":
+                raise _HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+            return await self._compute(path.removeprefix("/models/"), body)
+        raise _HTTPError(HTTPStatus.NOT_FOUND, f"unknown path '{path}'")
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of a connection, which is kept alive."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, path, version = line.decode("latin-1").split(maxsplit=2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > _MAX_BODY:
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status = HTTPStatus.OK
+                try:
+                    content = await self._route(method, path, body)
+                except _HTTPError as e:
+                    status, content = e.status, {"error": str(e)}
+                except Exception as e:  # noqa: BLE001
+                    status = HTTPStatus.INTERNAL_SERVER_ERROR
+                    content = {"error": f"{type(e).__name__}: {e}"}
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    and version.strip() != "HTTP/1.0"
+                )
+                data = json.dumps(content, allow_nan=False).encode()
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """Start listening and return the asyncio server."""
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """Serve the requests until the task is cancelled."""
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
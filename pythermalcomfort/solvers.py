@@ -0,0 +1,507 @@
+"""Opt-in diagnostics of the iterative solvers of the models.
+
+Several models find their results iteratively:
+
+* :py:func:`~pythermalcomfort.models.pmv_ppd_iso`,
+  :py:func:`~pythermalcomfort.models.pmv_ppd_ashrae` and
+  :py:func:`~pythermalcomfort.models.pmv_athb` iterate the clothing surface
+  temperature ("t_cl"),
+* :py:func:`~pythermalcomfort.models.two_nodes_gagge` and
+  :py:func:`~pythermalcomfort.models.set_tmp` iterate the clothing surface
+  temperature at each minute of the simulation ("t_cl") and then search the
+  Standard Effective Temperature ("set") and the Effective Temperature ("et"),
+* :py:func:`~pythermalcomfort.models.phs` iterates the clothing surface ("t_cl")
+  and the core ("t_cr") temperatures at each minute of the exposure,
+* :py:func:`~pythermalcomfort.models.heat_index_lu` solves its equations by
+  bisection ("bisection"),
+* :py:func:`~pythermalcomfort.models.cooling_effect` and
+  :py:func:`~pythermalcomfort.models.sports_heat_stress_risk` find the roots
+  with :py:func:`scipy.optimize.brentq` ("brentq"),
+* :py:func:`~pythermalcomfort.models.pet_steady` solves the heat balance with
+  :py:func:`scipy.optimize.fsolve` ("fsolve").
+
+Within a :py:func:`diagnostics` block, each call of these models records, for
+each element of the result, the number of iterations of each solver and whether
+it converged. The models called by the solver of another model, e.g.
+:py:func:`~pythermalcomfort.models.set_tmp` by
+:py:func:`~pythermalcomfort.models.cooling_effect`, are not recorded. The
+iterations of a solver that runs more than once per element,
+e.g. at each minute of a simulation, are summed, and it converged only if all
+its runs did. The elements the model does not solve, e.g. the inputs outside
+the applicability limits, have zero iterations and count as converged.
+
+Recording the iterations has a cost, the models can take up to twice as long
+within a block. When no block is open, the models only pay a function call.
+
+Within a :py:func:`nan_on_failure` block, the elements that do not converge
+are nan instead of raising an error, and the report of the block records which
+ones they are. Within a :py:func:`warm_start` block, the solver of each element
+starts from the solution of the previous one.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class SolverCall:
+    """The iterations of a solver in a call of a model.
+
+    Attributes
+    ----------
+    model : str
+        Name of the model, e.g. "pmv_ppd_iso".
+    solver : str
+        Name of the solver, e.g. "t_cl".
+    iterations : numpy.ndarray
+        Number of iterations for each element of the result, it has the shape
+        of the result.
+    converged : numpy.ndarray
+        True for the elements for which the solver converged.
+    """
+
+    model: str
+    solver: str
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+@dataclass
+class SolverReport:
+    """Iterations of the solvers of the models called in a :py:func:`diagnostics` block.
+
+    Attributes
+    ----------
+    calls : list of SolverCall
+        One :py:class:`SolverCall` for each solver of each call of a model, in
+        the order of the calls.
+    """
+
+    calls: list[SolverCall] = field(default_factory=list)
+
+    def _select(self, model: str | None, solver: str | None) -> list[SolverCall]:
+        with _lock:
+            return [
+                call
+                for call in self.calls
+                if (model is None or call.model == model)
+                and (solver is None or call.solver == solver)
+            ]
+
+    def iterations(
+        self, model: str | None = None, solver: str | None = None
+    ) -> np.ndarray:
+        """Return the iterations of all the elements of the matching calls.
+
+        Parameters
+        ----------
+        model : str, optional
+            Only the calls of this model. Defaults to all the models.
+        solver : str, optional
+            Only the calls of this solver. Defaults to all the solvers.
+
+        Returns
+        -------
+        numpy.ndarray
+            The flattened iterations of the calls, one after the other.
+        """
+        calls = self._select(model, solver)
+        return np.concatenate(
+            [np.ravel(call.iterations) for call in calls] or [np.empty(0, dtype=int)]
+        )
+
+    def converged(
+        self, model: str | None = None, solver: str | None = None
+    ) -> np.ndarray:
+        """Return the convergence flags of all the elements of the matching calls.
+
+        The parameters are the ones of :py:meth:`iterations` and the flags are
+        in the same order as the iterations.
+        """
+        calls = self._select(model, solver)
+        return np.concatenate(
+            [np.ravel(call.converged) for call in calls] or [np.empty(0, dtype=bool)]
+        )
+
+    def histogram(
+        self,
+        model: str | None = None,
+        solver: str | None = None,
+        bins: Any = 10,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the histogram of the iterations of the matching calls.
+
+        Parameters
+        ----------
+        model : str, optional
+            Only the calls of this model. Defaults to all the models.
+        solver : str, optional
+            Only the calls of this solver. Defaults to all the solvers.
+        bins : int or sequence, optional
+            The bins of :py:func:`numpy.histogram`. Defaults to 10.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The number of elements in each bin and the edges of the bins.
+        """
+        return np.histogram(self.iterations(model, solver), bins=bins)
+
+    def summary(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the statistics of the iterations of each solver of each model.
+
+        Returns
+        -------
+        dict
+            For each model and solver, the number of elements, the number of
+            elements that did not converge and the mean, 95th percentile and
+            maximum number of iterations. It can be saved as JSON.
+        """
+        with _lock:
+            keys = list(dict.fromkeys((call.model, call.solver) for call in self.calls))
+        summary: dict[str, dict[str, dict[str, Any]]] = {}
+        for model, solver in keys:
+            iterations = self.iterations(model, solver)
+            converged = self.converged(model, solver)
+            summary.setdefault(model, {})[solver] = {
+                "elements": int(iterations.size),
+                "not_converged": int(np.count_nonzero(~converged)),
+                "mean": float(iterations.mean()) if iterations.size else 0.0,
+                "p95": float(np.percentile(iterations, 95)) if iterations.size else 0.0,
+                "max": int(iterations.max()) if iterations.size else 0,
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Forget the calls recorded so far."""
+        with _lock:
+            self.calls.clear()
+
+    def __str__(self) -> str:
+        lines = []
+        for model, solvers in self.summary().items():
+            lines.append(f"{model}:")
+            for solver, stats in solvers.items():
+                lines.append(
+                    f"    {solver:<10} {stats['elements']:>10} elements"
+                    f" {stats['not_converged']:>8} not converged"
+                    f"   iterations mean {stats['mean']:.1f},"
+                    f" p95 {stats['p95']:.0f}, max {stats['max']}"
+                )
+        return "\n".join(lines)
+
+
+_lock = threading.Lock()
+_reports: list[SolverReport] = []
+_muted: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pythermalcomfort_solvers_muted", default=False
+)
+
+
+def recording() -> bool:
+    """Return True if the models should record the iterations of their solvers."""
+    return bool(_reports) and not _muted.get()
+
+
+def record_elements(
+    model: str, solver: str, stats: list[tuple[int, bool]], shape: tuple[int, ...]
+) -> None:
+    """Record the iterations of a solver called once for each element of the result.
+
+    `stats` holds the number of iterations and the convergence flag of each
+    element of a result of `shape`, in C order, e.g. as appended by the
+    functions vectorized with :py:class:`numpy.vectorize`.
+    """
+    iterations = np.array([iterations for iterations, _ in stats], dtype=np.int64)
+    converged = np.array([converged for _, converged in stats], dtype=bool)
+    record(model, solver, iterations.reshape(shape), converged.reshape(shape))
+
+
+@contextmanager
+def muted() -> Iterator[None]:
+    """Do not record the models called in the block.
+
+    The models whose solvers call other models, e.g. the objective function of
+    :py:func:`~pythermalcomfort.models.cooling_effect` calls
+    :py:func:`~pythermalcomfort.models.set_tmp`, only record their own solver.
+    """
+    token = _muted.set(True)
+    try:
+        yield
+    finally:
+        _muted.reset(token)
+
+
+def record(model: str, solver: str, iterations: Any, converged: Any) -> None:
+    """Add the iterations of a solver in a call of `model` to the open reports.
+
+    It is called by the models, `iterations` and `converged` have the shape of
+    the result.
+    """
+    call = SolverCall(
+        model=model,
+        solver=solver,
+        iterations=np.asarray(iterations, dtype=np.int64),
+        converged=np.asarray(converged, dtype=bool),
+    )
+    with _lock:
+        for report in _reports:
+            report.calls.append(call)
+
+
+@contextmanager
+def diagnostics() -> Iterator[SolverReport]:
+    """Record the iterations of the solvers of the models called in the block.
+
+    Yields
+    ------
+    SolverReport
+        Filled with the calls of the block, the calls of the other threads are
+        recorded too.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import pmv_ppd_iso
+        from pythermalcomfort.solvers import diagnostics
+
+        with diagnostics() as report:
+            pmv_ppd_iso(tdb=[22, 25], tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+        print(report)
+        print(report.calls[0].iterations)  # [10 10]
+        counts, edges = report.histogram("pmv_ppd_iso", "t_cl")
+    """
+    report = SolverReport()
+    with _lock:
+        _reports.append(report)
+    try:
+        yield report
+    finally:
+        with _lock:
+            _reports.remove(report)
+
+
+@dataclass
+class SolverFailure:
+    """The elements for which a solver did not converge in a call of a model.
+
+    Attributes
+    ----------
+    model : str
+        Name of the model, e.g. "pmv_ppd_iso".
+    solver : str
+        Name of the solver, e.g. "t_cl".
+    failed : numpy.ndarray
+        True for the elements for which the solver did not converge, it has
+        the shape of the result.
+    """
+
+    model: str
+    solver: str
+    failed: np.ndarray
+
+
+@dataclass
+class FailureReport:
+    """Elements that did not converge in the calls of a :py:func:`nan_on_failure` block.
+
+    Attributes
+    ----------
+    calls : list of SolverFailure
+        One :py:class:`SolverFailure` for each call of a model, in the order of
+        the calls, also when all the elements converged.
+    """
+
+    calls: list[SolverFailure] = field(default_factory=list)
+
+    def mask(self, model: str | None = None) -> np.ndarray:
+        """Return the elements that did not converge in the last call of `model`.
+
+        Parameters
+        ----------
+        model : str, optional
+            Name of the model. Defaults to the last call of any model.
+
+        Returns
+        -------
+        numpy.ndarray
+            True for the elements of the result that are nan because the
+            solver did not converge.
+        """
+        for call in reversed(self.calls):
+            if model is None or call.model == model:
+                return call.failed
+        msg = f"No call of {model or 'any model'} was recorded."
+        raise ValueError(msg)
+
+    def count(self) -> int:
+        """Return the number of elements that did not converge in all the calls."""
+        return sum(int(np.count_nonzero(call.failed)) for call in self.calls)
+
+    def reset(self) -> None:
+        """Forget the calls recorded so far."""
+        self.calls.clear()
+
+    def __str__(self) -> str:
+        lines = []
+        for call in self.calls:
+            lines.append(
+                f"{call.model} ({call.solver}): {np.count_nonzero(call.failed)} of"
+                f" {call.failed.size} elements did not converge"
+            )
+        return "\n".join(lines)
+
+
+_failures: contextvars.ContextVar[FailureReport | None] = contextvars.ContextVar(
+    "pythermalcomfort_solvers_failures", default=None
+)
+
+
+def returning_nan() -> bool:
+    """Return True if the elements that do not converge should be nan."""
+    return _failures.get() is not None
+
+
+def record_failures(model: str, solver: str, failed: Any) -> None:
+    """Add the elements of a call of `model` that did not converge to the report.
+
+    It is called by the models within a :py:func:`nan_on_failure` block,
+    `failed` has the shape of the result.
+    """
+    report = _failures.get()
+    if report is not None and not _muted.get():
+        report.calls.append(
+            SolverFailure(model=model, solver=solver, failed=np.asarray(failed, bool))
+        )
+
+
+def nan_failures(
+    result: np.ndarray, failed: Callable[..., np.ndarray], *inputs: Any
+) -> np.ndarray:
+    """Return the mask of the elements of `result` for which the solver failed.
+
+    Only the nan elements of `result` are checked, `failed` is called with the
+    `inputs` of these elements, broadcast to the shape of `result`, and returns
+    True for the ones that did not converge.
+    """
+    mask = np.array(np.isnan(result))
+    if mask.any():
+        mask[mask] = failed(*(np.broadcast_to(x, mask.shape)[mask] for x in inputs))
+    return mask
+
+
+@contextmanager
+def nan_on_failure() -> Iterator[FailureReport]:
+    """Return nan for the elements whose solver does not converge.
+
+    By default, the models raise an error when one of the elements of the
+    inputs does not converge, e.g. StopIteration for the clothing surface
+    temperature of the PMV and SystemExit for the bisection of
+    :py:func:`~pythermalcomfort.models.heat_index_lu`. In the block these
+    elements are nan and the other elements are calculated as usual.
+
+    The models that follow this mode are
+    :py:func:`~pythermalcomfort.models.pmv_ppd_iso`,
+    :py:func:`~pythermalcomfort.models.pmv_ppd_ashrae`,
+    :py:func:`~pythermalcomfort.models.pmv_athb`,
+    :py:func:`~pythermalcomfort.models.set_tmp`,
+    :py:func:`~pythermalcomfort.models.two_nodes_gagge`,
+    :py:func:`~pythermalcomfort.models.heat_index_lu` and
+    :py:class:`~pythermalcomfort.models.JOS3`, which no longer retries the search of
+    the neutral operative temperature.
+
+    Yields
+    ------
+    FailureReport
+        Filled with the elements that did not converge in each call of the
+        block, in the current thread or task.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import pmv_ppd_iso
+        from pythermalcomfort.solvers import nan_on_failure
+
+        with nan_on_failure() as failures:
+            result = pmv_ppd_iso(
+                tdb=25,
+                tr=[25, 600],
+                vr=0.1,
+                rh=50,
+                met=1.2,
+                clo=0.5,
+                limit_inputs=False,
+            )
+        print(result.pmv)  # [0.08  nan]
+        print(failures.mask("pmv_ppd_iso"))  # [False  True]
+    """
+    report = FailureReport()
+    token = _failures.set(report)
+    try:
+        yield report
+    finally:
+        _failures.reset(token)
+
+
+_warm_start: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pythermalcomfort_solvers_warm_start", default=False
+)
+
+
+def warm_starting() -> bool:
+    """Return True if the solvers should start from the previous element."""
+    return _warm_start.get()
+
+
+@contextmanager
+def warm_start() -> Iterator[None]:
+    """Start the solver of each element from the solution of the previous one.
+
+    In time series consecutive elements have similar inputs, hence similar
+    solutions. In the block the elements of the broadcast inputs are solved one
+    after the other, in C order, e.g. along the last axis of a 2D array:
+
+    * :py:func:`~pythermalcomfort.models.pmv_ppd_iso`,
+      :py:func:`~pythermalcomfort.models.pmv_ppd_ashrae` and
+      :py:func:`~pythermalcomfort.models.pmv_athb` start the clothing surface
+      temperature from the one of the previous element,
+    * :py:func:`~pythermalcomfort.models.pet_steady` starts the body
+      temperatures and the PET from the ones of the previous element,
+    * :py:func:`~pythermalcomfort.models.cooling_effect`, also when it is
+      calculated by :py:func:`~pythermalcomfort.models.pmv_ppd_ashrae`, first
+      searches the root within 0.25 °C of the previous cooling effect.
+
+    The results are the same within the tolerances of the solvers, see
+    :py:mod:`pythermalcomfort.precision`, but the iterations drop for smooth
+    series. The elements are not independent, hence the compiled kernels of the
+    PMV run on a single thread in the block.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+
+        from pythermalcomfort.models import pmv_ppd_iso
+        from pythermalcomfort.solvers import diagnostics, warm_start
+
+        tdb = 22 + 3 * np.sin(np.linspace(0, 2 * np.pi, 1440))
+        with warm_start(), diagnostics() as report:
+            pmv_ppd_iso(tdb=tdb, tr=tdb, vr=0.1, rh=50, met=1.2, clo=0.5)
+        print(round(report.iterations().mean(), 1))  # 1.6, 10 without warm start
+    """
+    token = _warm_start.set(True)
+    try:
+        yield
+    finally:
+        _warm_start.reset(token)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import math
 import warnings
+from dataclasses import InitVar, dataclass
 from enum import Enum
-from typing import NamedTuple
+from functools import cached_property
+from typing import Any, NamedTuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -189,25 +191,7 @@ def psy_ta_rh(
     h: float or list of floats
         enthalpy_air [J/kg dry air]
     """
-    tdb = np.asarray(tdb, dtype=np.float64)
-    rh = np.asarray(rh, dtype=np.float64)
-    p_atm = np.asarray(p_atm, dtype=np.float64)
-
-    p_saturation = p_sat(tdb)
-    p_vap = rh / 100 * p_saturation
-    hr = 0.62198 * p_vap / (p_atm - p_vap)
-    tdp = dew_point_tmp(tdb, rh)
-    twb = wet_bulb_tmp(tdb, rh)
-    h = enthalpy_air(tdb, hr)
-
-    return PsychrometricValues(
-        p_sat=p_saturation,
-        p_vap=p_vap,
-        hr=hr,
-        wet_bulb_tmp=twb,
-        dew_point_tmp=tdp,
-        h=h,
-    )
+    return Conditions(tdb=tdb, rh=rh, p_atm=p_atm).psychrometrics
 
 
 def wet_bulb_tmp(
@@ -945,6 +929,157 @@ def units_converter(from_units=Units.IP.value, **kwargs) -> list[float]:
     return results
 
 
+@dataclass
+class Conditions:
+    """Environmental conditions in SI units with cached psychrometric values.
+
+    The conversion from IP to SI units is performed once when the object is
+    created, so the same conditions can be passed to many model calls with
+    ``units="SI"`` without converting the inputs again in each model.
+
+    The psychrometric values, which are also returned by
+    :py:func:`pythermalcomfort.utilities.psy_ta_rh`, are calculated the first
+    time they are accessed and then cached, hence the saturation vapour pressure
+    is not recalculated by each model that uses it.
+    The attributes must not be modified after the object is created, otherwise
+    the cached values become stale.
+
+    The models :py:func:`~pythermalcomfort.models.at.at`,
+    :py:func:`~pythermalcomfort.models.humidex.humidex`,
+    :py:func:`~pythermalcomfort.models.heat_index_rothfusz.heat_index_rothfusz`,
+    :py:func:`~pythermalcomfort.models.discomfort_index.discomfort_index`,
+    :py:func:`~pythermalcomfort.models.thi.thi`,
+    :py:func:`~pythermalcomfort.models.net.net` and
+    :py:func:`~pythermalcomfort.models.utci.utci` accept the object as the
+    keyword argument `conditions`, in place of their `tdb`, `tr`, `v` and `rh`
+    inputs. Only `at` and `humidex` (Masterson model) use the cached
+    psychrometric values, the other models only take the inputs from it. The
+    PMV and the other models that use the relative air speed or other inputs
+    must be called with the attributes of the object, e.g. ``conditions.tdb``.
+
+    Parameters
+    ----------
+    tdb : float or list of floats
+        Dry bulb air temperature, [°C] in [°F] if `units` = 'IP'.
+    rh : float or list of floats
+        Relative humidity, [%].
+    tr : float or list of floats, optional
+        Mean radiant temperature, [°C] in [°F] if `units` = 'IP'.
+    v : float or list of floats, optional
+        Air speed, [m/s] in [fps] if `units` = 'IP'.
+    p_atm : float or list of floats, optional
+        Atmospheric pressure, [Pa]. Defaults to 101325.
+    units : str, optional
+        Units system of the inputs, 'SI' or 'IP'. Defaults to 'SI'. The
+        attributes are always stored in SI units.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.models import at, humidex, pmv_ppd_iso, utci
+        from pythermalcomfort.utilities import Conditions
+
+        conditions = Conditions(tdb=[77, 80], rh=50, tr=77, v=0.5, units="IP")
+        print(conditions.tdb)  # [25.         26.66666667]
+        print(conditions.p_vap)  # [1584.61, 1749.04]
+
+        result = utci(conditions=conditions)
+        result = at(conditions=conditions)
+        result = humidex(conditions=conditions, model="masterson")
+        result = pmv_ppd_iso(
+            conditions.tdb, conditions.tr, 0.1, conditions.rh, met=1.2, clo=0.5
+        )
+    """
+
+    tdb: NDArray[np.float64]
+    rh: NDArray[np.float64]
+    tr: NDArray[np.float64] | None = None
+    v: NDArray[np.float64] | None = None
+    p_atm: NDArray[np.float64] = 101325
+    units: InitVar[str] = Units.SI.value
+
+    def __post_init__(self, units: str) -> None:
+        self.tdb = np.asarray(self.tdb, dtype=np.float64)
+        self.rh = np.asarray(self.rh, dtype=np.float64)
+        self.p_atm = np.asarray(self.p_atm, dtype=np.float64)
+        if self.tr is not None:
+            self.tr = np.asarray(self.tr, dtype=np.float64)
+        if self.v is not None:
+            self.v = np.asarray(self.v, dtype=np.float64)
+
+        if units.upper() == Units.IP.value:
+            self.tdb = units_converter(tdb=self.tdb)[0]
+            if self.tr is not None:
+                self.tr = units_converter(tr=self.tr)[0]
+            if self.v is not None:
+                self.v = units_converter(v=self.v)[0]
+        elif units.upper() != Units.SI.value:
+            raise ValueError("units must be either 'SI' or 'IP'")
+
+    @cached_property
+    def p_sat(self) -> NDArray[np.float64]:
+        """Saturation vapour pressure, [Pa]."""
+        return p_sat(self.tdb)
+
+    @cached_property
+    def p_vap(self) -> NDArray[np.float64]:
+        """Partial pressure of water vapour in moist air, [Pa]."""
+        return self.rh / 100 * self.p_sat
+
+    @cached_property
+    def hr(self) -> NDArray[np.float64]:
+        """Humidity ratio, [kg water/kg dry air]."""
+        return 0.62198 * self.p_vap / (self.p_atm - self.p_vap)
+
+    @cached_property
+    def dew_point_tmp(self) -> NDArray[np.float64]:
+        """Dew point temperature, [°C]."""
+        return dew_point_tmp(self.tdb, self.rh)
+
+    @cached_property
+    def wet_bulb_tmp(self) -> NDArray[np.float64]:
+        """Wet bulb temperature, [°C]."""
+        return wet_bulb_tmp(self.tdb, self.rh)
+
+    @cached_property
+    def h(self) -> NDArray[np.float64]:
+        """Enthalpy of the air, [J/kg dry air]."""
+        return enthalpy_air(self.tdb, self.hr)
+
+    @property
+    def psychrometrics(self) -> PsychrometricValues:
+        """Psychrometric values, as returned by :py:func:`psy_ta_rh`."""
+        return PsychrometricValues(
+            p_sat=self.p_sat,
+            p_vap=self.p_vap,
+            hr=self.hr,
+            wet_bulb_tmp=self.wet_bulb_tmp,
+            dew_point_tmp=self.dew_point_tmp,
+            h=self.h,
+        )
+
+
+def _unpack_conditions(
+    model: str, conditions: Conditions | None, **inputs: Any
+) -> tuple[Any, ...]:
+    """Return the inputs of a model, taking the ones that are None from `conditions`.
+
+    Raises a TypeError if an input is neither passed to the model nor set in
+    `conditions`.
+    """
+    if conditions is not None:
+        inputs = {
+            name: getattr(conditions, name) if value is None else value
+            for name, value in inputs.items()
+        }
+    missing = [name for name, value in inputs.items() if value is None]
+    if missing:
+        msg = f"{model}() requires {', '.join(missing)}, or a Conditions object"
+        raise TypeError(msg)
+    return tuple(inputs.values())
+
+
 def operative_tmp(
     tdb: float | list[float],
     tr: float | list[float],
@@ -0,0 +1,250 @@
+"""Compile the numba kernels ahead of time into a configurable cache.
+
+The kernels are compiled with ``cache=True``, by default next to the installed
+package. When that directory cannot be written, e.g. in a read-only container
+image, every new process compiles them again on first use, which takes several
+seconds. Setting the environment variable ``PYTHERMALCOMFORT_CACHE_DIR``, or
+calling :py:func:`set_cache_dir` before the models are imported, stores the
+cache in another directory, which can be filled when the image is built with
+:py:func:`warmup` or the ``pythermalcomfort warmup`` command.
+
+The multi-threaded variants of the PMV, UTCI and SET kernels, used for large
+arrays, cannot be cached by numba and are still compiled on first use.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import pkgutil
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "PYTHERMALCOMFORT_CACHE_DIR"
+
+_MODELS_PACKAGE = "pythermalcomfort.models"
+
+
+def set_cache_dir(path: str | os.PathLike[str]) -> Path:
+    """Store the compiled kernels in `path` instead of next to the package.
+
+    It must be called before the models are imported, the kernels that are
+    already loaded keep their cache.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Directory of the cache, created if it does not exist.
+
+    Returns
+    -------
+    pathlib.Path
+        The absolute path of the directory.
+    """
+    loaded = [name for name in sys.modules if name.startswith(f"{_MODELS_PACKAGE}.")]
+    if loaded:
+        msg = (
+            "the cache directory must be set before the models are imported, "
+            f"{sorted(loaded)[0]} is already imported"
+        )
+        raise RuntimeError(msg)
+    path = Path(path).expanduser().resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    os.environ[CACHE_DIR_ENV] = str(path)
+    _apply_cache_dir()
+    return path
+
+
+def _apply_cache_dir() -> None:
+    """Point the numba cache to ``PYTHERMALCOMFORT_CACHE_DIR`` if it is set.
+
+    The directory is used for the cached functions of all the packages that use
+    numba in the process.
+    """
+    path = os.environ.get(CACHE_DIR_ENV)
+    if not path:
+        return
+    os.environ["NUMBA_CACHE_DIR"] = path
+    numba = sys.modules.get("numba")
+    if numba is not None:
+        # numba reads its configuration once, when it is imported
+        numba.config.CACHE_DIR = path
+
+
+@dataclass(frozen=True)
+class KernelStatus:
+    """How a compiled kernel was obtained by :py:func:`warmup`.
+
+    Attributes
+    ----------
+    name : str
+        Qualified name of the kernel.
+    status : str
+        "cached" if it was loaded from the cache, "compiled" if it was compiled
+        and written to the cache, "already loaded" if it was imported before
+        :py:func:`warmup` was called.
+    signatures : list of str
+        Argument types of the compiled signatures, empty if none was compiled.
+    """
+
+    name: str
+    status: str
+    signatures: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """Result of :py:func:`warmup`.
+
+    Attributes
+    ----------
+    cache_dir : str or None
+        Directory of the cache, None if it is next to the package.
+    duration : float
+        Time spent, [s].
+    kernels : list of KernelStatus
+        Status of each kernel.
+    """
+
+    cache_dir: str | None
+    duration: float
+    kernels: list[KernelStatus]
+
+    @property
+    def compiled(self) -> list[str]:
+        """Names of the kernels that were compiled."""
+        return [k.name for k in self.kernels if k.status == "compiled"]
+
+    @property
+    def cached(self) -> list[str]:
+        """Names of the kernels that were loaded from the cache."""
+        return [k.name for k in self.kernels if k.status == "cached"]
+
+    def __str__(self) -> str:
+        width = max((len(k.status) for k in self.kernels), default=0)
+        lines = [f"{k.status:<{width}}  {k.name}" for k in self.kernels]
+        lines.append(
+            f"{len(self.cached)} kernels loaded from the cache, "
+            f"{len(self.compiled)} compiled in {self.duration:.1f} s, "
+            f"cache directory: {self.cache_dir or 'next to the package'}"
+        )
+        return "\n".join(lines)
+
+
+def _py_func(kernel: Any) -> Callable[..., Any] | None:
+    """Return the Python function of a numba kernel, None for other objects."""
+    from numba.core.dispatcher import Dispatcher
+    from numba.np.ufunc.dufunc import DUFunc
+
+    from pythermalcomfort.models._parallel_optimized import _ParallelUfunc
+
+    if isinstance(kernel, Dispatcher):
+        return kernel.py_func
+    if isinstance(kernel, DUFunc):
+        return kernel._dispatcher.py_func
+    if isinstance(kernel, _ParallelUfunc):
+        return kernel._func
+    return None
+
+
+def _kernels(module_names: list[str]) -> list[tuple[str, str]]:
+    """Return the module and the qualified name of the kernels of the modules."""
+    kernels = []
+    for module_name in module_names:
+        for value in vars(sys.modules[module_name]).values():
+            func = _py_func(value)
+            if func is not None and func.__module__ == module_name:
+                kernels.append((module_name, func.__qualname__))
+    return sorted(set(kernels))
+
+
+def _exercise() -> None:
+    """Call the kernels that are compiled on first call, not when imported."""
+    import numpy as np
+
+    from pythermalcomfort.batch import PHSSeries
+    from pythermalcomfort.models import (
+        outdoor_indices,
+        phs,
+        pmv_ppd_ashrae,
+        pmv_ppd_iso,
+    )
+    from pythermalcomfort.solvers import warm_start
+
+    tdb = np.array([30.0, 40.0])
+    inputs = {"tdb": tdb, "tr": tdb, "v": 0.3, "rh": 40, "met": 2.5, "clo": 0.5}
+    phs(**inputs, posture="standing")
+    PHSSeries(posture="standing", duration=1)(
+        {name: np.broadcast_to(value, tdb.shape) for name, value in inputs.items()}
+    )
+    outdoor_indices(tdb=tdb, rh=40, v=1, sol_radiation_global=500)
+    indoor = {"tdb": 25, "tr": 25, "vr": 0.1, "rh": 50, "met": 1.2, "clo": 0.5}
+    with warm_start():
+        pmv_ppd_iso(**indoor)
+        pmv_ppd_ashrae(**indoor)
+
+
+def warmup() -> WarmupReport:
+    """Load or compile all the compiled kernels of the models.
+
+    Running it once when a container image is built, with
+    ``PYTHERMALCOMFORT_CACHE_DIR`` set, fills the cache so the processes started
+    from the image load the kernels instead of compiling them. The kernels that
+    are compiled on first call are called once with the argument types used by
+    the models. The kernels of the modules imported before are reported as
+    "already loaded", call it first, or in a new process, to get a full report.
+
+    Returns
+    -------
+    WarmupReport
+        Which kernels were loaded from the cache and which were compiled.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pythermalcomfort.warmup import set_cache_dir, warmup
+
+        set_cache_dir("/opt/pythermalcomfort-cache")
+        print(warmup())
+    """
+    from numba.core import event
+
+    start = time.perf_counter()
+    package = importlib.import_module(_MODELS_PACKAGE)
+    module_names = [
+        f"{_MODELS_PACKAGE}.{info.name}"
+        for info in pkgutil.iter_modules(package.__path__)
+    ]
+    imported = {name for name in module_names if name in sys.modules}
+
+    compiled: dict[tuple[str, str], set[str]] = {}
+    # the compiler passes only run for the kernels that are not in the cache
+    with event.install_recorder("numba:run_pass") as recorder:
+        for name in module_names:
+            importlib.import_module(name)
+        _exercise()
+    for _, record in recorder.buffer:
+        data = record.data
+        compiled.setdefault((data["module"], data["qualname"]), set()).add(data["args"])
+
+    kernels = []
+    for module_name, qualname in _kernels(module_names):
+        signatures = sorted(compiled.get((module_name, qualname), ()))
+        if signatures:
+            status = "compiled"
+        elif module_name in imported:
+            status = "already loaded"
+        else:
+            status = "cached"
+        kernels.append(KernelStatus(f"{module_name}.{qualname}", status, signatures))
+
+    return WarmupReport(
+        cache_dir=os.environ.get(CACHE_DIR_ENV) or None,
+        duration=time.perf_counter() - start,
+        kernels=kernels,
+    )
@@ -106,6 +106,9 @@ setup(
     ],
     extras_require={
         "dev": ["pytest", "sphinx"],
+        "parquet": ["pyarrow"],
+        "xarray": ["xarray", "dask[array]"],
+        "dask": ["dask[dataframe]"],
     },
     entry_points={
         "console_scripts": [
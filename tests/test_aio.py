@@ -0,0 +1,59 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from pythermalcomfort.aio import MicroBatcher, run_in_executor
+from pythermalcomfort.models import pmv_ppd_ashrae
+
+
+def test_micro_batcher() -> None:
+    """Test that concurrent calls are computed in one batch with the same results."""
+    sizes = []
+
+    def model(**kwargs):
+        sizes.append(np.size(kwargs["tdb"]))
+        if np.any(np.asarray(kwargs["tdb"]) > 50):
+            raise ValueError("tdb is too high")
+        return pmv_ppd_ashrae(**kwargs)
+
+    batcher = MicroBatcher(model, max_delay=0.01)
+    kwargs = {"tr": 25, "vr": 0.1, "rh": 50, "met": 1.2, "clo": 0.5}
+
+    async def main():
+        return await asyncio.gather(
+            *(batcher(tdb=20 + i / 10, **kwargs) for i in range(50)),
+            batcher(tdb=[22, 23], **kwargs),
+        )
+
+    results = asyncio.run(main())
+    assert sizes == [52]
+    expected = pmv_ppd_ashrae(tdb=20.3, **kwargs)
+    assert results[3].pmv == expected.pmv
+    assert results[3].tsv == expected.tsv
+    np.testing.assert_equal(results[-1].pmv, pmv_ppd_ashrae(tdb=[22, 23], **kwargs).pmv)
+
+    # an invalid call fails alone, the other calls of its batch are computed
+    async def invalid():
+        return await asyncio.gather(
+            batcher(tdb=25, **kwargs),
+            batcher(tdb=60, **kwargs),
+            batcher(tdb=25, units="SI", **kwargs),
+            return_exceptions=True,
+        )
+
+    sizes.clear()
+    results = asyncio.run(invalid())
+    assert isinstance(results[1], ValueError)
+    assert results[0].pmv == results[2].pmv == pmv_ppd_ashrae(tdb=25, **kwargs).pmv
+    # the call with units is in another batch
+    assert sorted(sizes) == [1, 1, 1, 2]
+
+    with pytest.raises(ValueError):
+        MicroBatcher(model, max_batch_size=0)
+
+
+def test_run_in_executor() -> None:
+    """Test that blocking calls are run in an executor."""
+    result = asyncio.run(run_in_executor(pmv_ppd_ashrae, 25, 25, 0.1, 50, 1.2, 0.5))
+    assert result.pmv == pmv_ppd_ashrae(25, 25, 0.1, 50, 1.2, 0.5).pmv
@@ -1,4 +1,5 @@
 from pythermalcomfort.models import at
+from pythermalcomfort.utilities import Conditions
 from tests.conftest import Urls, is_equal, retrieve_reference_table, validate_result
 
 
@@ -29,3 +30,12 @@ def test_at_q() -> None:
     """Test that the function calculates the AT correctly for given inputs."""
     result = at(25, 30, 0.1, 100)
     is_equal(result, 25.3, 0.1)
+
+
+def test_at_conditions() -> None:
+    """Test that the AT accepts a Conditions object."""
+    conditions = Conditions(tdb=[25, 25], rh=30, v=0.1)
+    assert is_equal(at(conditions=conditions).at, [24.1, 24.1], 0.1)
+    assert is_equal(at(q=100, conditions=conditions).at, [30.9, 30.9], 0.1)
+    # inputs passed explicitly take precedence over the conditions
+    assert is_equal(at(v=1, conditions=conditions).at, at(25, 30, 1).at, 0.1)
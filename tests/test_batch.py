@@ -0,0 +1,432 @@
+import numpy as np
+import pytest
+
+from pythermalcomfort.batch import (
+    INDICES,
+    PHSSeries,
+    RunningMeanOutdoorTemperature,
+    evaluate,
+    evaluate_chunks,
+    evaluate_dask,
+    evaluate_grid,
+    evaluate_xarray,
+    pipeline,
+    read_chunks,
+    write_chunks,
+)
+from pythermalcomfort.models import (
+    at,
+    phs,
+    pmv_ppd_ashrae,
+    pmv_ppd_iso,
+    set_tmp,
+    utci,
+)
+from pythermalcomfort.utilities import (
+    clo_dynamic_ashrae,
+    clo_dynamic_iso,
+    running_mean_outdoor_temperature,
+    v_relative,
+)
+
+table = {
+    "tdb": [25, 26, 27, 28, 29],
+    "tr": [25, 25, 26, 27, 28],
+    "v": [0.1, 0.15, 0.2, 0.5, 1.0],
+    "rh": [50, 50, 60, 40, 30],
+    "met": [1, 1.2, 1.3, 1.1, 1.4],
+    "clo": [0.5, 0.6, 0.7, 0.8, 0.5],
+}
+
+
+def test_evaluate_matches_models() -> None:
+    """Test that the batch results match the ones of the individual models."""
+    results = evaluate(table, ["pmv_ppd_iso", "pmv_ppd_ashrae", "set_tmp", "utci"])
+
+    vr = v_relative(table["v"], table["met"])
+    clo_iso = clo_dynamic_iso(table["clo"], table["met"], table["v"])
+    clo_ashrae = clo_dynamic_ashrae(table["clo"], table["met"])
+    inputs = (table["tdb"], table["tr"], vr, table["rh"], table["met"])
+    np.testing.assert_equal(
+        results["pmv_ppd_iso.pmv"], pmv_ppd_iso(*inputs, clo_iso).pmv
+    )
+    np.testing.assert_equal(
+        results["pmv_ppd_ashrae.ppd"], pmv_ppd_ashrae(*inputs, clo_ashrae).ppd
+    )
+    np.testing.assert_equal(results["set_tmp.set"], set_tmp(**table).set)
+    np.testing.assert_equal(
+        results["utci.utci"],
+        utci(table["tdb"], table["tr"], table["v"], table["rh"]).utci,
+    )
+
+
+def test_evaluate_chunks_and_constants() -> None:
+    """Test that the results do not depend on the chunk size."""
+    inputs = {"tdb": table["tdb"], "rh": table["rh"], "v": table["v"]}
+    expected = evaluate(inputs, ["at", "humidex", "wbgt"], twb=20, tg=30)
+    results = evaluate(inputs, ["at", "humidex", "wbgt"], chunk_size=2, twb=20, tg=30)
+    assert expected.keys() == results.keys()
+    for column, values in expected.items():
+        np.testing.assert_equal(results[column], values)
+    np.testing.assert_equal(
+        results["at.at"], at(table["tdb"], table["rh"], table["v"]).at
+    )
+
+
+def test_evaluate_ip_units() -> None:
+    """Test that IP inputs are converted once and the results are in SI units."""
+    results = evaluate(
+        {"tdb": [77, 86], "tr": [77, 86], "v": 3.281, "rh": 50}, ["utci"], units="IP"
+    )
+    np.testing.assert_equal(results["utci.utci"], utci([25, 30], [25, 30], 1, 50).utci)
+
+
+def test_evaluate_options() -> None:
+    """Test that the options are passed to the models."""
+    results = evaluate(
+        {"tdb": 35, "tr": 35, "v": 0.1, "rh": 50},
+        ["utci"],
+        options={"utci": {"round_output": False}},
+    )
+    assert results["utci.utci"].shape == (1,)
+    assert results["utci.utci"][0] != np.round(results["utci.utci"][0], 1)
+
+
+def test_evaluate_errors() -> None:
+    """Test that invalid requests raise an error."""
+    assert "pmv_ppd_iso" in INDICES
+    with pytest.raises(ValueError):
+        evaluate(table, ["random"])
+    with pytest.raises(ValueError):
+        evaluate(table, ["utci"], chunk_size=0)
+    with pytest.raises(ValueError):
+        evaluate({"tdb": [25, 26], "rh": [50, 50, 50]}, ["thi"])
+    with pytest.raises(KeyError):
+        evaluate({"tdb": [25, 26]}, ["thi"])
+    # the natural wet bulb temperature is measured, not derived from tdb and rh
+    with pytest.raises(KeyError, match="twb"):
+        evaluate({"tdb": [25, 26], "rh": 50}, ["wbgt"], tg=30)
+
+
+def test_evaluate_length_one_columns() -> None:
+    """Test that length-1 columns are used for all the rows of every chunk."""
+    inputs = {**table, "met": [1.2], "clo": [0.5]}
+    expected = evaluate({**table, "met": 1.2, "clo": 0.5}, ["pmv_ppd_iso"])
+    results = evaluate(inputs, ["pmv_ppd_iso"], chunk_size=2)
+    np.testing.assert_equal(results["pmv_ppd_iso.pmv"], expected["pmv_ppd_iso.pmv"])
+
+
+def test_read_and_write_chunks(tmp_path) -> None:
+    """Test that tables are read and written in chunks."""
+    path = tmp_path / "table.csv"
+    chunks = [{"tdb": np.array([25.0, 26.0]), "position": np.array(["a", "b"])}]
+    assert write_chunks(chunks * 3, path) == 6
+
+    read = list(read_chunks(path, chunk_size=4))
+    assert [len(chunk["tdb"]) for chunk in read] == [4, 2]
+    np.testing.assert_equal(read[1]["tdb"], [25.0, 26.0])
+    assert list(read[0]["position"]) == ["a", "b", "a", "b"]
+
+    results = list(evaluate_chunks(read, ["thi"], rh=50))
+    np.testing.assert_equal(
+        results[1]["thi.thi"], evaluate(chunks[0], ["thi"], rh=50)["thi.thi"]
+    )
+    assert "tdb" in results[0]
+
+
+def test_evaluate_chunks_after_parallel_kernel() -> None:
+    """Test that the workers start after a parallel numba kernel has run."""
+    phs(tdb=40, tr=40, v=0.3, rh=33.85, met=2.5, clo=0.5, posture="standing")
+    chunks = [
+        {
+            "tdb": np.array(table["tdb"][i : i + 2]),
+            "rh": np.array(table["rh"][i : i + 2]),
+        }
+        for i in range(0, 5, 2)
+    ]
+    results = list(evaluate_chunks(chunks, ["thi"], workers=2))
+    np.testing.assert_equal(
+        np.concatenate([chunk["thi.thi"] for chunk in results]),
+        evaluate(table, ["thi"])["thi.thi"],
+    )
+
+
+def test_read_npy_chunks(tmp_path) -> None:
+    """Test that .npy files and mappings of columns are read in chunks."""
+    data = np.zeros(5, dtype=[("tdb", float), ("rh", float)])
+    data["tdb"] = table["tdb"]
+    data["rh"] = table["rh"]
+    np.save(tmp_path / "table.npy", data)
+    np.save(tmp_path / "tdb.npy", data["tdb"])
+
+    read = list(read_chunks(tmp_path / "table.npy", chunk_size=2))
+    assert [len(chunk["tdb"]) for chunk in read] == [2, 2, 1]
+    np.testing.assert_equal(read[2]["rh"], [30])
+
+    read = list(read_chunks({"tdb": tmp_path / "tdb.npy", "rh": 50}, chunk_size=3))
+    np.testing.assert_equal(read[1]["tdb"], [28, 29])
+    assert read[1]["rh"] == 50
+
+    np.save(tmp_path / "plain.npy", data["tdb"])
+    with pytest.raises(ValueError):
+        list(read_chunks(tmp_path / "plain.npy"))
+
+
+def test_evaluate_grid(tmp_path) -> None:
+    """Test that gridded inputs are computed in tiles into memory-mapped outputs."""
+    rng = np.random.default_rng(0)
+    tdb = rng.uniform(15, 35, (3, 4, 5))
+    np.save(tmp_path / "tdb.npy", tdb)
+    v = rng.uniform(0.1, 2, (1, 1, 5))
+    expected = evaluate(
+        {"tdb": tdb.ravel(), "v": np.broadcast_to(v, tdb.shape).ravel()},
+        ["utci", "heat_index_rothfusz"],
+        tr=30,
+        rh=50,
+    )
+
+    # tiles of 7 points split the last axis, of 10 points the middle one
+    for tile_size in (7, 10, 100):
+        out = tmp_path / f"out{tile_size}"
+        results = evaluate_grid(
+            {"tdb": tmp_path / "tdb.npy", "v": v, "rh": [50]},
+            ["utci", "heat_index_rothfusz"],
+            out=out,
+            tile_size=tile_size,
+            tr=30,
+        )
+        assert sorted(results) == ["heat_index_rothfusz.hi", "utci.utci"]
+        saved = np.load(out / "utci.utci.npy")
+        assert saved.shape == tdb.shape
+        np.testing.assert_equal(saved.ravel(), expected["utci.utci"])
+        np.testing.assert_equal(
+            results["heat_index_rothfusz.hi"].ravel(),
+            expected["heat_index_rothfusz.hi"],
+        )
+
+    target = np.lib.format.open_memmap(
+        tmp_path / "pmv.npy", mode="w+", dtype=float, shape=tdb.shape
+    )
+    evaluate_grid(
+        {"tdb": tdb},
+        ["pmv_ppd_iso"],
+        out={"pmv_ppd_iso.pmv": target},
+        tile_size=6,
+        tr=25,
+        v=0.1,
+        rh=50,
+        met=1.2,
+        clo=0.5,
+    )
+    np.testing.assert_equal(
+        target.ravel(),
+        evaluate(
+            {"tdb": tdb.ravel()}, ["pmv_ppd_iso"], tr=25, v=0.1, rh=50, met=1.2, clo=0.5
+        )["pmv_ppd_iso.pmv"],
+    )
+
+    with pytest.raises(ValueError, match="not numeric"):
+        evaluate_grid(
+            {"tdb": tdb, "v": v},
+            ["utci"],
+            tmp_path,
+            ["utci.stress_category"],
+            tr=30,
+            rh=50,
+        )
+    with pytest.raises(ValueError, match="shape"):
+        evaluate_grid({"tdb": tdb}, ["thi"], {"thi.thi": np.empty(3)}, rh=50)
+    with pytest.raises(ValueError):
+        evaluate_grid({"tdb": tdb}, ["thi"], tmp_path, tile_size=0, rh=50)
+
+
+def test_evaluate_xarray() -> None:
+    """Test that xarray inputs are evaluated lazily per dask chunk."""
+    xr = pytest.importorskip("xarray")
+    pytest.importorskip("dask")
+    rng = np.random.default_rng(0)
+    coords = {"lat": np.arange(4), "lon": np.arange(6), "time": np.arange(8)}
+    tdb = xr.DataArray(
+        rng.uniform(15, 35, (4, 6, 8)), dims=tuple(coords), coords=coords
+    ).chunk({"time": 3})
+    v = xr.DataArray(
+        rng.uniform(0.1, 2, 8), dims="time", coords={"time": coords["time"]}
+    )
+    ds = xr.Dataset({"tdb": tdb, "v": v}, attrs={"source": "test"})
+
+    results = evaluate_xarray(
+        ds, ["utci", "pmv_ppd_iso"], tr=30, rh=50, met=1.2, clo=0.5
+    )
+    assert sorted(results) == ["pmv_ppd_iso.pmv", "pmv_ppd_iso.ppd", "utci.utci"]
+    assert results.attrs == {"source": "test"}
+    assert results["utci.utci"].chunks == tdb.chunks
+    expected = evaluate(
+        {"tdb": tdb.values.ravel(), "v": np.tile(v.values, 24)},
+        ["utci", "pmv_ppd_iso"],
+        tr=30,
+        rh=50,
+        met=1.2,
+        clo=0.5,
+    )
+    for name, values in results.compute().items():
+        np.testing.assert_equal(values.values.ravel(), expected[name])
+
+    categories = evaluate_xarray(ds, ["utci"], ["utci.stress_category"], tr=30, rh=50)
+    assert categories["utci.stress_category"].dtype == object
+    with pytest.raises(ValueError):
+        evaluate_xarray(ds, ["utci"], ["utci.wrong"], tr=30, rh=50)
+    with pytest.raises(ValueError):
+        evaluate_xarray({"tdb": 25}, ["thi"], rh=50)
+
+
+def test_evaluate_dask() -> None:
+    """Test that dask partitions with an overlap match the sequential results."""
+    pd = pytest.importorskip("pandas")
+    dd = pytest.importorskip("dask.dataframe")
+    rng = np.random.default_rng(0)
+    n = 24 * 20
+    frame = pd.DataFrame(
+        {
+            "date": np.repeat(np.arange(20), 24),
+            "t_out": rng.uniform(10, 30, n),
+            "tdb": rng.uniform(20, 30, n),
+            "tr": 25.0,
+            "v": 1.0,
+            "rh": 50.0,
+        }
+    )
+    columns = {name: frame[name].to_numpy() for name in frame}
+    steps = [RunningMeanOutdoorTemperature(by="date"), "adaptive_en", "utci"]
+    # the steps are copied in their current state, use new ones for the pipeline
+    expected = next(
+        pipeline(columns, [RunningMeanOutdoorTemperature(by="date"), *steps[1:]])
+    )
+
+    df = dd.from_pandas(frame, npartitions=2)
+    results = evaluate_dask(df, steps, overlap=8 * 24)
+    assert results.dtypes["adaptive_en.acceptability_cat_i"] == np.bool_
+    assert results.dtypes["utci.stress_category"] == np.object_
+    computed = results.compute()
+    for name in ("t_running_mean", "adaptive_en.tmp_cmf", "utci.utci"):
+        np.testing.assert_equal(computed[name].to_numpy(), expected[name])
+    assert list(computed["utci.stress_category"]) == list(
+        expected["utci.stress_category"]
+    )
+
+    # without the overlap the second partition has no history
+    computed = evaluate_dask(df, steps).compute()
+    assert np.isnan(computed["t_running_mean"].to_numpy()[n // 2])
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_pipeline(read_ahead) -> None:
+    """Test that the pipeline gives the same results for any chunk size."""
+    expected = evaluate(table, ["pmv_ppd_iso", "utci"])
+    for chunk_size in (1, 2, 5):
+        chunks = list(
+            pipeline(
+                table,
+                ["pmv_ppd_iso", "utci"],
+                chunk_size=chunk_size,
+                read_ahead=read_ahead,
+            )
+        )
+        assert len(chunks) == -(-5 // chunk_size)
+        assert list(chunks[0])[:6] == list(table)
+        for column, values in expected.items():
+            if values.dtype.kind == "f":
+                np.testing.assert_equal(
+                    np.concatenate([c[column] for c in chunks]), values
+                )
+
+    with pytest.raises(ValueError):
+        list(pipeline(table, ["pmv"]))
+    with pytest.raises(ValueError):
+        list(pipeline(table, ["utci"], read_ahead=-1))
+
+
+def test_pipeline_read_ahead_errors() -> None:
+    """Test that the errors raised while reading the chunks are propagated."""
+
+    def chunks():
+        yield {"tdb": np.array([25.0]), "rh": np.array([50.0])}
+        raise OSError("read error")
+
+    results = pipeline(chunks(), ["thi"], read_ahead=1)
+    assert "thi.thi" in next(results)
+    with pytest.raises(OSError, match="read error"):
+        next(results)
+
+
+def test_running_mean_outdoor_temperature_chunks() -> None:
+    """Test that the running mean does not depend on the chunk boundaries."""
+    t_out = np.random.default_rng(0).uniform(5, 30, 20)
+    expected = np.full(20, np.nan)
+    for i in range(7, 20):
+        expected[i] = running_mean_outdoor_temperature(list(t_out[i - 7 : i][::-1]))
+
+    for chunk_size in (1, 3, 7, 20):
+        chunks = pipeline(
+            {"t_out": t_out},
+            [RunningMeanOutdoorTemperature()],
+            chunk_size=chunk_size,
+        )
+        result = np.concatenate([c["t_running_mean"] for c in chunks])
+        np.testing.assert_equal(result, expected)
+
+    # four rows per day, the days are split between chunks
+    hourly = {
+        "t_out": np.repeat(t_out, 4) + np.tile([-2, -1, 1, 2], 20),
+        "date": np.repeat(np.arange(20), 4),
+    }
+    for chunk_size in (3, 10, 80):
+        chunks = pipeline(
+            hourly,
+            [RunningMeanOutdoorTemperature(by="date"), "adaptive_en"],
+            chunk_size=chunk_size,
+            tdb=25,
+            tr=25,
+            v=0.1,
+        )
+        chunks = list(chunks)
+        result = np.concatenate([c["t_running_mean"] for c in chunks])
+        np.testing.assert_equal(result, np.repeat(expected, 4))
+        assert "adaptive_en.tmp_cmf" in chunks[0]
+
+
+def test_phs_series_chunks() -> None:
+    """Test that the PHS state is carried over from one row and chunk to the next."""
+    rows = {
+        "tdb": np.array([40, 42, 60, 38, 41.0]),
+        "rh": np.array([30, 35, 30, 40, 33.0]),
+        "duration": np.array([30, 60, 30, 30, 45]),
+    }
+    constants = {"tr": 40, "v": 0.3, "met": 2.5, "clo": 0.5, "posture": "standing"}
+    expected, state = [], {}
+    for tdb, rh, duration in zip(*rows.values(), strict=True):
+        result = phs(
+            tdb=tdb,
+            rh=rh,
+            duration=int(duration),
+            round_output=False,
+            **constants,
+            **state,
+        )
+        expected.append(result)
+        # 60 °C is outside the applicability limits, the next row starts again
+        # from the default initial values
+        state = {} if tdb == 60 else {n: getattr(result, n) for n in PHSSeries._STATE}
+
+    for chunk_size in (1, 2, 5):
+        chunks = list(pipeline(rows, [PHSSeries(**constants)], chunk_size=chunk_size))
+        for name in ("t_re", "t_sk", "sweat_loss_g", "d_lim_t_re"):
+            result = np.concatenate([c[f"phs.{name}"] for c in chunks])
+            np.testing.assert_allclose(
+                result, [getattr(r, name) for r in expected], rtol=1e-12
+            )
+        assert np.isnan(np.concatenate([c["phs.t_re"] for c in chunks])[2])
+
+    with pytest.raises(KeyError, match="posture"):
+        PHSSeries(tr=40, v=0.3, met=2.5, clo=0.5)(rows)
+    with pytest.raises(ValueError):
+        PHSSeries(model="random")
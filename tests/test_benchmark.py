@@ -0,0 +1,115 @@
+import importlib
+import json
+
+import pytest
+
+from pythermalcomfort.benchmark import cases, compare, run
+from pythermalcomfort.cli import main
+
+
+def test_run() -> None:
+    """Test that the calls are timed by stage and the kernels restored."""
+    utci_module = importlib.import_module("pythermalcomfort.models.utci")
+    kernel = utci_module._utci_optimized
+    results = run(
+        ["utci", "phs[duration=60]", "heat_index_lu"],
+        sizes=[None, 10, 10_000],
+        repeat=1,
+    )
+    assert utci_module._utci_optimized is kernel
+    # heat_index_lu is not run with 10000 elements
+    assert [(r["case"], r["size"]) for r in results["results"]] == [
+        ("utci", "scalar"),
+        ("utci", 10),
+        ("utci", 10_000),
+        ("phs[duration=60]", "scalar"),
+        ("phs[duration=60]", 10),
+        ("phs[duration=60]", 10_000),
+        ("heat_index_lu", "scalar"),
+        ("heat_index_lu", 10),
+    ]
+    for result in results["results"]:
+        stages = (
+            result["validation_s"] + result["kernel_s"] + result["post_processing_s"]
+        )
+        assert stages == pytest.approx(result["total_s"])
+    assert results["results"][2]["kernel_s"] > 0
+    assert results["results"][2]["validation_s"] > 0
+    assert results["results"][-1]["kernel_s"] == 0
+    assert "JOS3.simulate[times=60]" in cases()
+
+    with pytest.raises(ValueError):
+        run(["random"])
+
+
+def test_compare() -> None:
+    """Test that the calls slower than the tolerance are regressions."""
+    baseline = {
+        "results": [
+            {"case": "utci", "size": 10, "total_s": 1.0},
+            {"case": "utci", "size": "scalar", "total_s": 1.0},
+        ]
+    }
+    results = {
+        "results": [
+            {"case": "utci", "size": 10, "total_s": 1.05},
+            {"case": "utci", "size": "scalar", "total_s": 1.5},
+            {"case": "set_tmp", "size": 10, "total_s": 1.5},
+        ]
+    }
+    regressions = compare(baseline, results, tolerance=0.1)
+    assert [(r["case"], r["size"]) for r in regressions] == [("utci", "scalar")]
+    assert regressions[0]["metric"] == "total_s"
+    assert regressions[0]["ratio"] == 1.5
+
+
+def test_benchmark_command(tmp_path, capsys) -> None:
+    """Test that the command saves the results and compares them."""
+    output = tmp_path / "results.json"
+    args = ["benchmark", "-b", "thi", "--sizes", "scalar", "1e2", "--repeat", "1"]
+    assert main([*args, "-o", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert [r["size"] for r in results["results"]] == ["scalar", 100]
+    assert "thi" in capsys.readouterr().out
+
+    for result in results["results"]:
+        result["total_s"] = 0.0
+    output.write_text(json.dumps(results))
+    assert main([*args, "--compare", str(output)]) == 0
+    for result in results["results"]:
+        result["total_s"] = 1e-9
+    output.write_text(json.dumps(results))
+    assert main([*args, "--compare", str(output)]) == 1
+
+    args = ["benchmark", "-b", "thi", "--sizes", "1e3", "--memory"]
+    assert main([*args, "-o", str(output)]) == 0
+    assert "peak KiB" in capsys.readouterr().out
+    results = json.loads(output.read_text())
+    results["results"][0]["peak_bytes"] = 1
+    output.write_text(json.dumps(results))
+    assert main([*args, "--compare", str(output)]) == 1
+    assert "KiB" in capsys.readouterr().err
+
+
+def test_run_memory() -> None:
+    """Test that the peak memory grows with the number of elements."""
+    results = run(["pmv_ppd_iso", "thi"], sizes=[None, 1_000, 100_000], memory=True)
+    assert results["mode"] == "memory"
+    peaks = {(r["case"], r["size"]): r for r in results["results"]}
+    for case in ("pmv_ppd_iso", "thi"):
+        large = peaks[(case, 100_000)]
+        # at least the float64 output array of each element
+        assert large["bytes_per_element"] >= 8
+        assert large["peak_bytes"] > peaks[(case, 1_000)]["peak_bytes"]
+        assert "total_s" not in large
+
+    baseline = {
+        "mode": "memory",
+        "results": [
+            {**r, "peak_bytes": r["peak_bytes"] / 2} for r in results["results"]
+        ],
+    }
+    assert len(compare(baseline, results)) == len(results["results"])
+    assert compare(results, results) == []
+    with pytest.raises(ValueError):
+        compare({"mode": "time", "results": []}, results)
@@ -0,0 +1,133 @@
+import csv
+
+import numpy as np
+import pytest
+
+from pythermalcomfort.batch import evaluate
+from pythermalcomfort.cli import main
+
+rows = [
+    ["tdb", "tr", "v", "rh", "met", "clo"],
+    [25, 25, 0.15, 50, 1, 1],
+    [26, 25, 0.15, 50, 1.3, 1],
+    [27, 25, 0.15, 50, 1.6, 1],
+    [28, 25, 0.15, 50, 1.2, 1],
+    [29, 25, 0.15, 50, 1, 1],
+]
+
+
+@pytest.fixture
+def input_csv(tmp_path):
+    path = tmp_path / "input.csv"
+    with path.open("w", newline="") as file:
+        csv.writer(file).writerows(rows)
+    return path
+
+
+def _read_csv(path):
+    with path.open(newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_compute_csv(input_csv, tmp_path) -> None:
+    """Test that the compute command writes the inputs and the results."""
+    output = tmp_path / "output.csv"
+    args = [str(input_csv), "-m", "pmv_ppd_iso", "set_tmp", "-o", str(output)]
+    assert main(["compute", *args, "--chunk-size", "2"]) == 0
+
+    result = _read_csv(output)
+    table = {name: [row[i] for row in rows[1:]] for i, name in enumerate(rows[0])}
+    expected = evaluate(table, ["pmv_ppd_iso", "set_tmp"])
+    assert len(result) == 5
+    assert list(result[0])[:6] == rows[0]
+    np.testing.assert_allclose(
+        [float(row["pmv_ppd_iso.pmv"]) for row in result], expected["pmv_ppd_iso.pmv"]
+    )
+    assert [row["pmv_ppd_iso.tsv"] for row in result] == list(
+        expected["pmv_ppd_iso.tsv"]
+    )
+    np.testing.assert_allclose(
+        [float(row["set_tmp.set"]) for row in result], expected["set_tmp.set"]
+    )
+
+
+def test_compute_workers_and_constants(input_csv, tmp_path) -> None:
+    """Test that the results do not depend on the number of workers."""
+    serial = tmp_path / "serial.csv"
+    parallel = tmp_path / "parallel.csv"
+    args = [
+        str(input_csv),
+        "-m",
+        "wbgt",
+        "--set",
+        "twb=20",
+        "--set",
+        "tg=30",
+        "--chunk-size",
+        "2",
+    ]
+    assert main(["compute", *args, "-o", str(serial)]) == 0
+    assert main(["compute", *args, "-o", str(parallel), "--workers", "2"]) == 0
+    assert _read_csv(serial) == _read_csv(parallel)
+    assert len(_read_csv(serial)) == 5
+
+
+def test_compute_parquet(input_csv, tmp_path) -> None:
+    """Test that Parquet files can be read and written."""
+    pytest.importorskip("pyarrow")
+    output = tmp_path / "output.parquet"
+    assert main(["compute", str(input_csv), "-m", "utci", "-o", str(output)]) == 0
+    csv_output = tmp_path / "output.csv"
+    assert main(["compute", str(output), "-m", "thi", "-o", str(csv_output)]) == 0
+    result = _read_csv(csv_output)
+    assert len(result) == 5
+    assert "utci.utci" in result[0]
+    assert "thi.thi" in result[0]
+
+
+def test_compute_errors(input_csv, tmp_path, capsys) -> None:
+    """Test that the missing inputs are reported with an exit code."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["compute", str(input_csv), "-m", "wbgt"])
+    assert exc_info.value.code == 1
+    assert "missing input 'twb'" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["compute", str(input_csv), "-m", "random"])
+    assert exc_info.value.code == 2
+
+    for text in ("", "tdb,tr,v,rh\n"):
+        path = tmp_path / "empty.csv"
+        path.write_text(text)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["compute", str(path), "-m", "utci"])
+        assert exc_info.value.code == 1
+    assert capsys.readouterr().err.count("pythermalcomfort: error:") == 2
+
+
+def test_compute_parquet_missing_categories(tmp_path) -> None:
+    """Test that text outputs are written as strings, even if missing in a chunk."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "input.csv"
+    with path.open("w", newline="") as file:
+        # UTCI is nan when v < 0.5 m/s, the values in the last row are not numbers
+        csv.writer(file).writerows(
+            [["tdb", "tr", "v", "rh"], [25, 25, 0.1, 50], [25, 25, 0.1, 50]]
+            + [[30, 30, 1, 50]] * 3
+            + [["NA", 30, 1, 50]]
+        )
+    output = tmp_path / "output.parquet"
+    args = ["compute", str(path), "-m", "utci", "--chunk-size", "2"]
+    assert main([*args, "-o", str(output)]) == 0
+
+    csv_output = tmp_path / "output.csv"
+    assert main(["compute", str(output), "-m", "thi", "-o", str(csv_output)]) == 0
+    result = _read_csv(csv_output)
+    assert [row["utci.stress_category"] for row in result] == [
+        "",
+        "",
+        "moderate heat stress",
+        "moderate heat stress",
+        "moderate heat stress",
+        "",
+    ]
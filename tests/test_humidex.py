@@ -3,6 +3,7 @@ import math
 import pytest
 
 from pythermalcomfort.models import humidex
+from pythermalcomfort.utilities import Conditions
 from tests.conftest import Urls, retrieve_reference_table, validate_result
 
 
@@ -55,3 +56,15 @@ def test_humidex_masterson() -> None:
 
     result = humidex(tdb=31, rh=55, model="masterson")
     assert math.isclose(result.humidex, 39.3, abs_tol=0.01)
+
+
+def test_humidex_conditions() -> None:
+    """Test that the Humidex accepts a Conditions object."""
+    conditions = Conditions(tdb=[21, 43], rh=[100, 20])
+    result = humidex(model="masterson", conditions=conditions)
+    assert math.isclose(result.humidex[0], 29.3, abs_tol=0.1)
+    assert math.isclose(result.humidex[1], 47.1, abs_tol=0.01)
+    assert humidex(conditions=conditions).humidex[1] == humidex(tdb=43, rh=20).humidex
+
+    with pytest.raises(TypeError):
+        humidex(tdb=25)
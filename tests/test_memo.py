@@ -0,0 +1,139 @@
+import threading
+import warnings
+
+import numpy as np
+import pytest
+
+from pythermalcomfort.memo import MemoCache, memoize
+from pythermalcomfort.models import (
+    cooling_effect,
+    heat_index_lu,
+    pet_steady,
+    phs,
+    set_tmp,
+    utci,
+)
+from pythermalcomfort.precision import precision
+from pythermalcomfort.profiling import profile
+from pythermalcomfort.solvers import diagnostics
+
+
+def _inputs() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    tdb = rng.choice([24.0, 26.0, 28.0], 40)
+    return {
+        "tdb": tdb,
+        "tr": tdb,
+        "rh": rng.choice([40.0, 60.0], 40),
+        "met": rng.choice([1.0, 1.2], 40),
+        "clo": 0.5,
+    }
+
+
+def test_memoize() -> None:
+    """Test that the repeated rows are computed once, with the same results."""
+    inputs = _inputs()
+    calls = {
+        "set_tmp": lambda: set_tmp(**inputs, v=0.1).set,
+        "cooling_effect": lambda: cooling_effect(**inputs, vr=0.5).ce,
+        "pet_steady": lambda: pet_steady(**inputs, v=0.5).pet,
+        "heat_index_lu": lambda: heat_index_lu(tdb=inputs["tdb"] + 10, rh=inputs["rh"]),
+        "utci": lambda: utci(tdb=inputs["tdb"], tr=inputs["tr"], v=1, rh=inputs["rh"]),
+        "phs": lambda: phs(
+            tdb=inputs["tdb"] + 15,
+            tr=inputs["tr"] + 15,
+            v=0.3,
+            rh=inputs["rh"],
+            met=2.5,
+            clo=0.5,
+            posture="standing",
+        ),
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = {model: call() for model, call in calls.items()}
+        for model, call in calls.items():
+            with memoize() as cache:
+                first = call()
+                second = call()
+            distinct = 12 if model in ("set_tmp", "cooling_effect", "pet_steady") else 6
+            assert (cache.misses, cache.hits, len(cache)) == (
+                distinct,
+                distinct,
+                distinct,
+            )
+            for result in (first, second):
+                assert str(result) == str(expected[model]), model
+
+    result = calls["heat_index_lu"]()
+    with memoize():
+        memoized = calls["heat_index_lu"]()
+    assert memoized.stress_category is result.stress_category is None
+    np.testing.assert_equal(memoized.hi, result.hi)
+
+
+def test_memoize_rounded_inputs() -> None:
+    """Test that the rows within the rounding of the inputs are shared."""
+    tdb = np.array([[25.04, 25.02], [30.0, 25.0]])
+    with memoize(MemoCache(decimals=1)) as cache:
+        result = utci(tdb=tdb, tr=tdb, v=1, rh=50)
+    assert (cache.misses, cache.hits) == (2, 0)
+    np.testing.assert_equal(
+        result.utci, utci(tdb=np.round(tdb, 1), tr=np.round(tdb, 1), v=1, rh=50).utci
+    )
+    assert result.utci.shape == (2, 2)
+    assert result.stress_category.shape == (2, 2)
+
+
+def test_memo_cache() -> None:
+    """Test the size limit of the cache and its use across blocks and threads."""
+    cache = MemoCache(maxsize=3)
+    with memoize(cache):
+        utci(tdb=[20, 21, 22, 23], tr=25, v=1, rh=50)
+    assert len(cache) == 3
+    # the least recently used row was dropped
+    with memoize(cache):
+        utci(tdb=[21, 20], tr=25, v=1, rh=50)
+    assert (cache.misses, cache.hits) == (5, 1)
+
+    def call() -> None:
+        with memoize(cache):
+            utci(tdb=[21, 22, 23], tr=25, v=1, rh=50)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 3
+
+    # scalar inputs, and the precision is part of the rows
+    cache.clear()
+    with memoize(cache):
+        set_tmp(tdb=25, tr=25, v=0.1, rh=50, met=1.2, clo=0.5)
+        set_tmp(tdb=25, tr=25, v=0.1, rh=50, met=1.2, clo=0.5)
+        with precision("fast"):
+            set_tmp(tdb=25, tr=25, v=0.1, rh=50, met=1.2, clo=0.5)
+    assert (cache.misses, cache.hits) == (2, 1)
+
+    with pytest.raises(ValueError):
+        MemoCache(maxsize=0)
+
+
+def test_memoize_disabled() -> None:
+    """Test the calls that are not memoized."""
+    with memoize() as cache:
+        # the report of the diagnostics refers to each element
+        with diagnostics() as report:
+            set_tmp(tdb=[25, 25], tr=25, v=0.1, rh=50, met=1.2, clo=0.5)
+        assert report.iterations("set_tmp", "set").shape == (2,)
+        # the calls of set_tmp by the cooling effect are not memoized
+        with profile() as profiled:
+            cooling_effect(tdb=[25, 25], tr=25, vr=0.5, rh=50, met=1.2, clo=0.5)
+        # the errors are raised by the models
+        with pytest.raises(ValueError):
+            utci(tdb=[25, 26], tr=[25, 26, 27], v=1, rh=50)
+    assert (cache.misses, cache.hits) == (1, 0)
+    assert "memoization" in profiled.models["cooling_effect"].stages
+    utci(tdb=25, tr=25, v=1, rh=50)
+    assert len(cache) == 1
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from pythermalcomfort.models import (
+    at,
+    discomfort_index,
+    esi,
+    heat_index_rothfusz,
+    humidex,
+    net,
+    outdoor_indices,
+    thi,
+    wci,
+    wind_chill_temperature,
+)
+
+rng = np.random.default_rng(42)
+tdb = rng.uniform(-20, 45, 1000)
+rh = rng.uniform(5, 100, 1000)
+v = rng.uniform(0.5, 10, 1000)
+sol = rng.uniform(0, 1000, 1000)
+
+
+def test_outdoor_indices_match_models() -> None:
+    """Test that the fused kernel returns the same values as the individual models."""
+    result = outdoor_indices(tdb, rh, v, sol_radiation_global=sol)
+    np.testing.assert_equal(result.at, at(tdb, rh, v).at)
+    np.testing.assert_equal(result.humidex, humidex(tdb, rh).humidex)
+    np.testing.assert_equal(result.hi, heat_index_rothfusz(tdb, rh).hi)
+    np.testing.assert_equal(result.di, discomfort_index(tdb, rh).di)
+    np.testing.assert_equal(result.thi, thi(tdb, rh).thi)
+    np.testing.assert_equal(result.wci, wci(tdb, v).wci)
+    np.testing.assert_equal(result.wct, wind_chill_temperature(tdb, v).wct)
+    np.testing.assert_equal(result.net, net(tdb, rh, v).net)
+    np.testing.assert_equal(result.esi, esi(tdb, rh, sol).esi)
+
+
+def test_outdoor_indices_options() -> None:
+    """Test the subset of indices, the solar load and the unrounded outputs."""
+    result = outdoor_indices(tdb, rh, v, q=100, indices=["at"], round_output=False)
+    np.testing.assert_allclose(result.at, at(tdb, rh, v, q=100, round_output=False).at)
+    assert result.hi is None
+
+    result = outdoor_indices(tdb, rh, limit_inputs=False)
+    np.testing.assert_equal(
+        result.hi, heat_index_rothfusz(tdb, rh, limit_inputs=False).hi
+    )
+    assert result.wci is None
+    assert result.esi is None
+
+    result = outdoor_indices(tdb=[[25, 30], [35, 40]], rh=50, v=[1, 2])
+    assert result.net.shape == (2, 2)
+    assert outdoor_indices(tdb=30, rh=50).thi == thi(30, 50).thi
+
+
+def test_outdoor_indices_errors() -> None:
+    """Test that missing inputs and unknown indices raise an error."""
+    with pytest.raises(ValueError):
+        outdoor_indices(tdb=30, rh=50, indices=["wci"])
+    with pytest.raises(ValueError):
+        outdoor_indices(tdb=30, rh=50, indices=["esi"])
+    with pytest.raises(ValueError):
+        outdoor_indices(tdb=30, rh=50, indices=["utci"])
+    with pytest.raises(ValueError):
+        outdoor_indices(tdb=30, rh=101)
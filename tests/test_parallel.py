@@ -0,0 +1,139 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numba
+import numpy as np
+import pytest
+
+from pythermalcomfort.models import (
+    heat_index_lu,
+    pet_steady,
+    pmv_ppd_ashrae,
+    pmv_ppd_iso,
+    set_tmp,
+    sports_heat_stress_risk,
+    two_nodes_gagge_ji,
+    two_nodes_gagge_sleep,
+    utci,
+)
+from pythermalcomfort.models.sports_heat_stress_risk import Sports
+from pythermalcomfort.parallel import (
+    SharedArrays,
+    attach,
+    parallel,
+    run,
+    run_slice,
+    threads,
+)
+
+
+def test_run_matches_model() -> None:
+    """Test that the results computed in parallel match the ones of the model."""
+    tdb = np.linspace(20, 45, 40).reshape(4, 10)
+    position = ["standing", "sitting"] * 5
+    with parallel(n_jobs=2):
+        result = run(heat_index_lu, tdb=tdb, rh=[[50], [60], [70], [80]])
+        np.testing.assert_equal(
+            result.hi, heat_index_lu(tdb=tdb, rh=[[50], [60], [70], [80]]).hi
+        )
+        assert result.hi.shape == (4, 10)
+
+        kwargs = {"tdb": tdb[0], "tr": 30, "v": 0.5, "rh": 50, "met": 1.2, "clo": 0.5}
+        np.testing.assert_equal(
+            run(pet_steady, position=position, chunk_size=3, **kwargs).pet,
+            pet_steady(position=position, **kwargs).pet,
+        )
+
+        kwargs = {"tdb": tdb[0], "tr": 30, "rh": 50, "vr": 0.5, "sport": Sports.RUNNING}
+        result = run(sports_heat_stress_risk, **kwargs)
+        expected = sports_heat_stress_risk(**kwargs)
+        np.testing.assert_equal(result.t_medium, expected.t_medium)
+        np.testing.assert_equal(result.recommendation, expected.recommendation)
+
+        kwargs = {"tr": 30, "v": 0.2, "met": 1.2, "clo": 0.5, "vapor_pressure": 2}
+        result = run(
+            two_nodes_gagge_ji, tdb=tdb[0, :6], length_time_simulation=5, **kwargs
+        )
+        expected = two_nodes_gagge_ji(
+            tdb=tdb[0, :6], length_time_simulation=5, **kwargs
+        )
+        assert isinstance(result.t_core, list)
+        np.testing.assert_equal(result.t_core, expected.t_core)
+
+
+def test_run_serial_and_errors() -> None:
+    """Test the calls that run in the current process and the invalid ones."""
+    assert run(heat_index_lu, tdb=[30, 35], rh=50).hi.tolist() == [31.4, 40.6]
+    assert run(heat_index_lu, n_jobs=2, tdb=30, rh=50).hi == 31.4
+    with pytest.raises(ValueError):
+        run(heat_index_lu, n_jobs=0, tdb=30, rh=50)
+    with pytest.raises(ValueError):
+        run(
+            two_nodes_gagge_sleep,
+            n_jobs=2,
+            tdb=[25, 25],
+            tr=25,
+            v=0.1,
+            rh=50,
+            clo=0.5,
+            thickness_quilt=1,
+        )
+
+
+def test_threads() -> None:
+    """Test that the multi-threaded kernels give the same results."""
+    rng = np.random.default_rng(0)
+    kwargs = {
+        "tdb": rng.uniform(15, 35, 500),
+        "tr": rng.uniform(15, 35, 500),
+        "rh": rng.uniform(20, 80, 500),
+        "met": 1.2,
+        "clo": 0.5,
+    }
+    expected = [
+        pmv_ppd_iso(vr=0.1, **kwargs).pmv,
+        pmv_ppd_ashrae(vr=0.1, **kwargs).pmv,
+        set_tmp(v=0.1, **kwargs).set,
+        utci(tdb=kwargs["tdb"], tr=kwargs["tr"], v=1, rh=kwargs["rh"]).utci,
+    ]
+    with threads(n_threads=numba.config.NUMBA_NUM_THREADS, threshold=100):
+        results = [
+            pmv_ppd_iso(vr=0.1, **kwargs).pmv,
+            pmv_ppd_ashrae(vr=0.1, **kwargs).pmv,
+            set_tmp(v=0.1, **kwargs).set,
+            utci(tdb=kwargs["tdb"], tr=kwargs["tr"], v=1, rh=kwargs["rh"]).utci,
+        ]
+    for result, values in zip(results, expected, strict=True):
+        np.testing.assert_equal(result, values)
+
+    with pytest.raises(ValueError):
+        with threads(n_threads=numba.config.NUMBA_NUM_THREADS + 1):
+            pass
+    with pytest.raises(ValueError):
+        with threads(threshold=-1):
+            pass
+
+
+def test_shared_arrays() -> None:
+    """Test that workers compute slices of shared arrays in place."""
+    tdb = np.linspace(20, 45, 12).reshape(3, 4)
+    rh = np.array([40, 50, 60, 70])
+    context = multiprocessing.get_context("spawn")
+    with SharedArrays({"tdb": tdb, "rh": rh}, {"hi": float}) as shared:
+        assert shared.handle.shape == (3, 4)
+        np.testing.assert_equal(shared["rh"][2], rh)
+        with ProcessPoolExecutor(2, mp_context=context) as executor:
+            futures = [
+                executor.submit(run_slice, heat_index_lu, shared.handle, i, i + 5)
+                for i in range(0, 12, 5)
+            ]
+            assert [future.result() for future in futures] == [{}, {}, {}]
+        np.testing.assert_equal(shared["hi"], heat_index_lu(tdb=tdb, rh=rh).hi)
+        with attach(shared.handle) as arrays:
+            assert sorted(arrays) == ["hi", "rh", "tdb"]
+        name = shared.handle.outputs["hi"].name
+
+    # the segments are removed at the end of the block
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
@@ -2,7 +2,11 @@ import math
 
 import numpy as np
 
-from pythermalcomfort.models._pmv_ppd_optimized import _pmv_ppd_optimized
+from pythermalcomfort.models._pmv_ppd_optimized import (
+    _pmv_ashrae_optimized,
+    _pmv_iso_optimized,
+    _pmv_ppd_optimized,
+)
 
 
 class TestPmvPpdOptimized:
@@ -89,3 +93,36 @@ class TestPmvPpdOptimized:
         wme = 0
 
         assert math.isnan(_pmv_ppd_optimized(tdb, tr, vr, rh, met, clo, wme))
+
+    #  Inputs outside the applicability limits short-circuit to NaN.
+    def test_pmv_iso_optimized_limits(self) -> None:
+        """Test that the ISO kernel returns NaN outside the ISO 7730 limits."""
+        np.testing.assert_equal(
+            np.around(
+                _pmv_iso_optimized(
+                    [25, 35], 25, 0.3, 50, 1.5, 0.7, 0, True, False, False, 0.00015
+                ),
+                2,
+            ),
+            [0.55, np.nan],
+        )
+        assert math.isclose(
+            _pmv_iso_optimized(
+                35, 25, 0.3, 50, 1.5, 0.7, 0, False, False, False, 0.00015
+            ),
+            _pmv_ppd_optimized(35, 25, 0.3, 50, 1.5, 0.7, 0),
+        )
+
+    def test_pmv_ashrae_optimized_cooling_effect(self) -> None:
+        """Test that the ASHRAE kernel applies the cooling effect to the inputs."""
+        assert math.isclose(
+            _pmv_ashrae_optimized(
+                27, 27, 0.8, 50, 1.2, 0.5, 0, 2.0, True, True, False, 0.00015
+            ),
+            _pmv_ppd_optimized(25, 25, 0.1, 50, 1.2, 0.5, 0),
+        )
+        assert math.isnan(
+            _pmv_ashrae_optimized(
+                27, 27, 0.9, 50, 1.2, 0.5, 0, 0.0, True, False, False, 0.00015
+            )
+        )
@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+import warnings
+
+import numpy as np
+import pytest
+
+from pythermalcomfort.models import (
+    cooling_effect,
+    heat_index_lu,
+    pmv_athb,
+    pmv_ppd_ashrae,
+    pmv_ppd_iso,
+    set_tmp,
+    two_nodes_gagge,
+)
+from pythermalcomfort.precision import PRESETS, current, precision, tolerances
+from pythermalcomfort.solvers import diagnostics
+
+
+def _results(preset: str) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    indoor = {
+        "tdb": rng.uniform(18, 30, 20),
+        "tr": rng.uniform(18, 35, 20),
+        "rh": rng.uniform(10, 90, 20),
+        "met": rng.uniform(1, 2, 20),
+        "clo": rng.uniform(0.3, 1, 20),
+    }
+    vr = rng.uniform(0.05, 0.8, 20)
+    with precision(preset), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return {
+            "pmv_ppd_iso": pmv_ppd_iso(**indoor, vr=vr, round_output=False).pmv,
+            "pmv_ppd_ashrae": pmv_ppd_ashrae(**indoor, vr=vr, round_output=False).pmv,
+            "pmv_athb": pmv_athb(
+                tdb=indoor["tdb"],
+                tr=indoor["tr"],
+                vr=vr,
+                rh=indoor["rh"],
+                met=indoor["met"],
+                t_running_mean=20,
+            ).athb_pmv,
+            "set_tmp": set_tmp(**indoor, v=vr, round_output=False).set,
+            "two_nodes_gagge": two_nodes_gagge(**indoor, v=vr, round_output=False).set,
+            "heat_index_lu": heat_index_lu(
+                tdb=indoor["tdb"] + 10, rh=indoor["rh"], round_output=False
+            ).hi,
+            "cooling_effect": cooling_effect(**indoor, vr=vr).ce,
+        }
+
+
+def test_precision_error_bounds() -> None:
+    """Test the documented errors of the presets against the exact one."""
+    exact = _results("exact")
+    bounds = {
+        "standard": {
+            "pmv_ppd_iso": 0.01,
+            "pmv_ppd_ashrae": 0.01,
+            "pmv_athb": 0.01,
+            "set_tmp": 1e-4,
+            "two_nodes_gagge": 1e-4,
+            "heat_index_lu": 1e-6,
+            "cooling_effect": 0.01,
+        },
+        "fast": {
+            "pmv_ppd_iso": 0.02,
+            "pmv_ppd_ashrae": 0.02,
+            "pmv_athb": 0.02,
+            "set_tmp": 1e-3,
+            "two_nodes_gagge": 1e-3,
+            "heat_index_lu": 0.02,
+            "cooling_effect": 0.02,
+        },
+    }
+    for preset, preset_bounds in bounds.items():
+        results = _results(preset)
+        for model, bound in preset_bounds.items():
+            np.testing.assert_allclose(
+                results[model],
+                exact[model],
+                rtol=0,
+                atol=bound + 1e-9,
+                err_msg=f"{model} with the {preset} precision",
+            )
+
+
+def test_precision_iterations() -> None:
+    """Test that the looser tolerances stop the solvers earlier."""
+    iterations = {}
+    for preset in PRESETS:
+        with precision(preset), diagnostics() as report:
+            pmv_ppd_iso(tdb=25, tr=25, vr=0.1, rh=50, met=1.2, clo=0.5)
+            heat_index_lu(tdb=35, rh=70)
+        iterations[preset] = (
+            report.iterations("pmv_ppd_iso")[0],
+            report.iterations("heat_index_lu")[0],
+        )
+    for model in range(2):
+        assert (
+            iterations["fast"][model]
+            < iterations["standard"][model]
+            < iterations["exact"][model]
+        )
+
+
+def test_precision_block() -> None:
+    """Test that the preset is restored after the block and checked."""
+    assert current() == "standard"
+    with precision("fast") as fast:
+        assert current() == "fast"
+        assert tolerances() == fast == PRESETS["fast"]
+        with precision("exact"):
+            assert tolerances().pmv < PRESETS["standard"].pmv
+        assert current() == "fast"
+    assert current() == "standard"
+    with pytest.raises(ValueError, match="Unknown precision"):
+        with precision("approximate"):
+            pass
+
+
+def test_precision_environment_variable() -> None:
+    """Test that the preset of the process is read from the environment."""
+    code = "from pythermalcomfort.precision import current\nprint(current())\n"
+    env = {**os.environ, "PYTHERMALCOMFORT_PRECISION": "fast"}
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    assert output.strip() == "fast"
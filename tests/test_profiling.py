@@ -0,0 +1,104 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from pythermalcomfort.models import (
+    JOS3,
+    pmv_ppd_ashrae,
+    pmv_ppd_iso,
+    utci,
+    vertical_tmp_grad_ppd,
+)
+from pythermalcomfort.profiling import STAGES, profile
+
+
+def test_profile() -> None:
+    """Test that the time of each call is split in the stages of the model."""
+    with profile() as report:
+        pmv_ppd_iso(tdb=[22, 25], tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+        pmv_ppd_iso(tdb=25, tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+    pmv_ppd_iso(tdb=25, tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+
+    model = report.models["pmv_ppd_iso"]
+    assert model.calls == 2
+    assert list(model.stages) == [
+        "validation",
+        "array conversion",
+        "kernel",
+        "rounding",
+        "category mapping",
+        "other",
+    ]
+    assert all(seconds >= 0 for seconds in model.stages.values())
+    assert sum(model.stages.values()) == pytest.approx(model.total_s)
+    assert model.nested_s == 0
+
+    summary = report.to_dict()
+    assert list(summary["pmv_ppd_iso"]["stages"]) == list(model.stages)
+    assert json.loads(json.dumps(summary)) == summary
+    assert "category mapping" in str(report)
+
+    report.reset()
+    assert report.models == {}
+
+
+def test_profile_nested_models() -> None:
+    """Test that the time of the models called by a model is reported apart."""
+    with profile() as report:
+        vertical_tmp_grad_ppd(
+            tdb=25, tr=25, vr=0.1, rh=50, met=1.2, clo=0.5, vertical_tmp_grad=7
+        )
+        pmv_ppd_ashrae(tdb=25, tr=25, vr=np.array([0.05, 0.5]), rh=50, met=1.2, clo=0.5)
+        model = JOS3()
+        model.simulate(times=2)
+
+    outer = report.models["vertical_tmp_grad_ppd"]
+    inner = report.models["pmv_ppd_ashrae"]
+    assert inner.calls == 2
+    assert outer.nested_s == pytest.approx(
+        # the first call of pmv_ppd_ashrae is nested in vertical_tmp_grad_ppd
+        outer.total_s - sum(outer.stages.values())
+    )
+    assert 0 < outer.nested_s < inner.total_s
+    assert "compliance masking" in outer.stages
+    assert report.models["cooling_effect"].calls == 1
+    assert report.models["JOS3.simulate"].calls == 1
+    assert set(report.models["JOS3.simulate"].stages) <= set(STAGES)
+
+
+def test_profile_disabled() -> None:
+    """Test that nothing is recorded once the block is closed."""
+    with profile() as report:
+        pass
+    utci(tdb=25, tr=25, v=1, rh=50)
+    assert report.models == {}
+    # the wrapper keeps the name and the documentation of the model
+    assert utci.__name__ == "utci"
+    assert "Universal Thermal Climate Index" in utci.__doc__
+
+
+def test_profile_environment_variable(tmp_path) -> None:
+    """Test that the report of the process is written when it exits."""
+    path = tmp_path / "profile.json"
+    code = (
+        "from pythermalcomfort.models import utci\n"
+        "from pythermalcomfort.profiling import global_report\n"
+        "utci(tdb=[25, 30], tr=25, v=1, rh=50)\n"
+        "print(global_report().models['utci'].calls)\n"
+    )
+    env = {**os.environ, "PYTHERMALCOMFORT_PROFILE": str(path)}
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    assert output.strip() == "1"
+    report = json.loads(path.read_text())
+    assert report["utci"]["calls"] == 1
+    assert "kernel" in report["utci"]["stages"]
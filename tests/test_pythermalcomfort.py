@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import pythermalcomfort.models as models
+
+
+def test_models_lazy_import() -> None:
+    """Test that importing a model does not import the other models."""
+    code = (
+        "import sys\n"
+        "from pythermalcomfort.models import utci\n"
+        "assert callable(utci)\n"
+        "loaded = [m for m in sys.modules if m.startswith('pythermalcomfort.models.')]\n"
+        "print(sorted(loaded))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert "pythermalcomfort.models.utci" in output
+    assert "pythermalcomfort.models.jos3" not in output
+    assert "pythermalcomfort.models.pet_steady" not in output
+
+
+def test_models_exports() -> None:
+    """Test that the submodules do not shadow the models with the same name."""
+    from pythermalcomfort.models.pmv_ppd_iso import pmv_ppd_iso
+
+    assert models.pmv_ppd_iso is pmv_ppd_iso
+    for name in models.__all__:
+        assert not isinstance(getattr(models, name), type(models)), name
+    assert set(models.__all__) <= set(dir(models))
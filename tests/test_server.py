@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+
+from pythermalcomfort.models import pmv_ppd_ashrae
+from pythermalcomfort.server import ComfortServer
+
+
+async def _request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = b"" if body is None else json.dumps(body).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode()
+        + data
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+def test_server() -> None:
+    """Test that concurrent requests are computed in batches and measured."""
+    kwargs = {"tr": 25, "vr": 0.1, "rh": 50, "met": 1.2, "clo": 0.5}
+    server = ComfortServer(["pmv_ppd_ashrae", "heat_index_lu"], max_delay=0.01)
+
+    async def main():
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            results = await asyncio.gather(
+                *(
+                    _request(
+                        port, "POST", "/models/pmv_ppd_ashrae", {"tdb": t, **kwargs}
+                    )
+                    for t in (22, 24, 26, 28)
+                )
+            )
+            errors = [
+                await _request(port, "POST", "/models/utci", {"tdb": 25}),
+                await _request(port, "POST", "/models/pmv_ppd_ashrae", {"tdb": 25}),
+                await _request(port, "POST", "/models/heat_index_lu", [25]),
+                await _request(port, "GET", "/models/heat_index_lu"),
+                await _request(port, "GET", "/unknown"),
+            ]
+            models = await _request(port, "GET", "/models")
+            metrics = await _request(port, "GET", "/metrics")
+        finally:
+            listener.close()
+            await listener.wait_closed()
+        return results, errors, models, metrics
+
+    results, errors, models, metrics = asyncio.run(main())
+    for (status, content), tdb in zip(results, (22, 24, 26, 28), strict=True):
+        expected = pmv_ppd_ashrae(tdb=tdb, **kwargs)
+        assert status == 200
+        assert content["pmv"] == expected.pmv
+        assert content["tsv"] == expected.tsv
+    assert [status for status, _ in errors] == [404, 400, 400, 405, 404]
+    assert "error" in errors[1][1]
+    assert models == (200, ["pmv_ppd_ashrae", "heat_index_lu"])
+
+    status, metrics = metrics
+    assert status == 200
+    pmv = metrics["models"]["pmv_ppd_ashrae"]
+    assert pmv["requests"] == 5
+    assert pmv["errors"] == 1
+    assert pmv["batches"] == 2
+    assert pmv["mean_batch_size"] == 2.5
+    assert pmv["latency_ms"]["p50"] > 0
+    assert metrics["models"]["heat_index_lu"]["latency_ms"]["p99"] is None
+
+    with pytest.raises(ValueError):
+        ComfortServer(["random"])
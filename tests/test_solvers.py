@@ -0,0 +1,217 @@
+import json
+import warnings
+from contextlib import nullcontext
+
+import numpy as np
+import pytest
+
+from pythermalcomfort.models import (
+    JOS3,
+    cooling_effect,
+    heat_index_lu,
+    pet_steady,
+    phs,
+    pmv_athb,
+    pmv_ppd_ashrae,
+    pmv_ppd_iso,
+    set_tmp,
+    two_nodes_gagge,
+)
+from pythermalcomfort.solvers import diagnostics, nan_on_failure, warm_start
+
+
+def test_diagnostics() -> None:
+    """Test that the iterations of each element are recorded in the block."""
+    with diagnostics() as report:
+        pmv_ppd_iso(tdb=[[22, 25], [24, 80]], tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+        set_tmp(tdb=[25, 60], tr=25, v=0.1, rh=50, met=1.2, clo=0.5)
+    pmv_ppd_iso(tdb=25, tr=25, vr=0.1, rh=50, met=1.4, clo=0.5)
+
+    pmv, *gagge = report.calls
+    assert (pmv.model, pmv.solver) == ("pmv_ppd_iso", "t_cl")
+    assert pmv.iterations.shape == (2, 2)
+    assert np.all(pmv.iterations[:, 0] > 0)
+    # outside the applicability limits, not solved
+    assert pmv.iterations[1, 1] == 0
+    assert pmv.converged.all()
+    assert [(call.model, call.solver) for call in gagge] == [
+        ("set_tmp", "t_cl"),
+        ("set_tmp", "set"),
+        ("set_tmp", "et"),
+    ]
+    # the clothing temperature is iterated at each of the 59 minutes
+    assert gagge[0].iterations[0] >= 59
+    assert gagge[0].iterations[1] == 0
+
+    assert report.iterations("pmv_ppd_iso").size == 4
+    counts, edges = report.histogram("set_tmp", "set", bins=[0, 1, 10])
+    assert counts.tolist() == [1, 1]
+    summary = report.summary()
+    assert summary["pmv_ppd_iso"]["t_cl"]["elements"] == 4
+    assert summary["set_tmp"]["t_cl"]["not_converged"] == 0
+    assert json.loads(json.dumps(summary)) == summary
+    assert "not converged" in str(report)
+
+    report.reset()
+    assert report.calls == []
+
+
+def test_diagnostics_not_converged() -> None:
+    """Test that the elements that do not converge are recorded before raising."""
+    with diagnostics() as report, pytest.raises(StopIteration):
+        pmv_ppd_iso(
+            tdb=25, tr=[25, 600], vr=0.1, rh=50, met=1.2, clo=0.5, limit_inputs=False
+        )
+    assert report.calls[0].converged.tolist() == [True, False]
+    assert report.calls[0].iterations[1] > 150
+
+
+def test_diagnostics_root_solvers() -> None:
+    """Test the iterations of the root solvers of the models."""
+    with diagnostics() as report, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        cooling_effect(tdb=25, tr=25, vr=[0.05, 0.3], rh=50, met=1.2, clo=0.5)
+        heat_index_lu(tdb=[25, 40], rh=50)
+        pet_steady(tdb=30, tr=30, v=0.2, rh=50, met=1.37, clo=0.5)
+        phs(
+            tdb=[40, 45],
+            tr=40,
+            v=0.3,
+            rh=35,
+            met=2.5,
+            clo=0.5,
+            posture="standing",
+            duration=60,
+        )
+
+    # the calls of set_tmp by the cooling effect are not recorded
+    assert [(call.model, call.solver) for call in report.calls] == [
+        ("cooling_effect", "brentq"),
+        ("heat_index_lu", "bisection"),
+        ("pet_steady", "fsolve"),
+        ("phs", "t_cl"),
+        ("phs", "t_cr"),
+    ]
+    ce = report.calls[0]
+    # no air movement, nothing to solve
+    assert ce.iterations[0] == 0
+    assert ce.iterations[1] > 0
+    assert np.all(report.converged())
+    assert np.all(report.iterations("heat_index_lu") > 0)
+    assert report.iterations("pet_steady").shape == (1,)
+    # at least one iteration at each minute
+    assert np.all(report.iterations("phs") >= 60)
+
+
+def test_nan_on_failure() -> None:
+    """Test that the elements that do not converge are nan in the block."""
+    with nan_on_failure() as failures, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        pmv = pmv_ppd_iso(
+            tdb=25, tr=[25, 600], vr=0.1, rh=50, met=1.2, clo=0.5, limit_inputs=False
+        )
+        # outside the applicability limits, nan but not a failure
+        ashrae = pmv_ppd_ashrae(
+            tdb=[25, 25, 50], tr=[25, 600, 25], vr=0.1, rh=50, met=1.2, clo=0.5
+        )
+        set_result = set_tmp(
+            tdb=25, tr=[25, 2000], v=0.1, rh=50, met=1.2, clo=0.5, limit_inputs=False
+        )
+        gagge = two_nodes_gagge(tdb=25, tr=[25, 2000], v=0.1, rh=50, met=1.2, clo=0.5)
+        heat_index_lu(tdb=[25, 40], rh=50)
+
+    assert pmv.pmv[0] == pytest.approx(0.08)
+    assert np.isnan(pmv.pmv[1])
+    assert failures.mask("pmv_ppd_iso").tolist() == [False, True]
+    assert np.isnan(ashrae.pmv).tolist() == [False, True, True]
+    assert failures.mask("pmv_ppd_ashrae").tolist() == [False, False, False]
+    assert np.isnan(set_result.set).tolist() == [False, True]
+    assert failures.mask("set_tmp").tolist() == [False, True]
+    assert np.isnan(gagge.e_skin).tolist() == [False, True]
+    assert failures.mask("two_nodes_gagge").tolist() == [False, True]
+    assert failures.mask().tolist() == [False, False]
+    assert failures.count() == 3
+    assert "1 of 2 elements did not converge" in str(failures)
+
+    # the models raise outside the block
+    with pytest.raises(StopIteration):
+        pmv_ppd_iso(tdb=25, tr=600, vr=0.1, rh=50, met=1.2, clo=0.5, limit_inputs=False)
+    assert len(failures.calls) == 5
+    with pytest.raises(ValueError):
+        failures.mask("utci")
+
+
+def test_nan_on_failure_jos3() -> None:
+    """Test that JOS3 does not retry the search of the neutral temperature."""
+    model = JOS3()
+    with nan_on_failure() as failures:
+        assert np.isnan(
+            model._calculate_operative_temp_when_pmv_is_zero(
+                v=0.1, rh=50, met=1.2, clo=8
+            )
+        )
+    # the calls of pmv_ppd_iso in the search are not recorded
+    assert [(call.model, call.solver) for call in failures.calls] == [("JOS3", "to")]
+    assert failures.mask().tolist() is True
+
+
+def test_warm_start() -> None:
+    """Test that the solvers start from the previous element of a time series."""
+    tdb = 22 + 3 * np.sin(np.linspace(0, 2 * np.pi, 200))
+    results = {}
+    for warm in (False, True):
+        block = warm_start() if warm else nullcontext()
+        with block, warnings.catch_warnings(), diagnostics() as report:
+            warnings.simplefilter("ignore")
+            results[warm] = {
+                "pmv_ppd_iso": pmv_ppd_iso(
+                    tdb=tdb, tr=tdb, vr=0.1, rh=50, met=1.2, clo=0.5
+                ).pmv,
+                "pmv_ppd_ashrae": pmv_ppd_ashrae(
+                    tdb=tdb[:20] + 4, tr=tdb[:20] + 4, vr=0.6, rh=50, met=1.2, clo=0.5
+                ).pmv,
+                "pmv_athb": pmv_athb(
+                    tdb=tdb, tr=tdb, vr=0.1, rh=50, met=1.2, t_running_mean=20
+                ).athb_pmv,
+                "pet_steady": pet_steady(
+                    tdb=tdb[:20] + 8, tr=tdb[:20] + 10, v=0.5, rh=50, met=1.4, clo=0.5
+                ).pet,
+            }
+        results[warm]["iterations"] = {
+            model: report.iterations(model).mean()
+            for model in ("pmv_ppd_iso", "pmv_athb", "pet_steady", "cooling_effect")
+        }
+
+    cold, warm = results[False], results[True]
+    for model in ("pmv_ppd_iso", "pmv_ppd_ashrae", "pmv_athb", "pet_steady"):
+        # the same results within the tolerances of the solvers
+        np.testing.assert_allclose(warm[model], cold[model], atol=0.011)
+    iterations = warm["iterations"]
+    assert iterations["pmv_ppd_iso"] < cold["iterations"]["pmv_ppd_iso"] / 4
+    assert iterations["pmv_athb"] < cold["iterations"]["pmv_athb"] / 4
+    assert iterations["pet_steady"] < cold["iterations"]["pet_steady"]
+    assert iterations["cooling_effect"] < cold["iterations"]["cooling_effect"]
+
+
+def test_warm_start_not_converged() -> None:
+    """Test that the failures of the warm-start mode are handled as usual."""
+    inputs = {
+        "tdb": 25,
+        "tr": [25, 600, 25],
+        "vr": 0.1,
+        "rh": 50,
+        "met": 1.2,
+        "clo": 0.5,
+        "limit_inputs": False,
+    }
+    with warm_start(), diagnostics() as report, pytest.raises(StopIteration):
+        pmv_ppd_iso(**inputs)
+    assert report.calls[0].converged.tolist() == [True, False, True]
+    with warm_start(), nan_on_failure() as failures, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        pmv = pmv_ppd_iso(**inputs).pmv
+    assert np.isnan(pmv).tolist() == [False, True, False]
+    assert failures.mask().tolist() == [False, True, False]
+    # scalar inputs return scalars
+    with warm_start():
+        assert np.ndim(pmv_ppd_iso(**{**inputs, "tr": 25}).pmv) == 0
@@ -1,7 +1,7 @@
 import numpy as np
 
 from pythermalcomfort.models import utci
-from pythermalcomfort.models.utci import _utci_optimized
+from pythermalcomfort.models.utci import _utci_limited_optimized, _utci_optimized
 from tests.conftest import Urls, retrieve_reference_table, validate_result
 
 
@@ -28,3 +28,34 @@ def test_utci_optimized() -> None:
         np.around(_utci_optimized([25, 27], 1, 1, 1.5), 2),
         [24.73, 26.57],
     )
+
+
+def test_utci_limited_optimized() -> None:
+    """Test that the kernel with the applicability limits short-circuits to nan."""
+    np.testing.assert_equal(
+        np.around(
+            _utci_limited_optimized(
+                [25, 27, 60, 25], [25, 27, 60, 25], 1, 50, True, False
+            ),
+            1,
+        ),
+        [24.6, 26.9, np.nan, 24.6],
+    )
+    np.testing.assert_equal(
+        np.isnan(
+            _utci_limited_optimized(
+                [25, 25, 25], [25, 96, 25], [1, 1, 0.4], 50, True, False
+            )
+        ),
+        [False, True, True],
+    )
+    assert not np.isnan(_utci_limited_optimized(60, 60, 1, 50, False, False))
+
+
+def test_utci_ip_units() -> None:
+    """Test that the IP conversion applied in the kernel matches the SI results."""
+    result_si = utci(tdb=[25, 30], tr=[25, 35], v=1, rh=50, round_output=False)
+    result_ip = utci(
+        tdb=[77, 86], tr=[77, 95], v=3.281, rh=50, units="IP", round_output=False
+    )
+    np.testing.assert_allclose(result_ip.utci, result_si.utci * 9 / 5 + 32)
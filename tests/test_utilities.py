@@ -1,7 +1,15 @@
 import numpy as np
 import pytest
 
+from pythermalcomfort.models import (
+    discomfort_index,
+    heat_index_rothfusz,
+    net,
+    thi,
+    utci,
+)
 from pythermalcomfort.utilities import (
+    Conditions,
     Units,
     body_surface_area,
     clo_area_factor,
@@ -12,6 +20,7 @@ from pythermalcomfort.utilities import (
     clo_intrinsic_insulation_ensemble,
     clo_total_insulation,
     f_svv,
+    psy_ta_rh,
     running_mean_outdoor_temperature,
     transpose_sharp_altitude,
     units_converter,
@@ -244,6 +253,34 @@ def test_running_mean_outdoor_temperature() -> None:
     ) == 77
 
 
+def test_conditions() -> None:
+    """Test that the conditions are converted to SI units once."""
+    conditions = Conditions(tdb=[77, 68], rh=50, tr=77, v=3.281, units="ip")
+    np.testing.assert_allclose(conditions.tdb, [25.0, 20.0])
+    np.testing.assert_allclose(conditions.tr, 25.0)
+    np.testing.assert_allclose(conditions.v, 1.0)
+    np.testing.assert_allclose(conditions.rh, 50.0)
+
+    conditions = Conditions(tdb=25, rh=50, tr=25, v=0.1)
+    assert conditions.tdb == 25.0
+    assert conditions.v.dtype == np.float64
+    assert Conditions(tdb=25, rh=50).tr is None
+
+    with pytest.raises(ValueError):
+        Conditions(tdb=25, rh=50, units="random")
+
+
+def test_conditions_psychrometrics() -> None:
+    """Test that the psychrometric values are cached and match psy_ta_rh."""
+    conditions = Conditions(tdb=[20, 30], rh=[40, 60], p_atm=100000)
+    expected = psy_ta_rh(tdb=[20, 30], rh=[40, 60], p_atm=100000)
+    result = conditions.psychrometrics
+    for name in ("p_sat", "p_vap", "hr", "wet_bulb_tmp", "dew_point_tmp", "h"):
+        np.testing.assert_allclose(getattr(result, name), getattr(expected, name))
+    assert conditions.p_sat is conditions.p_sat
+    assert conditions.psychrometrics.p_vap is result.p_vap
+
+
 def test_ip_units_converter() -> None:
     """Test the units converter for IP and SI units."""
     assert (units_converter(tdb=77, tr=77, v=3.2, from_units=Units.IP.value)) == [
@@ -401,3 +438,26 @@ def test_validate_type() -> None:
     with pytest.raises(TypeError) as exc_info:
         validate_type(np.str_("hello"), "np_str", allowed)
     assert "np_str must be one of the following types:" in str(exc_info.value)
+
+
+def test_conditions_models() -> None:
+    """Test that the models take their inputs from a Conditions object."""
+    conditions = Conditions(tdb=[30, 35], rh=[50, 60], tr=[30, 40], v=1)
+    tdb, rh = [30, 35], [50, 60]
+    assert np.array_equal(
+        utci(conditions=conditions).utci, utci(tdb, [30, 40], 1, rh).utci
+    )
+    assert np.array_equal(
+        heat_index_rothfusz(conditions=conditions).hi, heat_index_rothfusz(tdb, rh).hi
+    )
+    assert np.array_equal(
+        discomfort_index(conditions=conditions).di, discomfort_index(tdb, rh).di
+    )
+    assert np.array_equal(thi(conditions=conditions).thi, thi(tdb, rh).thi)
+    assert np.array_equal(net(conditions=conditions).net, net(tdb, rh, 1).net)
+    np.testing.assert_equal(psy_ta_rh(tdb, rh).wet_bulb_tmp, conditions.wet_bulb_tmp)
+
+    with pytest.raises(TypeError, match="tr"):
+        utci(conditions=Conditions(tdb=30, rh=50, v=1))
+    with pytest.raises(ValueError):
+        utci(units="IP", conditions=conditions)
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pythermalcomfort.warmup import set_cache_dir
+
+
+def _warmup(cache_dir) -> str:
+    env = {**os.environ, "PYTHERMALCOMFORT_CACHE_DIR": str(cache_dir)}
+    return subprocess.run(
+        [sys.executable, "-m", "pythermalcomfort", "warmup"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+
+
+def test_warmup(tmp_path) -> None:
+    """Test that the kernels are compiled into the cache once, then loaded."""
+    report = _warmup(tmp_path).splitlines()
+    assert "compiled  pythermalcomfort.models.phs._phs_optimized_series" in report
+    assert "cached" not in {line.split()[0] for line in report[:-1]}
+    assert any(path.suffix == ".nbi" for path in tmp_path.rglob("*"))
+
+    report = _warmup(tmp_path).splitlines()
+    assert {line.split()[0] for line in report[:-1]} == {"cached"}
+    assert report[-1].startswith(f"{len(report) - 1} kernels loaded from the cache, 0")
+
+
+def test_set_cache_dir(tmp_path) -> None:
+    """Test that the cache directory cannot change once the models are loaded."""
+    import pythermalcomfort.models.utci  # noqa: F401
+
+    with pytest.raises(RuntimeError):
+        set_cache_dir(tmp_path)